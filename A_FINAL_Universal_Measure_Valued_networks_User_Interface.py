@@ -227,6 +227,39 @@ N_Monte_Carlo_Samples = 10**2
 N_Monte_Carlo_Samples_Test = 10**2 # How many MC-samples to draw from test-set?
 
 
+# Store Monte-Carlo samples in memory-mapped ".npy" files (in "./inputs/data/Monte_Carlo_Stores/") instead of RAM; useful when problem_dim is large.
+
+# In[ ]:
+
+
+Use_Monte_Carlo_Store = False
+
+
+# Re-use previously simulated datasets (in "./inputs/data/Dataset_Cache/") whenever the configuration, seeds, and simulators are unchanged.
+
+# In[ ]:
+
+
+Use_Dataset_Cache = True
+
+
+# Bootstrapped confidence intervals: "percentile" or (bias-corrected and accelerated) "BCa".
+
+# In[ ]:
+
+
+Bootstrap_CI_method = "percentile"
+
+
+# Transport error in multi-dimensional settings: "Sliced" (sliced Wasserstein) or "Sinkhorn" (entropically regularized; with the regularization below).
+
+# In[ ]:
+
+
+Evaluation_OT_method = "Sliced"
+Evaluation_Sinkhorn_regularization = 0.01
+
+
 # Initial radis of $\delta$-bounded random partition of $\mathcal{X}$!
 
 # In[19]:
@@ -235,6 +268,15 @@ N_Monte_Carlo_Samples_Test = 10**2 # How many MC-samples to draw from test-set?
 # Hyper-parameters of Cover
 delta = 0.1
 Proportion_per_cluster = .75
+# Project each barycenter onto a distinct training point?
+Unique_Barycenters = False
+# Quantizer: "KMeans" or (streaming) "MiniBatchKMeans" for large training sets
+Quantizer_mode = "KMeans"
+## Number of clusters (None: Proportion_per_cluster of the training set)
+Quantizer_N_clusters = None
+## Streaming parameters (MiniBatchKMeans only)
+Quantizer_batch_size = 1024
+Quantizer_N_passes = 3
 
 
 # ---
@@ -272,10 +314,7 @@ Hurst_Exponent = Hurst_Exponent
 #-------------------------------------------------------#
 print("Generating/Prasing Data and Training MC-Oracle")
 #-------------------------------------------------------#
-if (f_unknown_mode != 'Rough_SDE') and (f_unknown_mode != 'Rough_SDE_Vanilla'):
-    # %run Data_Simulator_and_Parser.ipynb
-    exec(open('Data_Simulator_and_Parser.py').read())
-else:
+if (f_unknown_mode == 'Rough_SDE') or (f_unknown_mode == 'Rough_SDE_Vanilla'):
     # Renaming Some internal Parameter(s)
     groud_truth = "rSDE"
     test_size_ratio = train_test_ratio
@@ -283,11 +322,26 @@ else:
     output_dim = problem_dim
     T_begin = 0
     T_end = 1
-    # Run da code
-#     %run Fractional_SDE/fractional_SDE_Simulator.ipynb
-#     %run Fractional_SDE/Data_Simulator_and_Parser___fractional_SDE.ipynb
-    exec(open('Fractional_SDE/fractional_SDE_Simulator.py').read())
-    exec(open('Fractional_SDE/Data_Simulator_and_Parser___fractional_SDE.py').read())
+
+# Ground-truth moments are only known for some simulators (which overwrite these); otherwise those of the MC-oracle are used
+Oracle_Moments_train, Oracle_Moments_test = None, None
+
+# Look-up Dataset Cache
+Dataset_Cache_Key = get_Dataset_Cache_Key()
+if Load_Dataset_Cache(Dataset_Cache_Key):
+    print("Loaded Cached Data: "+str(Dataset_Cache_Key))
+else:
+    if (f_unknown_mode != 'Rough_SDE') and (f_unknown_mode != 'Rough_SDE_Vanilla'):
+        # %run Data_Simulator_and_Parser.ipynb
+        exec(open('./Helper_Scripts_and_Loading/Data_Simulator_and_Parser.py').read())
+    else:
+        # Run da code
+#         %run Fractional_SDE/fractional_SDE_Simulator.ipynb
+#         %run Fractional_SDE/Data_Simulator_and_Parser___fractional_SDE.ipynb
+        exec(open('Fractional_SDE/fractional_SDE_Simulator.py').read())
+        exec(open('Fractional_SDE/Data_Simulator_and_Parser___fractional_SDE.py').read())
+    # Update Dataset Cache
+    Save_Dataset_Cache(Dataset_Cache_Key)
 
 # Verbosity is nice
 print("Generated Data:")
@@ -308,6 +362,16 @@ X_train = scaler.transform(X_train)
 X_test = scaler.transform(X_test)
 
 
+# ### Monte-Carlo Statistics
+# Per-row moments, sorted samples and quantiles of the oracle's Monte-Carlo targets; computed once and shared by every model's evaluator.
+
+# In[ ]:
+
+
+Monte_Carlo_Statistics_train = get_cached_Monte_Carlo_Statistics(Y_train,store_name="Y_train")
+Monte_Carlo_Statistics_test = get_cached_Monte_Carlo_Statistics(Y_test,store_name="Y_test")
+
+
 # ## Run: Main (DNM) and Oracle Models
 
 # In[ ]:
@@ -409,8 +473,8 @@ Summary_pred_Qual_models
 # # 3) The natural Universal Benchmark: [Bishop's Mixture Density Network](https://publications.aston.ac.uk/id/eprint/373/1/NCRG_94_004.pdf)
 # 
 # This implementation is as follows:
-# - For every $x$ in the trainingdata-set we fit a GMM $\hat{\nu}_x$, using the [Expectation-Maximization (EM) algorithm](https://en.wikipedia.org/wiki/Expectation%E2%80%93maximization_algorithm), with the same number of centers as the deep neural model in $\mathcal{NN}_{1_{\mathbb{R}^d},\mathcal{D}}^{\sigma:\star}$ which we are evaluating.  
-# - A Mixture density network is then trained to predict the infered parameters; given any $x \in \mathbb{R}^d$.
+# - A single network (one shared trunk) outputs the means, log-standard deviations and mixture logits of a GMM $\hat{\nu}_x$, with the same number of centers as the deep neural model in $\mathcal{NN}_{1_{\mathbb{R}^d},\mathcal{D}}^{\sigma:\star}$ which we are evaluating; given any $x \in \mathbb{R}^d$.  
+# - It is trained by maximizing the likelihood of the Monte-Carlo samples directly; the readout is initialized at a GMM fitted by the [Expectation-Maximization (EM) algorithm](https://en.wikipedia.org/wiki/Expectation%E2%80%93maximization_algorithm) on a few training inputs.
 
 # In[ ]:
 
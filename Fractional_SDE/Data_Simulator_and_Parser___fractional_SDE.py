@@ -45,7 +45,6 @@ measure_weights_test = np.ones(N_Monte_Carlo_Samples_Test)/N_Monte_Carlo_Samples
 
 # Get number of centers
 N_Centers_per_box = max(1,int(round(N_Quantizers_to_parameterize)))
-N_points_per_barycenter = 10
 
 
 # ## Get Barycenters
@@ -63,10 +62,15 @@ x_Grid_barycenters = np.random.uniform(low=-Max_Grid,
 # In[ ]:
 
 
+# Load Parallel (Process-Pool) Simulator
+exec(open('Fractional_SDE/Parallel_Simulator.py').read())
+
+
+# In[ ]:
+
+
 print("Building Training + Testing Set - rough-SDE Ground-Truth")
 
-# Initialize position Counter
-position_counter = 0
 # Barycenter Counter
 barycenter_counter = 0
 # Iniitalize uniform weights vector
@@ -88,107 +92,79 @@ N_test = N_Euler_Maruyama_Steps - N_train
 # Initialize Times List
 t_Grid = np.linspace(T_begin,T_end,N_Euler_Maruyama_Steps).reshape(-1,1)
 
-for x_bary_i in range(1):#tqdm(range(N_x)): This works; no need to loop
-    # Get Current Locations
-    x_barycenter = x_Grid_barycenters[x_bary_i,]
-
-    for x_i in tqdm(range(N_points_per_barycenter),leave=True):
-        # timer
-        if x_i == 1:
-            Test_Set_PredictionTime_MC_loop = time.time()
-        else:
-            Train_Set_PredictionTime_MC_loop = time.time()
-
-        # Get Current x_init by sampling near the barycenter
-        if x_i > 0:
-            # This case represents the genuine barycenter (which must lie in the dataset eh)
-            x_center = x_barycenter
-        else:
-            x_center = x_barycenter + np.random.uniform(low=delta/2,high=delta/2,size = problem_dim)
-
-        # Update X Grid of Loop
-        X_grid_loop = np.repeat((x_center.reshape(1,-1)),
-                                N_Euler_Maruyama_Steps,axis=0)
-        X_grid_loop = np.append(t_Grid,X_grid_loop,axis=1)
-
-        # Get Sample Paths for this x_init
-        current_cover = Euler_Maruyama_Generator(x_0 = x_center,
-                                                 N_Euler_Maruyama_Steps = N_Euler_Maruyama_Steps,
-                                                 N_Monte_Carlo_Samples = N_Monte_Carlo_Samples,
-                                                 T_begin = T_begin,
-                                                 T_end = T_end,
-                                                 Hurst = Rougness,
-                                                 Ratio_fBM_to_typical_vol = Ratio_fBM_to_typical_vol)
-
-
-        # Update(s) #
-        #-----------#
-        # Identify Which Elements to Add to Barycenters Array
-        ## Identify Which Rows Belong to this Barycenter
-        t_indices_barycenters_loop = np.sort(np.random.choice(range(N_Euler_Maruyama_Steps),size = Q_How_many_time_steps_to_sample_per_x, replace=False))
-        X_grid_barycenters_loop = X_grid_loop[t_indices_barycenters_loop,:]
-        # Get Barycenters for this loop
-        Barycenter_update_loop = current_cover[t_indices_barycenters_loop,:,:]
-
-        # Get Current Barycenter Index      
-        ## Initializations(Loop)
-        barycenter_loop_index = 0
+# Get Initial States #
+#--------------------#
+x_barycenter = x_Grid_barycenters[0,]
+## Training: sampled near the barycenter
+x_init_train = x_barycenter + np.random.uniform(low=delta/2,high=delta/2,size = problem_dim)
+## Testing: the genuine barycenter
+x_init_test = x_barycenter
+
+# Simulate Covers (in parallel) #
+#-------------------------------#
+## Stream into (memory-mapped) Monte-Carlo store; if used
+Covers = Open_Monte_Carlo_Store("Covers_rough_SDE",
+                                [2,N_Euler_Maruyama_Steps,N_Monte_Carlo_Samples,problem_dim],
+                                get_Monte_Carlo_Store_Metadata(Hurst_Exponent=Rougness,
+                                                               initial_states=["train","test"]))
+Covers, Covers_Timers = Parallel_Euler_Maruyama_Simulator(x_0s = np.array([x_init_train,x_init_test]),
+                                                          T_begins = T_begin,
+                                                          T_ends = T_end,
+                                                          N_Euler_Maruyama_Steps = N_Euler_Maruyama_Steps,
+                                                          N_Monte_Carlo_Samples = N_Monte_Carlo_Samples,
+                                                          Hurst = Rougness,
+                                                          Ratio_fBM_to_typical_vol = Ratio_fBM_to_typical_vol,
+                                                          n_jobs = n_jobs,
+                                                          seed = 2021,
+                                                          Covers = Covers)
+## Read lazily from here on out
+Covers = Close_Monte_Carlo_Store("Covers_rough_SDE",Covers)
+
+# Write Training and Testing Sets (preallocated) #
+#------------------------------------------------#
+## Training
+X_train = np.zeros([N_Euler_Maruyama_Steps,(1+problem_dim)])
+X_train[:,0] = t_Grid.reshape(-1,)
+X_train[:,1:] = x_init_train.reshape(1,-1)
+Y_train = Covers[0]
+Train_Set_PredictionTime_MC = Covers_Timers[0]
+## Testing
+X_test = np.zeros([N_Euler_Maruyama_Steps,(1+problem_dim)])
+X_test[:,0] = t_Grid.reshape(-1,)
+X_test[:,1:] = x_init_test.reshape(1,-1)
+Y_test = Covers[1]
+Test_Set_PredictionTime_MC = Covers_Timers[1]
+
+# Identify Which Elements to Add to Barycenters Array #
+#-----------------------------------------------------#
+## Identify Which Rows Belong to this Barycenter
+t_indices_barycenters_loop = np.sort(np.random.choice(range(N_Euler_Maruyama_Steps),size = Q_How_many_time_steps_to_sample_per_x, replace=False))
+# Get Barycenters
+Barycenters_Array = Y_train[t_indices_barycenters_loop,:,:]
+
+# Get Current Barycenter Index      
+## Initializations(Loop)
+barycenter_loop_index = 0
+current_associated_centers_index = t_indices_barycenters_loop[barycenter_loop_index]
+max_possible_loop = max(t_indices_barycenters_loop)
+current_barycenter_index = np.array(range(N_Euler_Maruyama_Steps)) 
+## Get Clusters
+for loop_index in range(N_Euler_Maruyama_Steps):
+    if (current_barycenter_index[loop_index] >= current_associated_centers_index) and (current_barycenter_index[loop_index] < max_possible_loop):
+        # Update Active Barycenter
         current_associated_centers_index = t_indices_barycenters_loop[barycenter_loop_index]
-        max_possible_loop = max(t_indices_barycenters_loop)
-        current_barycenter_index = np.array(range(N_Euler_Maruyama_Steps)) 
-        ## Get Clusters
-        for loop_index in range(N_Euler_Maruyama_Steps):
-            if (current_barycenter_index[loop_index] >= current_associated_centers_index) and (current_barycenter_index[loop_index] < max_possible_loop):
-                # Update Active Barycenter
-                current_associated_centers_index = t_indices_barycenters_loop[barycenter_loop_index]
-                barycenter_loop_index = barycenter_loop_index + 1
-                barycenter_counter = barycenter_counter + 1
-            # Update Dummy
-            current_barycenter_index[loop_index] = barycenter_counter
-        
-        # Append
-        ## Decide if we should initialize or append?...
-        if x_bary_i == 0:
-            if x_i == 0:
-                # Initialize Barycenters
-                Barycenters_Array = Barycenter_update_loop
-                # Initialize Training Set
-                X_train = X_grid_loop
-                Y_train = current_cover
-                # Initialize Training Timer
-                Train_Set_PredictionTime_MC = time.time() - Train_Set_PredictionTime_MC_loop
-                # Update Barycenters Array (For training the deep classifier)
-                Train_classes = current_barycenter_index
-            # Initialize Test Set
-            if x_i == 1:
-                X_test = X_grid_loop
-                Y_test = current_cover
-                # Initialize Test Timer
-                Test_Set_PredictionTime_MC = time.time() - Test_Set_PredictionTime_MC_loop
-        # Update arrays (Now that they're all nice and initialized)
-        else:
-            if x_i != 1:
-                # Update Barycenters
-                Barycenters_Array = np.append(Barycenters_Array,Barycenter_update_loop,axis=0)
-                # Update Training Data
-                X_train = np.append(X_train,X_grid_loop,axis = 0)
-                Y_train = np.append(Y_train,current_cover,axis = 0)
-                # Update Training Timer
-                Train_Set_PredictionTime_MC = (time.time() - Train_Set_PredictionTime_MC) + Train_Set_PredictionTime_MC
-                # Update Barycenters Array (For training the deep classifier)
-                Train_classes = np.append(Train_classes,current_barycenter_index)
-            else:
-                # Update Testing Data
-                X_test = np.append(X_test,X_grid_loop,axis = 0)
-                Y_test = np.append(Y_test,current_cover,axis = 0)
-                # Update Test Timer
-                Test_Set_PredictionTime_MC = (time.time() - Test_Set_PredictionTime_MC_loop) + Test_Set_PredictionTime_MC
+        barycenter_loop_index = barycenter_loop_index + 1
+        barycenter_counter = barycenter_counter + 1
+    # Update Dummy
+    current_barycenter_index[loop_index] = barycenter_counter
+# Update Barycenters Array (For training the deep classifier)
+Train_classes = current_barycenter_index
                 
-# Get Numpy Classes
-Train_classes = (pd.get_dummies(Train_classes)).to_numpy()
+# Get Numpy Classes (as integer labels; i.e. sparse targets)
+Train_classes = np.unique(Train_classes,return_inverse=True)[1]
 
 # Update Number of Centers
-N_Quantizers_to_parameterize = Train_classes.shape[1]
+N_Quantizers_to_parameterize = int(np.max(Train_classes))+1
 
 
 # ## Get Mean Data for Benchmark Models
@@ -198,7 +174,7 @@ N_Quantizers_to_parameterize = Train_classes.shape[1]
 
 
 # Get Mean Training Data
-Y_train_mean_emp = np.mean(Y_train,axis=1)
+Y_train_mean_emp = Monte_Carlo_Store_Row_Means(Y_train)
 
 
 # ---
@@ -179,7 +179,7 @@ print('Deep Feature Builder - Ready')
 #                                      Define Predictive Model                                   #
 #------------------------------------------------------------------------------------------------#
 
-def def_simple_deep_classifer(height, depth, learning_rate, input_dim, output_dim):
+def def_simple_deep_classifer(height, depth, learning_rate, input_dim, output_dim, sparse_targets=False):
     # Initialize Simple Deep Classifier
     simple_deep_classifier = tf.keras.Sequential()
     for d_i in range(depth):
@@ -188,8 +188,13 @@ def def_simple_deep_classifer(height, depth, learning_rate, input_dim, output_di
     simple_deep_classifier.add(tf.keras.layers.Dense(output_dim, activation='softmax'))
 
     # Compile Simple Deep Classifier
+    ## Integer class labels (sparse targets) or one-hot/soft targets
+    if sparse_targets:
+        classifier_loss = 'sparse_categorical_crossentropy'
+    else:
+        classifier_loss = 'categorical_crossentropy'
     simple_deep_classifier.compile(optimizer='adam',
-                  loss='categorical_crossentropy',
+                  loss=classifier_loss,
                   metrics=['accuracy'])
     
     # Return Output
@@ -200,9 +205,13 @@ def def_simple_deep_classifer(height, depth, learning_rate, input_dim, output_di
 #------------------------------------------------------------------------------------------------#
 from tensorflow.keras import Sequential
 def build_simple_deep_classifier(n_folds , n_jobs, n_iter, param_grid_in, X_train, y_train,X_test):
+    # Integer class labels (1d y_train) are trained on directly; so no (dense) one-hot matrix is ever formed
+    sparse_targets = (np.ndim(y_train) == 1)
+    if sparse_targets:
+        y_train = np.asarray(y_train,dtype=np.int32)
 
     # Deep Feature Network
-    CV_simple_deep_classifier = tf.keras.wrappers.scikit_learn.KerasRegressor(build_fn=def_simple_deep_classifer, verbose=True)
+    CV_simple_deep_classifier = tf.keras.wrappers.scikit_learn.KerasRegressor(build_fn=def_simple_deep_classifer, sparse_targets=sparse_targets, verbose=True)
     
     # Scaler
     scaler = MinMaxScaler()#StandardScaler()
@@ -273,20 +282,41 @@ print('Deep Classifier - Ready')
 # In[ ]:
 
 
-def bootstrap(data, n=1000, func=np.mean):
-    """
-    Generate `n` bootstrap samples, evaluating `func`
-    at each resampling. `bootstrap` returns a function,
-    which can be called to obtain confidence intervals
-    of interest.
-    """
-    simulations = list()
+# Confidence-interval method: "percentile" or (bias-corrected and accelerated) "BCa" (Override in main script if desired)
+Bootstrap_CI_method = "percentile"
+
+def get_bootstrap_statistics(data, resample_indices, func):
+    # Evaluate func on every resample (one per row of resample_indices); axis-wise when func supports it
+    resamples = data[resample_indices]
+    try:
+        return np.asarray(func(resamples,axis=1)).reshape(-1,)
+    except TypeError:
+        return np.apply_along_axis(func,1,resamples)
+
+def get_jackknife_statistics(data, func, chunk_size):
+    # Leave-one-out statistics (for the BCa acceleration); the i-th row of indices skips the i-th datum
     sample_size = len(data)
+    jackknife_statistics = np.zeros(sample_size)
+    leave_one_out_base = np.arange(sample_size-1).reshape(1,-1)
+    for i_start in range(0,sample_size,chunk_size):
+        i_end = min(sample_size,i_start+chunk_size)
+        left_out = np.arange(i_start,i_end).reshape(-1,1)
+        jackknife_statistics[i_start:i_end] = get_bootstrap_statistics(data,leave_one_out_base + (leave_one_out_base >= left_out),func)
+    return jackknife_statistics
+
+def get_bootstrap_ci(data, simulations, func=np.mean, method="percentile", chunk_size=10**3):
+    simulations = np.sort(simulations)
+    n = len(simulations)
     xbar_init = np.mean(data)
-    for c in range(n):
-        itersample = np.random.choice(data, size=sample_size, replace=True)
-        simulations.append(func(itersample))
-    simulations.sort()
+    # BCa: Bias-Correction and Acceleration
+    if method == "BCa":
+        theta_hat = func(data)
+        proportion_below = np.clip(np.mean(simulations < theta_hat),1/(n+1),n/(n+1))
+        z_0 = norm.ppf(proportion_below)
+        jackknife_statistics = get_jackknife_statistics(data,func,chunk_size)
+        jackknife_deviations = np.mean(jackknife_statistics) - jackknife_statistics
+        acceleration_denominator = 6*(np.sum(jackknife_deviations**2)**1.5)
+        acceleration = np.sum(jackknife_deviations**3)/acceleration_denominator if acceleration_denominator > 0 else 0
     def ci(p):
         """
         Return 2-sided symmetric confidence interval specified
@@ -294,11 +324,46 @@ def bootstrap(data, n=1000, func=np.mean):
         """
         u_pval = (1+p)/2.
         l_pval = (1-u_pval)
-        l_indx = int(np.floor(n*l_pval))
-        u_indx = int(np.floor(n*u_pval))
+        if method == "BCa":
+            z_l, z_u = norm.ppf(l_pval), norm.ppf(u_pval)
+            l_pval = norm.cdf(z_0 + (z_0+z_l)/(1-acceleration*(z_0+z_l)))
+            u_pval = norm.cdf(z_0 + (z_0+z_u)/(1-acceleration*(z_0+z_u)))
+        l_indx = int(min(n-1,np.floor(n*l_pval)))
+        u_indx = int(min(n-1,np.floor(n*u_pval)))
         return(simulations[l_indx],xbar_init,simulations[u_indx])
     return(ci)
 
+def bootstrap_metrics(datas, n=1000, func=np.mean, method=None, chunk_size=None):
+    """
+    Bootstrap several metrics (evaluated on the same datapoints)
+    off the same resample indices; drawn all at once, in chunks
+    of (at-most) chunk_size resamples.  Returns one confidence
+    interval function (see `bootstrap`) per metric.
+    """
+    if method is None:
+        method = Bootstrap_CI_method
+    datas = [np.asarray(data).reshape(-1,) for data in datas]
+    sample_size = len(datas[0])
+    if chunk_size is None:
+        chunk_size = int(max(1,(10**7)//sample_size))
+    simulations = [np.zeros(n) for data in datas]
+    for c_start in range(0,n,chunk_size):
+        c_end = min(n,c_start+chunk_size)
+        # Resample Indices (same stream as n successive calls of np.random.choice)
+        resample_indices = np.random.randint(0,sample_size,size=(c_end-c_start,sample_size))
+        for data, simulations_data in zip(datas,simulations):
+            simulations_data[c_start:c_end] = get_bootstrap_statistics(data,resample_indices,func)
+    return [get_bootstrap_ci(data,simulations_data,func,method,chunk_size) for data, simulations_data in zip(datas,simulations)]
+
+def bootstrap(data, n=1000, func=np.mean, method=None):
+    """
+    Generate `n` bootstrap samples, evaluating `func`
+    at each resampling. `bootstrap` returns a function,
+    which can be called to obtain confidence intervals
+    of interest.
+    """
+    return bootstrap_metrics([data],n=n,func=func,method=method)[0]
+
 
 
 def get_Error_distribution_plots(test_set_data,
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Parallel Simulator
+# Spreads the (independent) Euler-Maruyama simulations of each initial state across a process pool.
+#
+# **Note:** *Every initial state gets its own random stream (a np.random.RandomState); spawned from the seed (2021).  The global generator is never touched; thus neither the simulated covers nor any later (global) random draws depend on the number of workers (n_jobs) or on the order in which they finish.*
+
+# In[ ]:
+
+
+import multiprocessing
+
+
+# #### Worker
+# Simulates the Monte-Carlo sample paths started at a single initial state.
+
+# In[ ]:
+
+
+def Euler_Maruyama_Worker(task_in):
+    # Unpack Task
+    x_0, T_begin_loop, T_end_loop, seed_sequence_loop, simulation_parameters = task_in
+    # This task's own random stream
+    random_state_loop = np.random.RandomState(seed_sequence_loop.generate_state(4))
+    # Simulate (and time) the cover
+    worker_timer = time.time()
+    current_cover = Euler_Maruyama_Generator(x_0 = x_0,
+                                             T_begin = T_begin_loop,
+                                             T_end = T_end_loop,
+                                             random_state = random_state_loop,
+                                             **simulation_parameters)
+    worker_timer = time.time() - worker_timer
+    return current_cover, worker_timer
+
+
+# #### Driver
+# Returns:
+# - Covers: an array with Covers[i, t, sample, dim] being the sample paths started at the $i^{th}$ initial state,
+# - Timers: the time spent simulating each initial state.
+#
+# **Note:** *If Covers is passed (e.g. a memory-mapped Monte-Carlo store) then the covers are streamed into it; one initial state at a time.*
+
+# In[ ]:
+
+
+def Parallel_Euler_Maruyama_Simulator(x_0s,
+                                      T_begins = 0,
+                                      T_ends = 1,
+                                      N_Euler_Maruyama_Steps = 10,
+                                      N_Monte_Carlo_Samples = 100,
+                                      Hurst = 0.1,
+                                      Ratio_fBM_to_typical_vol = 0.5,
+                                      n_jobs = 1,
+                                      seed = 2021,
+                                      Covers = None):
+    #----------------------------#
+    # DEFINE INTERNAL PARAMETERS #
+    #----------------------------#
+    # Coerce Initial States (one per row) and their time-windows
+    N_initial_states = len(x_0s)
+    x_0s = np.array(x_0s,dtype=float).reshape(N_initial_states,-1)
+    T_begins = np.broadcast_to(np.array(T_begins,dtype=float),(N_initial_states,))
+    T_ends = np.broadcast_to(np.array(T_ends,dtype=float),(N_initial_states,))
+    # Shared Simulation Parameters
+    simulation_parameters = {'N_Euler_Maruyama_Steps':N_Euler_Maruyama_Steps,
+                             'N_Monte_Carlo_Samples':N_Monte_Carlo_Samples,
+                             'Hurst':Hurst,
+                             'Ratio_fBM_to_typical_vol':Ratio_fBM_to_typical_vol}
+    # One (reproducible) random stream per initial state
+    seed_sequences = np.random.SeedSequence(seed).spawn(N_initial_states)
+    tasks = [(x_0s[i,],T_begins[i],T_ends[i],seed_sequences[i],simulation_parameters) for i in range(N_initial_states)]
+
+    # Preallocate Output(s)
+    if Covers is None:
+        Covers = np.zeros([N_initial_states,N_Euler_Maruyama_Steps,N_Monte_Carlo_Samples,problem_dim])
+    Timers = np.zeros(N_initial_states)
+
+    #----------------------#
+    # Simulate (in order)  #
+    #----------------------#
+    N_workers = int(max(1,min(n_jobs,N_initial_states)))
+    if N_workers == 1:
+        for i in tqdm(range(N_initial_states)):
+            Covers[i], Timers[i] = Euler_Maruyama_Worker(tasks[i])
+    else:
+        # Fork so workers inherit the user-defined dynamics (alpha, beta) and loaded simulators
+        with multiprocessing.get_context("fork").Pool(processes=N_workers) as simulation_pool:
+            simulated_covers = simulation_pool.imap(Euler_Maruyama_Worker,
+                                                    tasks,
+                                                    chunksize=int(max(1,N_initial_states//(4*N_workers))))
+            for i, (current_cover, worker_timer) in enumerate(tqdm(simulated_covers,total=N_initial_states)):
+                Covers[i], Timers[i] = current_cover, worker_timer
+
+    return Covers, Timers
+
+
+# ---
+# # Fin
+# ---
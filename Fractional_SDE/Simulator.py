@@ -3,6 +3,14 @@
 
 # # Simulator
 
+# Load batched fBM generator (cached Davies-Harte spectrum)
+
+# In[ ]:
+
+
+exec(open('Fractional_SDE/fBM_Generator.py').read())
+
+
 # ## Euler-Maruyama +
 # For generating rough SDEs:
 # 
@@ -32,14 +40,20 @@ def Euler_Maruyama_Generator(x_0,
     dt = (T_end-T_begin)/N_Euler_Maruyama_Steps
     sqrt_dt = np.sqrt(dt)
     
+    # Generate roughness (for all Monte-Carlo samples at once)
+    sigma_rough_block = fBM_Generator_Batched(N_samples = N_Monte_Carlo_Samples,
+                                              n = N_Euler_Maruyama_Steps,
+                                              Hurst = Hurst,
+                                              length = 1)
+    
     #-----------------------------#    
     # Generate Monte-Carlo Sample #
     #-----------------------------#
     for n_sample in range(N_Monte_Carlo_Samples):
         # Initialize Current State 
         X_current = x_0
-        # Generate roughness
-        sigma_rough = FBM(n=N_Euler_Maruyama_Steps, hurst=Hurst, length=1, method='daviesharte').fbm()
+        # Get roughness
+        sigma_rough = sigma_rough_block[n_sample,:]
         # Perform Euler-Maruyama Simulation
         for t in range(N_Euler_Maruyama_Steps):
             # Update Internal Parameters
@@ -173,8 +187,6 @@ def perturbed_fBM_simulator(x_Grid,t_Grid,N_Monte_Carlo_Samples=10):
     print("===================================")
     print("Start Simulation Step: Training Set")
     print("===================================")
-    # Initialize fBM Generator
-    fBM_Generator = FBM(n=N_Euler_Maruyama_Steps, hurst=0.75, length=1, method='daviesharte')
 
     # Perform Monte-Carlo Data Generation
     for i in tqdm(range(N_Grid_Instances_x)):
@@ -185,13 +197,12 @@ def perturbed_fBM_simulator(x_Grid,t_Grid,N_Monte_Carlo_Samples=10):
         # Get omega and t
         # Generate finite-variation path (since it stays unchanged)
         finite_variation_path = finite_variation_t(t_loop).reshape(-1,1) +field_loop_x
-        for n_MC in range(N_Monte_Carlo_Samples):
-            fBM_variation_path_loop = fBM_Generator.fbm().reshape(-1,1)
-            generated_path_loop = finite_variation_path + fBM_variation_path_loop
-            if n_MC == 0:
-                paths_loop = generated_path_loop
-            else:
-                paths_loop = np.append(paths_loop,generated_path_loop,axis=-1)
+        # Draw all Monte-Carlo fBM paths in one block (columns are samples)
+        fBM_variation_paths_loop = fBM_Generator_Batched(N_samples = N_Monte_Carlo_Samples,
+                                                         n = N_Euler_Maruyama_Steps,
+                                                         Hurst = 0.75,
+                                                         length = 1).T
+        paths_loop = finite_variation_path + fBM_variation_paths_loop
         
         # Map numpy to list
         measures_locations_loop = paths_loop.tolist()
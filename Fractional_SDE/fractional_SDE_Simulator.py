@@ -9,67 +9,122 @@
 Rougness = Hurst_Exponent
 
 
+# Load batched fBM generator (cached Davies-Harte spectrum)
+
+# In[ ]:
+
+
+exec(open('Fractional_SDE/fBM_Generator.py').read())
+
+
 # ## Euler-Maruyama +
 # For generating rough SDEs:
 # 
 # Generates the empirical measure $\sum_{n=1}^N \delta_{X_T(\omega_n)}$ of $X_T$ conditional on $X_0=x_0\in \mathbb{R}$ *($x_0$ and $T>0$ are user-provided)*.
+# 
+# **Note:** *All Monte-Carlo samples (and, optionally, several initial states $x_0$) are advanced together as one (samples, dim) array per time-step; thus, the drift $\alpha(t,x)$ and volatility $\beta(t,x)$ must accept a batch of states $x$ of shape (samples, dim).  The noise is drawn from random_state (a np.random.RandomState); or from the global generator if it is None.*
 
 # In[ ]:
 
 
-def Euler_Maruyama_Generator(x_0,
-                             N_Euler_Maruyama_Steps = 10,
-                             N_Monte_Carlo_Samples = 100,
-                             T_begin = 0,
-                             T_end = 1,
-                             Hurst = 0.1,
-                             Ratio_fBM_to_typical_vol = 0.5): 
+def Euler_Maruyama_Generator_Batched(x_0s,
+                                     N_Euler_Maruyama_Steps = 10,
+                                     N_Monte_Carlo_Samples = 100,
+                                     T_begin = 0,
+                                     T_end = 1,
+                                     Hurst = 0.1,
+                                     Ratio_fBM_to_typical_vol = 0.5,
+                                     drift = None,
+                                     volatility = None,
+                                     random_state = None): 
     #----------------------------#    
     # DEFINE INTERNAL PARAMETERS #
     #----------------------------#
-    # Initialize Empirical Measure
-    X_T_Empirical = np.zeros([N_Euler_Maruyama_Steps,N_Monte_Carlo_Samples,problem_dim])
-
+    # Default to the global random number generator
+    if random_state is None:
+        random_state = np.random
+    # Default to the user-defined (batch-compatible) dynamics
+    if drift is None:
+        drift = alpha
+    if volatility is None:
+        volatility = beta
+    # Coerce initial states to a (N_initial_states, problem_dim) array
+    x_0s = np.array(x_0s,dtype=float).reshape(-1,problem_dim)
+    N_initial_states = x_0s.shape[0]
+    N_paths = N_initial_states*N_Monte_Carlo_Samples
+    
+    # Initialize Empirical Measure(s)
+    X_T_Empirical = np.zeros([N_Euler_Maruyama_Steps,N_paths,problem_dim])
 
     # Internal Initialization(s)
-    ## Initialize current state
-    n_sample = 0
     ## Initialize Incriments
     dt = (T_end-T_begin)/N_Euler_Maruyama_Steps
     sqrt_dt = np.sqrt(dt)
-
-    #-----------------------------#    
-    # Generate Monte-Carlo Sample #
-    #-----------------------------#
-    for n_sample in range(N_Monte_Carlo_Samples):
-        # Initialize Current State 
-        X_current = x_0.reshape(-1,)
-        # Generate roughness
-#         if Hurst == 0.5:
-        sigma_rough = FBM(n=N_Euler_Maruyama_Steps, hurst=Hurst, length=1, method='daviesharte').fbm()
-        # Perform Euler-Maruyama Simulation
-        for t in range(N_Euler_Maruyama_Steps):
-            # Update Internal Parameters
-            ## Get Current Time
-            t_current = t*((T_end - T_begin)/N_Euler_Maruyama_Steps)
-
-            # Update Generated Path
-            drift_t = alpha(t_current,X_current)*dt
-            W_t = np.random.normal(0,np.ones(problem_dim))*sqrt_dt
-            vol_t = beta(t_current,X_current)
-#             if Hurst == 0.5:
-            vol_t = ((1-Ratio_fBM_to_typical_vol)*vol_t*W_t) + (Ratio_fBM_to_typical_vol*sigma_rough[t])
-#             else:
-#             vol_t = vol_t*W_t
-            X_current = X_current + drift_t + vol_t
-
-            # Update Empirical Measure
-            X_T_Empirical[t,n_sample,:] = X_current
+    ## Initialize current state (one row per Monte-Carlo path; states are grouped by initial condition)
+    X_current = np.repeat(x_0s,N_Monte_Carlo_Samples,axis=0)
     
+    #-------------------------------------#    
+    # Generate Roughness (for every path) #
+    #-------------------------------------#
+    sigma_rough = fBM_Generator_Batched(N_samples = N_paths,
+                                        n = N_Euler_Maruyama_Steps,
+                                        Hurst = Hurst,
+                                        length = 1,
+                                        random_state = random_state)
+
+    #-------------------------------------------------------#    
+    # Perform Euler-Maruyama Simulation (all paths at once) #
+    #-------------------------------------------------------#
+    for t in range(N_Euler_Maruyama_Steps):
+        # Update Internal Parameters
+        ## Get Current Time
+        t_current = t*((T_end - T_begin)/N_Euler_Maruyama_Steps)
+
+        # Update Generated Paths
+        drift_t = drift(t_current,X_current)*dt
+        W_t = random_state.normal(0,1,size=(N_paths,problem_dim))*sqrt_dt
+        vol_t = volatility(t_current,X_current)
+        vol_t = ((1-Ratio_fBM_to_typical_vol)*vol_t*W_t) + (Ratio_fBM_to_typical_vol*sigma_rough[:,t].reshape(-1,1))
+        X_current = X_current + drift_t + vol_t
+
+        # Update Empirical Measure
+        X_T_Empirical[t,:,:] = X_current
+    
+    # Split paths back up by initial state: [initial state, t, sample, dim]
+    X_T_Empirical = X_T_Empirical.reshape(N_Euler_Maruyama_Steps,N_initial_states,N_Monte_Carlo_Samples,problem_dim)
+    X_T_Empirical = np.moveaxis(X_T_Empirical,1,0)
+    return X_T_Empirical
+
+
+# The single initial-state version (used throughout) is a thin wrapper around the batched engine; it keeps the X_T_Empirical[t, sample, dim] layout.
+
+# In[ ]:
+
+
+def Euler_Maruyama_Generator(x_0,
+                             N_Euler_Maruyama_Steps = 10,
+                             N_Monte_Carlo_Samples = 100,
+                             T_begin = 0,
+                             T_end = 1,
+                             Hurst = 0.1,
+                             Ratio_fBM_to_typical_vol = 0.5,
+                             drift = None,
+                             volatility = None,
+                             random_state = None): 
+    X_T_Empirical = Euler_Maruyama_Generator_Batched(x_0s = x_0,
+                                                     N_Euler_Maruyama_Steps = N_Euler_Maruyama_Steps,
+                                                     N_Monte_Carlo_Samples = N_Monte_Carlo_Samples,
+                                                     T_begin = T_begin,
+                                                     T_end = T_end,
+                                                     Hurst = Hurst,
+                                                     Ratio_fBM_to_typical_vol = Ratio_fBM_to_typical_vol,
+                                                     drift = drift,
+                                                     volatility = volatility,
+                                                     random_state = random_state)
     # Add Stationary Uniform Noise
 #     if uniform_noise>0:
 #         X_T_Empirical = X_T_Empirical #+ np.random.uniform(low=-uniform_noise,high=uniform_noise,size=X_T_Empirical.shape())
-    return X_T_Empirical
+    return X_T_Empirical[0]
 
 
 # ## Euler-Maruyama Simulator
@@ -353,8 +353,7 @@ if groud_truth == "2lnflow":
         measures_locations_list_current = measures_locations_list_current + center_current
         measures_weights_list_current = measures_weights_list_current + trash
         # Update Classes
-        Classifer_Wasserstein_Centers_loop = np.zeros([(N_measures_per_center+1),N_Quantizers_to_parameterize]) # The +1 is to account for the center which will be added to the random ball
-        Classifer_Wasserstein_Centers_loop[:, i] =  1
+        Classifer_Wasserstein_Centers_loop = np.repeat(i,(N_measures_per_center+1)) # The +1 is to account for the center which will be added to the random ball
         # Updates Classes
         if i==0:
             # INITIALIZE: Classifiers
@@ -368,7 +367,7 @@ if groud_truth == "2lnflow":
             measures_weights_list = measures_weights_list_current
         else:
             # UPDATE: Classifer
-            Classifer_Wasserstein_Centers = np.append(Classifer_Wasserstein_Centers,Classifer_Wasserstein_Centers_loop,axis=0)
+            Classifer_Wasserstein_Centers = np.append(Classifer_Wasserstein_Centers,Classifer_Wasserstein_Centers_loop)
             # UPDATE: Training Data
             X_train = np.append(X_train,np.append((Grid_Barycenters[i]).reshape(1,2),sub_grid_loop,axis=0),axis=0)
             # UPDATE: Populate Barycenters Array
@@ -450,79 +449,78 @@ if groud_truth == "rSDE":
     N_train = int(N_Euler_Maruyama_Steps*(1-test_size_ratio))
     N_test = N_Euler_Maruyama_Steps - N_train
 
-    for x_i in tqdm(range(N_x)):
-        for t_j in range(N_t):
-
-            # Get Current Locations
-            x_center = x_Grid_barycenters[x_i]
-            t_center = t_Grid_barycenters[t_j]
-
-            current_cover = Euler_Maruyama_Generator(x_0 = x_center,
-                                                     N_Euler_Maruyama_Steps = N_Euler_Maruyama_Steps,
-                                                     N_Monte_Carlo_Samples = N_Monte_Carlo_Samples,
-                                                     T_begin = t_center,
-                                                     T_end = (t_center+delta),
-                                                     Hurst = Rougness,
-                                                     Ratio_fBM_to_typical_vol = Ratio_fBM_to_typical_vol)
-            # Get Barycenter
-            barycenter_at_current_location = current_cover[0,:]
-            
-            # Subset
-            ## Measure Location(s)
-            measures_locations_list_current_train = (current_cover[:N_train]).tolist()
-            measures_locations_list_current_test = (current_cover[:-N_train]).tolist()
-            ## Measure Weight(s)
-            measures_weights_list_current = list(itertools.repeat(measures_weights_list_loop,N_Monte_Carlo_Samples))
-
-            
-            # Get Current Training Data Positions
-            t_grid_current = (np.linspace(start=t_center,
-                                          stop=(t_center+delta),
-                                          num=N_Euler_Maruyama_Steps)).reshape(1,-1)
-            x_grid_current = (x_center*np.ones(N_Euler_Maruyama_Steps)).reshape(1,-1)
-
-            X_train_current = (np.append(x_grid_current,t_grid_current,axis=0)).T
-            ## Subset
-            X_train_updater = X_train_current[:N_train,:] # Get top of array (including center)
-            X_test_updater = X_train_current[-N_test:,:] # Get bottom of array (exclusing center)
-
-            # Get Current Classes
-            Classifer_Wasserstein_Centers_loop = np.zeros([N_train,N_Quantizers_to_parameterize])
-            Classifer_Wasserstein_Centers_loop[:, position_counter] =  1
-
-
-            # Updates Classes
-            if (x_i==0 and t_j==0):
-                # INITIALIZE: Classifiers
-                Classifer_Wasserstein_Centers = Classifer_Wasserstein_Centers_loop
-                # INITIALIZE: Training Data
-                X_train = X_train_updater
-                X_test = X_test_updater
-                # INITIALIZE: Barycenters Array
-                Barycenters_Array = barycenter_at_current_location.reshape(-1,1)
-                # INITIALIZE: Measures and locations
-                measures_locations_list = measures_locations_list_current_train
-                measures_locations_test_list = measures_locations_list_current_test
-                measures_weights_list = measures_weights_list_current
-                measures_weights_test_list = measures_weights_list_current
-            else:
-                # UPDATE: Classifer
-                Classifer_Wasserstein_Centers = np.append(Classifer_Wasserstein_Centers,Classifer_Wasserstein_Centers_loop,axis=0)
-                # UPDATE: Training Data
-                X_train = np.append(X_train,X_train_updater,axis=0)
-                X_test = np.append(X_test,X_test_updater,axis=0)
-                # UPDATE: Populate Barycenters Array
-                Barycenters_Array = np.append(Barycenters_Array,(barycenter_at_current_location.reshape(-1,1)),axis=-1)
-                # UPDATE: Measures and locations
-                ## Train
-                measures_locations_list = measures_locations_list + measures_locations_list_current_train
-                measures_weights_list = measures_locations_list + measures_weights_list_current
-                ## Test
-                measures_locations_test_list = measures_locations_test_list + measures_locations_list_current_test
-                measures_weights_test_list = measures_locations_test_list + measures_weights_list_current
-
-            # Update Position
-            position_counter = position_counter + 1
+    # Initial Conditions (x_i,t_j); ordered as in the position counter
+    x_centers = np.repeat(x_Grid_barycenters,N_t)
+    t_centers = np.tile(t_Grid_barycenters,N_x)
+
+    # Simulate Covers (in parallel) #
+    #-------------------------------#
+    exec(open('Fractional_SDE/Parallel_Simulator.py').read())
+    Covers, Covers_Timers = Parallel_Euler_Maruyama_Simulator(x_0s = x_centers,
+                                                              T_begins = t_centers,
+                                                              T_ends = (t_centers+delta),
+                                                              N_Euler_Maruyama_Steps = N_Euler_Maruyama_Steps,
+                                                              N_Monte_Carlo_Samples = N_Monte_Carlo_Samples,
+                                                              Hurst = Rougness,
+                                                              Ratio_fBM_to_typical_vol = Ratio_fBM_to_typical_vol,
+                                                              n_jobs = n_jobs,
+                                                              seed = 2021)
+
+    # Preallocate Training/Testing Data #
+    #-----------------------------------#
+    X_train = np.zeros([N_Quantizers_to_parameterize*N_train,2])
+    X_test = np.zeros([N_Quantizers_to_parameterize*N_test,2])
+    Classifer_Wasserstein_Centers = np.zeros(N_Quantizers_to_parameterize*N_train,dtype=int)
+    Barycenters_Array = np.zeros([(N_Monte_Carlo_Samples*Covers.shape[-1]),N_Quantizers_to_parameterize])
+    measures_locations_list = []
+    measures_locations_test_list = []
+    measures_weights_list = []
+    measures_weights_test_list = []
+
+    for position_counter in range(N_Quantizers_to_parameterize):
+
+        # Get Current Locations
+        x_center = x_centers[position_counter]
+        t_center = t_centers[position_counter]
+        current_cover = Covers[position_counter]
+
+        # Get Barycenter
+        barycenter_at_current_location = current_cover[0,:]
+
+        # Subset
+        ## Measure Location(s)
+        measures_locations_list_current_train = (current_cover[:N_train]).tolist()
+        measures_locations_list_current_test = (current_cover[:-N_train]).tolist()
+        ## Measure Weight(s)
+        measures_weights_list_current = list(itertools.repeat(measures_weights_list_loop,N_Monte_Carlo_Samples))
+
+        # Get Current Training Data Positions
+        t_grid_current = np.linspace(start=t_center,
+                                     stop=(t_center+delta),
+                                     num=N_Euler_Maruyama_Steps)
+        ## Rows of this position's block(s)
+        train_rows = slice(position_counter*N_train,(position_counter+1)*N_train)
+        test_rows = slice(position_counter*N_test,(position_counter+1)*N_test)
+
+        # Write Training/Testing Data
+        X_train[train_rows,0] = x_center
+        X_train[train_rows,1] = t_grid_current[:N_train] # Get top of array (including center)
+        X_test[test_rows,0] = x_center
+        X_test[test_rows,1] = t_grid_current[-N_test:] # Get bottom of array (exclusing center)
+
+        # Write Classes (integer labels)
+        Classifer_Wasserstein_Centers[train_rows] = position_counter
+
+        # Populate Barycenters Array
+        Barycenters_Array[:,position_counter] = barycenter_at_current_location.reshape(-1,)
+
+        # UPDATE: Measures and locations
+        ## Train
+        measures_locations_list.extend(measures_locations_list_current_train)
+        measures_weights_list.extend(measures_weights_list_current)
+        ## Test
+        measures_locations_test_list.extend(measures_locations_list_current_test)
+        measures_weights_test_list.extend(measures_weights_list_current)
 
 
 # In[ ]:
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Accumulator
+# Linear-time replacement for growing arrays with np.append inside loops (which copies the whole array at every iteration).
+# - If the final size is known, the buffer is preallocated once.
+# - Otherwise, the buffer grows geometrically (doubling); so appending $N$ entries costs $\mathcal{O}(N)$ copies in total.
+#
+# Usage:
+# - errors = Accumulator(N): then errors.append(error_loop) in the loop and errors = errors.to_array() after it; gives the same result as np.append(errors,error_loop) (flattened).
+# - Accumulator(N,axis=0): stacks rows; each entry is either one row (1-D) or a block of rows (2-D); i.e. as np.append(array,array_loop.reshape(-1,n_columns),axis=0).
+
+# In[ ]:
+
+
+class Accumulator:
+
+    def __init__(self, capacity=None, axis=None, dtype=float):
+        self.capacity = 16 if capacity is None else max(1,int(capacity))
+        self.axis = axis
+        self.dtype = dtype
+        self.size = 0
+        self.buffer = None
+
+    def append(self, values):
+        values = np.asarray(values,dtype=self.dtype)
+        if self.axis is None:
+            values = values.reshape(-1,)
+        elif values.ndim < 2:
+            # A 1-D (or scalar) entry is a single row
+            values = values.reshape(1,-1)
+        # Initialize Buffer (trailing shape is set by the first entry)
+        if self.buffer is None:
+            self.buffer = np.zeros((max(self.capacity,values.shape[0]),)+values.shape[1:],dtype=self.dtype)
+        # Grow Buffer (geometrically) if needed
+        N_new = self.size + values.shape[0]
+        if N_new > self.buffer.shape[0]:
+            buffer_new = np.zeros((max(2*self.buffer.shape[0],N_new),)+self.buffer.shape[1:],dtype=self.dtype)
+            buffer_new[:self.size] = self.buffer[:self.size]
+            self.buffer = buffer_new
+        # Write
+        self.buffer[self.size:N_new] = values
+        self.size = N_new
+        return self
+
+    def __len__(self):
+        return self.size
+
+    def to_array(self):
+        if self.buffer is None:
+            return np.zeros(0,dtype=self.dtype)
+        return self.buffer[:self.size]
+
+
+# ---
+# # Fin
+# ---
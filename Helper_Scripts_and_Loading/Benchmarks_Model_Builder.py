@@ -63,6 +63,95 @@ def get_ffNN(height, depth, learning_rate, input_dim, output_dim):
     return trainable_layers_model
 
 
+# ## Stacked Ensemble of ffNNs
+# Trains N_replicas independent copies of the ffNN of get_ffNN concurrently; as one wide network.
+# - Each replica has its own weights; initialized with its own seeds (one per layer's kernel and one per layer's bias).
+# - The loss is the sum of the replicas' losses; so each replica's gradients (and Adam updates) are exactly those it would get if trained alone.
+# - Predictions are returned as an (N, N_replicas) array; i.e.: one column per replica.
+
+# In[ ]:
+
+
+class fullyConnected_Dense_Stacked(tf.keras.layers.Layer):
+
+    def __init__(self, units=16, N_replicas=1, seeds=None):
+        super(fullyConnected_Dense_Stacked, self).__init__()
+        self.units = units
+        self.N_replicas = N_replicas
+        # One (kernel, bias) pair of seeds per replica
+        if seeds is None:
+            seeds = [child.generate_state(2) for child in np.random.SeedSequence(2021).spawn(N_replicas)]
+        seeds = np.asarray(seeds).reshape(N_replicas,2)
+        self.kernel_seeds = [int(seed) for seed in seeds[:,0]]
+        self.bias_seeds = [int(seed) for seed in seeds[:,1]]
+
+    def get_stacked_initializer(self, seeds):
+        # One (seeded) random normal initialization per replica
+        def stacked_initializer(shape, dtype=None):
+            return tf.stack([tf.keras.initializers.RandomNormal(seed=seed)(shape[1:],dtype=dtype) for seed in seeds])
+        return stacked_initializer
+
+    def build(self, input_shape):
+        self.w = self.add_weight(name='Weights_ffNN',
+                                 shape=(self.N_replicas, input_shape[-1], self.units),
+                               initializer=self.get_stacked_initializer(self.kernel_seeds),
+                               trainable=True)
+        self.b = self.add_weight(name='bias_ffNN',
+                                 shape=(self.N_replicas, self.units),
+                               initializer=self.get_stacked_initializer(self.bias_seeds),
+                               trainable=True)
+
+    def call(self, inputs):
+        # Shared inputs (first layer) or one input per replica (deeper layers)
+        if len(inputs.shape) == 2:
+            return tf.einsum('ni,rio->nro', inputs, self.w) + self.b
+        return tf.einsum('nri,rio->nro', inputs, self.w) + self.b
+
+
+def stacked_mae(y_true, y_pred):
+    # Sum of the replicas' MAEs
+    return K.sum(K.abs(y_true - y_pred), axis=-1)
+
+
+def get_ffNN_Stacked_Ensemble(height, depth, learning_rate, input_dim, replica_seeds):
+    # One seed per replica (spread over its layers; two child seeds per layer: kernel and bias); shape: (layer, replica, 2)
+    N_replicas = len(replica_seeds)
+    layer_seeds = np.array([[child.generate_state(2) for child in np.random.SeedSequence(int(seed)).spawn(depth+1)] for seed in replica_seeds]).transpose(1,0,2)
+    # Initialize Inputs
+    input_layer = tf.keras.Input(shape=(input_dim,))
+
+    #------------------#
+    #   Core Layers    #
+    #------------------#
+    core_layers = fullyConnected_Dense_Stacked(height, N_replicas, layer_seeds[0])(input_layer)
+    # Activation
+    core_layers = tf.nn.swish(core_layers)
+    # Train additional Depth?
+    if depth>1:
+        # Add additional deep layer(s)
+        for depth_i in range(1,depth):
+            core_layers = fullyConnected_Dense_Stacked(height, N_replicas, layer_seeds[depth_i])(core_layers)
+            # Activation
+            core_layers = tf.nn.swish(core_layers)
+
+    #------------------#
+    #  Readout Layers  #
+    #------------------#
+    # Affine (Readout) Layer (one scalar output per replica)
+    output_layers = fullyConnected_Dense_Stacked(1, N_replicas, layer_seeds[depth])(core_layers)
+    output_layers = tf.reshape(output_layers, (-1, N_replicas))
+    # Define Input/Output Relationship (Arch.)
+    trainable_layers_model = tf.keras.Model(input_layer, output_layers)
+
+    #----------------------------------#
+    # Define Optimizer & Compile Archs.
+    #----------------------------------#
+    opt = Adam(lr=learning_rate)
+    trainable_layers_model.compile(optimizer=opt, loss=stacked_mae)
+
+    return trainable_layers_model
+
+
 
 def build_ffNN(n_folds , n_jobs, n_iter, param_grid_in, X_train, y_train,X_test):
     # Update Dictionary
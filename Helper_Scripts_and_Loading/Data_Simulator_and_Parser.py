@@ -172,6 +172,28 @@ if f_unknown_mode == "Heteroskedastic_NonLinear_Regression":
         f_x_noise = np.cos(f_x) + noise
         return f_x_noise
 
+    # Define Batched Simulator (whole input batch at once)
+    ## Reference Mode: Products are taken one input at a time (as in Simulator) so outputs are bit-identical to the row-by-row loop.
+    Simulator_reference_mode = False
+    def Simulator_Batched(X_in,reference_mode=False):
+        X_in = np.array(X_in).reshape(-1,problem_dim)
+        var = np.sqrt(np.sum(X_in**2,axis=1))
+        # Pushforward
+        if reference_mode:
+            f_x = np.matmul(W_feature,X_in[:,:,np.newaxis])
+            for i in range(Depth_Bayesian_DNN):
+                f_x = np.maximum(0,np.matmul(W_hidden_list[i],f_x))
+            f_x = np.matmul(W_readout,f_x)[:,:,0]
+        else:
+            f_x = np.matmul(X_in,W_feature.T)
+            for i in range(Depth_Bayesian_DNN):
+                f_x = np.maximum(0,np.matmul(f_x,W_hidden_list[i].T))
+            f_x = np.matmul(f_x,W_readout.T)
+        # Apply Noise After (drawn row-major; i.e. in the same order as the row-by-row loop)
+        noise = np.random.laplace(0,var.reshape(-1,1),size=(X_in.shape[0],N_Monte_Carlo_Samples))
+        f_x_noise = np.cos(f_x) + noise
+        return f_x_noise
+
 
 # ## Bayesian DNN
 
@@ -196,12 +218,32 @@ if f_unknown_mode == "DNN_with_Random_Weights":
 
 
     def Simulator(x_in):
+        y_MC = Accumulator(N_Monte_Carlo_Samples)
         for i_MC in range(N_Monte_Carlo_Samples):
-            y_MC_loop = f_unknown(x_in)
-            if i_MC == 0:
-                y_MC = y_MC_loop
-            else:
-                y_MC = np.append(y_MC,y_MC_loop)
+            y_MC.append(f_unknown(x_in))
+        return y_MC.to_array()
+
+    # Define Batched Simulator
+    ## Draws one stack of weights per Monte-Carlo sample and evaluates every input with one einsum per layer.
+    ## Chunk Size: Number of Monte-Carlo samples drawn at once (caps peak memory); None means all.
+    Simulator_chunk_size = None
+    def Simulator_Batched(X_in,chunk_size=None):
+        X_in = np.array(X_in).reshape(-1,problem_dim)
+        if chunk_size is None:
+            chunk_size = N_Monte_Carlo_Samples
+        y_MC = np.zeros([X_in.shape[0],N_Monte_Carlo_Samples])
+        for i_MC_start in range(0,N_Monte_Carlo_Samples,chunk_size):
+            N_chunk = min(chunk_size,N_Monte_Carlo_Samples-i_MC_start)
+            # Feature Map Layer
+            W_feature = np.random.uniform(size=np.array([N_chunk,width,problem_dim]),low=-.5,high=.5)
+            x_internal = np.einsum('swd,nd->snw',W_feature,X_in)
+            # Deep Layer(s)
+            for i in range(Depth_Bayesian_DNN):
+                W_internal = np.random.uniform(size=np.array([N_chunk,width,width]),low=-.5,high=.5)
+                x_internal = np.maximum(0,np.einsum('svw,snw->snv',W_internal,x_internal))
+            # Readout Layer
+            W_readout = np.random.uniform(size=np.array([N_chunk,width]),low=-.5,high=.5)
+            y_MC[:,i_MC_start:(i_MC_start+N_chunk)] = np.einsum('sw,snw->ns',W_readout,x_internal)
         return y_MC
 
 
@@ -245,12 +287,37 @@ if f_unknown_mode == "DNN_with_Bayesian_Dropout":
         return x_internal
 
     def Simulator(x_in):
+        y_MC = Accumulator(N_Monte_Carlo_Samples)
         for i_MC in range(N_Monte_Carlo_Samples):
-            y_MC_loop = f_unknown(x_in)
-            if i_MC == 0:
-                y_MC = y_MC_loop
-            else:
-                y_MC = np.append(y_MC,y_MC_loop)
+            y_MC.append(f_unknown(x_in))
+        return y_MC.to_array()
+
+    # Define Batched Simulator
+    ## Draws one stack of dropout masks per Monte-Carlo sample and evaluates every input with one einsum per layer.
+    ## Note: Masks are applied to copies of the hidden weights; so dropped weights do not accumulate across samples.
+    ## Chunk Size: Number of Monte-Carlo samples drawn at once (caps peak memory); None means all.
+    Simulator_chunk_size = None
+    def Simulator_Batched(X_in,chunk_size=None):
+        X_in = np.array(X_in).reshape(-1,problem_dim)
+        if chunk_size is None:
+            chunk_size = N_Monte_Carlo_Samples
+        y_MC = np.zeros([X_in.shape[0],N_Monte_Carlo_Samples])
+        # Feature Map Layer (deterministic)
+        x_features = np.matmul(X_in,W_feature.T)
+        for i_MC_start in range(0,N_Monte_Carlo_Samples,chunk_size):
+            N_chunk = min(chunk_size,N_Monte_Carlo_Samples-i_MC_start)
+            x_internal = np.broadcast_to(x_features,(N_chunk,)+x_features.shape)
+            # Deep Layer(s)
+            for i in range(Depth_Bayesian_DNN):
+                # Apply Random Dropout
+                random_mask = np.ones([N_chunk,width,width])
+                random_mask_coordinates_i = np.random.choice(range(width),(N_chunk,N_Dropout))
+                random_mask_coordinates_j = np.random.choice(range(width),(N_chunk,N_Dropout))
+                random_mask[np.arange(N_chunk).reshape(-1,1),random_mask_coordinates_i,random_mask_coordinates_j] = 0
+                # Apply Dropped-out layer
+                x_internal = np.maximum(0,np.einsum('svw,snw->snv',W_hidden_list[i]*random_mask,x_internal))
+            # Readout Layer
+            y_MC[:,i_MC_start:(i_MC_start+N_chunk)] = np.einsum('w,snw->ns',W_readout[0],x_internal)
         return y_MC
 
 
@@ -695,25 +762,21 @@ if f_unknown_mode == "GD_with_randomized_input":
 
     # Initialize Target Function #
     #----------------------------#
-    # Initialize DNN to train
-    f_model = get_ffNN(width, Depth_Bayesian_DNN, 0.001, problem_dim, 1)
+    # One (independently initialized) DNN per Monte-Carlo sample; trained concurrently as a stacked ensemble.
+    ## Number of replicas trained at once (caps memory); None means all.
+    GD_chunk_size = None
+    ## One initialization seed per replica
+    GD_replica_seeds = np.random.SeedSequence(2021).generate_state(N_Monte_Carlo_Samples)
 
     # Define Stochastic Prediction Function:
-    def f_unknown():
-        f_model.fit(data_x,data_y_to_train_DNN_on,epochs = GD_epochs)
+    def f_unknown(replica_seeds):
+        # Initialize DNNs to train
+        f_model = get_ffNN_Stacked_Ensemble(width, Depth_Bayesian_DNN, 0.001, problem_dim, replica_seeds)
+        f_model.fit(data_x,np.repeat(data_y_to_train_DNN_on.reshape(-1,1),len(replica_seeds),axis=1),epochs = GD_epochs)
         f_x_trained_with_random_initialization_x_train = f_model.predict(X_train)
         f_x_trained_with_random_initialization_x_test = f_model.predict(X_test)
         return f_x_trained_with_random_initialization_x_train, f_x_trained_with_random_initialization_x_test
 
-    def Simulator(x_in):
-        for i_MC in range(N_Monte_Carlo_Samples):
-            y_MC_loop = f_unknown(x_in)
-            if i_MC == 0:
-                y_MC = y_MC_loop
-            else:
-                y_MC = np.append(y_MC,y_MC_loop)
-        return y_MC
-
 
 # ### Extreme Learning-Machine Version
 
@@ -724,12 +787,10 @@ if f_unknown_mode == "Extreme_Learning_Machine":
     # Auxiliary Initialization(s)
     Train_step_proportion = 1-train_test_ratio
     
-    # Vectorized Sigmoid
-    
-    # custom function
-    def sigmoid_univariate(x):
-        return 1 / (1 + math.exp(-x))
-    sigmoid = np.vectorize(sigmoid_univariate)
+    # Vectorized (Overflow-Safe) Sigmoid
+    from scipy.special import expit
+    def sigmoid(x):
+        return expit(x)
     
     # Get Data
     if dataset_option == "crypto":
@@ -883,13 +944,10 @@ if f_unknown_mode == "Extreme_Learning_Machine":
         return f_x_trained_with_random_initialization_x_train, f_x_trained_with_random_initialization_x_test
 
     def Simulator(x_in):
+        y_MC = Accumulator(N_Monte_Carlo_Samples)
         for i_MC in range(N_Monte_Carlo_Samples):
-            y_MC_loop = f_unknown(x_in)
-            if i_MC == 0:
-                y_MC = y_MC_loop
-            else:
-                y_MC = np.append(y_MC,y_MC_loop)
-        return y_MC
+            y_MC.append(f_unknown(x_in))
+        return y_MC.to_array()
 
 
 # ---
@@ -909,23 +967,16 @@ print("Simulating Output Data for given input data")
 
 
 if (f_unknown_mode != "Rough_SDE") and (f_unknown_mode != "GD_with_randomized_input") and (f_unknown_mode != 'Extreme_Learning_Machine'):
-    for i in tqdm(range(X_train.shape[0])):
-        # Put Datum
-        x_loop = X_train[i,]
-        # Product Monte-Carlo Sample for Input
-        y_loop = (Simulator(x_loop)).reshape(1,-1)
-
-        # Update Dataset
-        if i == 0:
-            Y_train = y_loop
-            Y_train_mean_emp = np.mean(y_loop)
-    #         Y_train_var_emp = np.mean((y_loop - np.mean(y_loop))**2)
-        else:
-            Y_train = np.append(Y_train,y_loop,axis=0)
-            Y_train_mean_emp = np.append(Y_train_mean_emp,np.mean(y_loop))
-    #         Y_train_var_emp = np.append(Y_train_var_emp,np.mean((y_loop - np.mean(y_loop))**2))
-    # Join mean and Variance Training Data
-#     Y_train_var_emp = np.append(Y_train_mean_emp.reshape(-1,1),Y_train_var_emp.reshape(-1,1),axis=1)
+    # Initialize (memory-mapped) Monte-Carlo Store
+    Y_train = Open_Monte_Carlo_Store("Y_train",[X_train.shape[0],N_Monte_Carlo_Samples])
+    # Simulate whole batch at once
+    if f_unknown_mode == "Heteroskedastic_NonLinear_Regression":
+        Y_train[:] = Simulator_Batched(X_train,reference_mode=Simulator_reference_mode)
+    else:
+        Y_train[:] = Simulator_Batched(X_train,chunk_size=Simulator_chunk_size)
+    # Read lazily from here on out
+    Y_train = Close_Monte_Carlo_Store("Y_train",Y_train)
+    Y_train_mean_emp = Monte_Carlo_Store_Row_Means(Y_train)
 
 
 # ### Testing:
@@ -937,18 +988,16 @@ if (f_unknown_mode != "Rough_SDE") and (f_unknown_mode != "GD_with_randomized_in
     # Start Timer
     Test_Set_PredictionTime_MC = time.time()
 
+    # Initialize (memory-mapped) Monte-Carlo Store
+    Y_test = Open_Monte_Carlo_Store("Y_test",[X_test.shape[0],N_Monte_Carlo_Samples])
     # Generate Data
-    for i in tqdm(range(X_test.shape[0])):
-        # Put Datum
-        x_loop = X_test[i,]
-        # Product Monte-Carlo Sample for Input
-        y_loop = (Simulator(x_loop)).reshape(1,-1)
-
-        # Update Dataset
-        if i == 0:
-            Y_test = y_loop
-        else:
-            Y_test = np.append(Y_test,y_loop,axis=0)
+    # Simulate whole batch at once
+    if f_unknown_mode == "Heteroskedastic_NonLinear_Regression":
+        Y_test[:] = Simulator_Batched(X_test,reference_mode=Simulator_reference_mode)
+    else:
+        Y_test[:] = Simulator_Batched(X_test,chunk_size=Simulator_chunk_size)
+    # Read lazily from here on out
+    Y_test = Close_Monte_Carlo_Store("Y_test",Y_test)
 
     # End Timer
     Test_Set_PredictionTime_MC = time.time() - Test_Set_PredictionTime_MC
@@ -966,42 +1015,30 @@ if (f_unknown_mode != "Rough_SDE") and (f_unknown_mode != "GD_with_randomized_in
 if f_unknown_mode == "GD_with_randomized_input":
     # Start Timer
     Test_Set_PredictionTime_MC = time.time()
-    for j_MC in range(N_Monte_Carlo_Samples):
-        # MC of SGD
-        Y_train_loop,Y_test_loop = f_unknown()
+    # Initialize (memory-mapped) Monte-Carlo Store(s)
+    Y_train = Open_Monte_Carlo_Store("Y_train",[X_train.shape[0],N_Monte_Carlo_Samples])
+    Y_test = Open_Monte_Carlo_Store("Y_test",[X_test.shape[0],N_Monte_Carlo_Samples])
+    if GD_chunk_size is None:
+        GD_chunk_size = N_Monte_Carlo_Samples
+    for j_MC in tqdm(range(0,N_Monte_Carlo_Samples,GD_chunk_size)):
+        # MC of SGD (all replicas in chunk at once)
+        Y_train_loop,Y_test_loop = f_unknown(GD_replica_seeds[j_MC:(j_MC+GD_chunk_size)])
         # Update Dataset
-        if j_MC == 0:
-            Y_train = Y_train_loop
-            Y_test = Y_test_loop
-        else:
-            Y_train = np.append(Y_train,Y_train_loop,axis=1)
-            Y_test = np.append(Y_test,Y_test_loop,axis=1)
+        Y_train[:,j_MC:(j_MC+GD_chunk_size)] = Y_train_loop
+        Y_test[:,j_MC:(j_MC+GD_chunk_size)] = Y_test_loop
+    # Read lazily from here on out
+    Y_train = Close_Monte_Carlo_Store("Y_train",Y_train)
+    Y_test = Close_Monte_Carlo_Store("Y_test",Y_test)
     # End Timer
     Test_Set_PredictionTime_MC = time.time() - Test_Set_PredictionTime_MC
     
 ## Get means for mean-prediction models
     ## Training
-    for i in tqdm(range(X_train.shape[0])):
-        # Product Monte-Carlo Sample for Input
-        y_loop = Y_train[i,]
-
-        # Update Dataset
-        if i == 0:
-            Y_train_mean_emp = np.mean(y_loop)
-        else:
-            Y_train_mean_emp = np.append(Y_train_mean_emp,np.mean(y_loop))
+    Y_train_mean_emp = Monte_Carlo_Store_Row_Means(Y_train)
     ## Testing
     ### Continue Timer
     Test_Set_PredictionTime_MC2 = time.time()
-    for i in tqdm(range(X_test.shape[0])):
-        # Product Monte-Carlo Sample for Input
-        y_loop_test = Y_test[i,]
-
-        # Update Dataset
-        if i == 0:
-            Y_test_mean_emp = np.mean(y_loop_test)
-        else:
-            Y_test_mean_emp = np.append(Y_test_mean_emp,np.mean(y_loop_test))
+    Y_test_mean_emp = Monte_Carlo_Store_Row_Means(Y_test)
     
     # End Timer
     Test_Set_PredictionTime_MC = (time.time() - Test_Set_PredictionTime_MC2) + Test_Set_PredictionTime_MC
@@ -1017,102 +1054,89 @@ if f_unknown_mode == 'Extreme_Learning_Machine':
     # Timer(s)
     Test_time_elapse = 0
     Train_time_elapse = 0
-    # Features
-    X_train_rand_features = X_train
-    X_test_rand_features = X_test
-
-    for j_loop in tqdm(range(N_Monte_Carlo_Samples)):
+    # Number of Monte-Carlo samples (i.e. random feature draws) to process at once; None means all.
+    ELM_chunk_size = None
+    if ELM_chunk_size is None:
+        ELM_chunk_size = N_Monte_Carlo_Samples
+    # Inputs and Targets (dense throughout)
+    X_train_ELM = np.array(X_train,dtype=float)
+    X_test_ELM = np.array(X_test,dtype=float)
+    y_train_ELM = np.array(data_y,dtype=float).reshape(-1,)
+    y_train_ELM_mean = np.mean(y_train_ELM)
+    # Initialize (memory-mapped) Monte-Carlo Store(s)
+    Y_train = Open_Monte_Carlo_Store("Y_train",[X_train_ELM.shape[0],N_Monte_Carlo_Samples])
+    Y_test = Open_Monte_Carlo_Store("Y_test",[X_test_ELM.shape[0],N_Monte_Carlo_Samples])
+
+    # Random Feature Map (all draws in chunk at once)
+    def ELM_Random_Features(X_in,Weights_rand,biases_rand):
+        # Apply Random (hidden) Weights and Biases
+        X_rand_features = np.matmul(X_in,Weights_rand) + biases_rand
+        # Apply Activation function
+        if activation_function == 'thresholding':
+            return (X_rand_features>0).astype(float)
+        return sigmoid(X_rand_features)
+
+    for j_start in tqdm(range(0,N_Monte_Carlo_Samples,ELM_chunk_size)):
+        N_chunk = min(ELM_chunk_size,N_Monte_Carlo_Samples-j_start)
         #--------------------#
         ## Perform Learning ##
-        #--------------------#    
+        #--------------------#
+        # Every Monte-Carlo sample draws its own features starting from the (original) inputs
+        X_train_rand_features = np.broadcast_to(X_train_ELM,(N_chunk,)+X_train_ELM.shape)
+        X_test_rand_features = np.broadcast_to(X_test_ELM,(N_chunk,)+X_test_ELM.shape)
         for d_loop in range(Depth_Bayesian_DNN):
-            # Timer
-            Update_train_time_elapse = time.time()
             # Get Random Features
             #---------------------------------------------------------------------------------------------------#
-            Weights_rand = randsp(m=(X_train_rand_features.shape[1]),n=N_Random_Features,density = 0.75)
-            biases_rand = np.random.uniform(low=-.5,high=.5,size = N_Random_Features)
-            ## Get Random Features
-            #---------------------------------------------------------------------------------------------------#
+            Weights_rand = np.array([randsp(m=(X_train_rand_features.shape[-1]),n=N_Random_Features,density = 0.75).toarray() for j_loop in range(N_chunk)])
+            biases_rand = np.random.uniform(low=-.5,high=.5,size = (N_chunk,1,N_Random_Features))
             ### Training
-            #### Apply Random (hidden) Weights
-            X_train_rand_features = sparse.csr_matrix.dot(X_train_rand_features,Weights_rand)
-            #### Apply Random (hidden) Biases
-            X_train_rand_features = X_train_rand_features + biases_rand
-            #### Apply Discontinuous (Step) Activation function
-            if activation_function == 'thresholding':
-                X_train_rand_features[X_train_rand_features>0] = 1
-                X_train_rand_features[X_train_rand_features<=0] = 0
-            else:
-                X_train_rand_features = sigmoid(X_train_rand_features)
-            #### Compress
-            X_train_rand_features = sparse.csr_matrix(X_train_rand_features)
-            # TIMER
-            Update_train_time_elapse = time.time() - Update_train_time_elapse
-            Train_time_elapse = Train_time_elapse + Update_train_time_elapse
-            #---------------------------------------------------------------------------------------------------#
+            Update_train_time_elapse = time.time()
+            X_train_rand_features = ELM_Random_Features(X_train_rand_features,Weights_rand,biases_rand)
+            Train_time_elapse = Train_time_elapse + (time.time() - Update_train_time_elapse)
             ### Testing
-
-            # TIMER
             Update_test_time_elapse = time.time()
-
-            #### Apply Random (hidden) Weights
-            X_test_rand_features = sparse.csr_matrix.dot(X_test_rand_features,Weights_rand) 
-            #### Apply Random (hidden) Biases
-            X_test_rand_features = X_test_rand_features + biases_rand
-            #### Apply Discontinuous (Step) Activation function
-            if activation_function == 'thresholding':
-                X_test_rand_features[X_test_rand_features>0] = 1
-                X_test_rand_features[X_test_rand_features<=0] = 0
-            else:
-                X_test_rand_features = sigmoid(X_test_rand_features)
-            #### Compress
-            X_train_rand_features = sparse.csr_matrix(X_train_rand_features)
-
-            # TIMER
-            Update_test_time_elapse = time.time() - Update_test_time_elapse
-            Test_time_elapse = Test_time_elapse + Update_test_time_elapse
+            X_test_rand_features = ELM_Random_Features(X_test_rand_features,Weights_rand,biases_rand)
+            Test_time_elapse = Test_time_elapse + (time.time() - Update_test_time_elapse)
 
         #---------------------------------------------------------------------------------------------------#
-        # Timer
+        # Train Extreme Learning Machines (one Ridge readout per sample; all solved in one batched call)
         Update_train_time_elapse = time.time()
-        # Train Extreme Learning Machine
-        ExLM_reg = Ridge(alpha=(np.random.uniform(low=0,high=1,size=1)[0]))
-        ExLM_reg.fit(X_train_rand_features,data_y)
+        ridge_penalties = np.random.uniform(low=0,high=1,size=N_chunk).reshape(-1,1,1)
+        ## Center (Ridge fits an intercept)
+        X_train_rand_features_mean = np.mean(X_train_rand_features,axis=1,keepdims=True)
+        X_train_centered = X_train_rand_features - X_train_rand_features_mean
+        y_train_centered = (y_train_ELM - y_train_ELM_mean).reshape(1,-1,1)
+        ## Solve Normal Equations (primal or dual form; whichever system is smaller)
+        if X_train_centered.shape[-1] <= X_train_centered.shape[1]:
+            Gram = np.matmul(np.swapaxes(X_train_centered,1,2),X_train_centered)
+            Gram = Gram + ridge_penalties*np.eye(Gram.shape[-1])
+            ExLM_coefficients = np.linalg.solve(Gram,np.matmul(np.swapaxes(X_train_centered,1,2),y_train_centered))
+        else:
+            Gram = np.matmul(X_train_centered,np.swapaxes(X_train_centered,1,2))
+            Gram = Gram + ridge_penalties*np.eye(Gram.shape[-1])
+            ExLM_coefficients = np.matmul(np.swapaxes(X_train_centered,1,2),np.linalg.solve(Gram,np.broadcast_to(y_train_centered,(N_chunk,)+y_train_centered.shape[1:])))
+        ExLM_intercepts = y_train_ELM_mean - np.matmul(X_train_rand_features_mean,ExLM_coefficients)
         # Get Predictions
         ## Training Set
-        ExLM_predict_train = ExLM_reg.predict(X_train_rand_features)
-        # TIMER
-        Update_train_time_elapse = time.time() - Update_train_time_elapse
-        Train_time_elapse = Train_time_elapse + Update_train_time_elapse
-
+        Y_train[:,j_start:(j_start+N_chunk)] = (np.matmul(X_train_rand_features,ExLM_coefficients) + ExLM_intercepts)[:,:,0].T
+        Train_time_elapse = Train_time_elapse + (time.time() - Update_train_time_elapse)
 
-
-        # TIMER
-        Update_test_time_elapse = time.time()
         ## Get Test-Set Prediction(s)
-        ExLM_predict_test = ExLM_reg.predict(X_test_rand_features)
-        # TIMER
-        Update_test_time_elapse = time.time() - Update_test_time_elapse
-        Test_time_elapse = Test_time_elapse + Update_test_time_elapse
-
+        Update_test_time_elapse = time.time()
+        Y_test[:,j_start:(j_start+N_chunk)] = (np.matmul(X_test_rand_features,ExLM_coefficients) + ExLM_intercepts)[:,:,0].T
+        Test_time_elapse = Test_time_elapse + (time.time() - Update_test_time_elapse)
 
-        # Update Prediction(s) #
-        #----------------------#
-        if j_loop == 0:
-            Y_train = ExLM_predict_train
-            Y_test = ExLM_predict_test
-        else:
-            Y_train = np.append(Y_train,ExLM_predict_train,axis=1)
-            Y_test = np.append(Y_test,ExLM_predict_test,axis=1)
+    # Read lazily from here on out
+    Y_train = Close_Monte_Carlo_Store("Y_train",Y_train)
+    Y_test = Close_Monte_Carlo_Store("Y_test",Y_test)
         
     # Update MC Training Time
     Train_Set_PredictionTime_MC = Train_time_elapse
     Test_Set_PredictionTime_MC = Test_time_elapse
     
     # Get Mean Training Data
-    Y_train_mean_emp = np.mean(Y_train,axis=1)
-    Y_test_mean_emp = np.mean(Y_test,axis=1)
+    Y_train_mean_emp = Monte_Carlo_Store_Row_Means(Y_train)
+    Y_test_mean_emp = Monte_Carlo_Store_Row_Means(Y_test)
 
 
 # ## Prepare Data for (f)SDE Case
@@ -1123,6 +1147,9 @@ if f_unknown_mode == 'Extreme_Learning_Machine':
 
 
 if f_unknown_mode == "Rough_SDE":
+    # Initialize Accumulator(s)
+    X_train = Accumulator(x_train.shape[0],axis=0)
+    Y_train = Accumulator(x_train.shape[0],axis=0)
     for x_i in tqdm(range(x_train.shape[0])):
         # Extrain current initial condition
         x_init_loop = x_train[x_i,]
@@ -1130,16 +1157,10 @@ if f_unknown_mode == "Rough_SDE":
         X_inputs_to_return_loop, x_sample_path_loop = Simulator(x_init_loop)
 
         # Update Training dataset (both input(s) and output(s))
-        if x_i == 0:
-            # Update Input(s)
-            X_train = X_inputs_to_return_loop
-            # Update Output(s)
-            Y_train = x_sample_path_loop
-        else:
-            # Update Input(s)
-            X_train = np.append(X_train,X_inputs_to_return_loop,axis=0)
-            # Update Output(s)
-            Y_train = np.append(Y_train,x_sample_path_loop,axis=0)
+        X_train.append(X_inputs_to_return_loop)
+        Y_train.append(x_sample_path_loop)
+    X_train = X_train.to_array()
+    Y_train = Y_train.to_array()
     # Get Mean Training Data
     Y_train_mean_emp = np.mean(Y_train,axis=1)
 
@@ -1152,23 +1173,20 @@ if f_unknown_mode == "Rough_SDE":
 if f_unknown_mode == "Rough_SDE":
     # End Timer
     Test_Set_PredictionTime_MC = time.time()
+    # Initialize Accumulator(s)
+    X_test = Accumulator(x_test.shape[0],axis=0)
+    Y_test = Accumulator(x_test.shape[0],axis=0)
     for x_i in tqdm(range(x_test.shape[0])):
         # Extrain current initial condition
         x_init_loop = x_test[x_i,]
         # Monte-Carlo Simulate
         X_inputs_to_return_loop, x_sample_path_loop = Simulator(x_init_loop)
-        
-        # Update Training dataset (both input(s) and output(s))
-        if x_i == 0:
-            # Update Input(s)
-            X_test = X_inputs_to_return_loop
-            # Update Output(s)
-            Y_test = x_sample_path_loop
-        else:
-            # Update Input(s)
-            X_test = np.append(X_test,X_inputs_to_return_loop,axis=0)
-            # Update Output(s)
-            Y_test = np.append(Y_test,x_sample_path_loop,axis=0)
+
+        # Update Testing dataset (both input(s) and output(s))
+        X_test.append(X_inputs_to_return_loop)
+        Y_test.append(x_sample_path_loop)
+    X_test = X_test.to_array()
+    Y_test = Y_test.to_array()
     # Get Testing Mean Data
     Y_test_mean_emp = np.mean(Y_test,axis=1)
     # End Timer
@@ -1200,6 +1218,31 @@ print("----------------------------------")
 Train_Set_PredictionTime_MC = time.time() - Train_Set_PredictionTime_MC
 
 
+# ## Noiseless Part of the Oracle
+# *(When applicable)*: $f$ at the training and testing inputs; computed here (and not downstream) so it is part of the dataset cache.
+#
+# In the heteroskedastic case, the moments of $Y_x = \cos(f(x)) + \text{Laplace}(0,\|x\|)$ are also known in closed-form: mean $\cos(f(x))$, variance $2\|x\|^2$, skewness $0$ and excess kurtosis $3$.  Otherwise (None), the evaluator uses those of the Monte-Carlo oracle.
+
+# In[ ]:
+
+
+if (f_unknown_mode == "Heteroskedastic_NonLinear_Regression") or (f_unknown_mode == "DNN_with_Random_Weights") or (f_unknown_mode == "DNN_with_Bayesian_Dropout"):
+    direct_facts = np.apply_along_axis(f_unknown, 1, X_train)
+    direct_facts_test = np.apply_along_axis(f_unknown, 1, X_test)
+
+# Ground-Truth Moment(s)
+Oracle_Moments_train, Oracle_Moments_test = None, None
+if f_unknown_mode == "Heteroskedastic_NonLinear_Regression":
+    Oracle_Moments_train = {'Mu':np.cos(direct_facts),
+                            'Var':2*np.sum(np.asarray(X_train)**2,axis=1),
+                            'Skewness':0,
+                            'Ex_Kurtosis':3}
+    Oracle_Moments_test = {'Mu':np.cos(direct_facts_test),
+                           'Var':2*np.sum(np.asarray(X_test)**2,axis=1),
+                           'Skewness':0,
+                           'Ex_Kurtosis':3}
+
+
 # ---
 
 # # Fin
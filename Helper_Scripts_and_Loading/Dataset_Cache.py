@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Dataset Cache
+# Content-addressed cache for the simulated (or parsed) datasets.
+#
+# The key is a hash of:
+# - the experiment's configuration (f_unknown_mode, problem_dim, N_train_size, N_Monte_Carlo_Samples, Hurst exponent, etc...),
+# - the state of the random number generator(s) just before simulating; i.e.: the seeds,
+# - the source code of the simulators (and of every script they exec) and of the user-defined dynamics (alpha and beta).
+#
+# **Note:** *A re-run which only changes the classifier's hyperparameters, or a benchmark, has the same key; so simulation is skipped and the cached arrays are (lazily) memory-mapped back in.  The random number generator is also restored to its post-simulation state; so everything downstream behaves exactly as if the data had been re-simulated.*
+
+# In[ ]:
+
+
+import hashlib
+import inspect
+import re
+
+
+# In[ ]:
+
+
+# Toggle (Override in main script if desired)
+Use_Dataset_Cache = True
+# Path to Cache
+Dataset_Cache_path = "./inputs/data/Dataset_Cache/"
+
+# Configuration Parameter(s) defining a dataset
+Dataset_Cache_parameters = ['f_unknown_mode','problem_dim','N_train_size','train_test_ratio','N_Monte_Carlo_Samples','N_Monte_Carlo_Samples_Test',
+                            'Hurst_Exponent','N_Euler_Maruyama_Steps','T_end','T_end_test','delta','Max_Grid','x_0','N_Grid_Finess',
+                            'N_Quantizers_to_parameterize','Proportion_per_cluster','width','Depth_Bayesian_DNN','N_Random_Features',
+                            'Dropout_rate','activation_function','dataset_option','GD_epochs','uniform_noise_level']
+# Source(s) of the simulators (the scripts they exec are added by get_Dataset_Cache_sources)
+Dataset_Cache_sources = ['./Helper_Scripts_and_Loading/Data_Simulator_and_Parser.py',
+                         './Fractional_SDE/fractional_SDE_Simulator.py',
+                         './Fractional_SDE/Data_Simulator_and_Parser___fractional_SDE.py']
+# Output(s) of the simulators (used downstream)
+Dataset_Cache_outputs = ['X_train','X_test','Y_train','Y_test','Y_train_mean_emp','Y_test_mean_emp',
+                         'Train_Set_PredictionTime_MC','Test_Set_PredictionTime_MC',
+                         'output_dim','problem_dim','N_test_size','N_Monte_Carlo_Samples_Test',
+                         'Train_classes','Barycenters_Array','N_Quantizers_to_parameterize',
+                         'data_x','data_x_test','data_y','data_y_test',
+                         'direct_facts','direct_facts_test','Oracle_Moments_train','Oracle_Moments_test']
+
+
+# #### Key
+
+# In[ ]:
+
+
+# Simulator source(s) and (recursively) every script they exec; in a fixed order
+def get_Dataset_Cache_sources():
+    sources, pending_sources = [], list(Dataset_Cache_sources)
+    while len(pending_sources) > 0:
+        source_file = os.path.normpath(pending_sources.pop(0))
+        if source_file in sources:
+            continue
+        sources.append(source_file)
+        if os.path.exists(source_file):
+            with open(source_file) as source_file_reader:
+                source_code = source_file_reader.read()
+            pending_sources += re.findall(r"^[ \t]*exec\(open\(['\"]([^'\"]+)['\"]\)",source_code,flags=re.MULTILINE)
+    return sources
+
+def get_Dataset_Cache_Key():
+    key_hasher = hashlib.sha256()
+    # Configuration
+    configuration = {parameter_name:repr(globals()[parameter_name]) for parameter_name in Dataset_Cache_parameters if parameter_name in globals()}
+    key_hasher.update(json.dumps(configuration,sort_keys=True).encode())
+    # Seed(s): i.e. the current state of the random number generator(s)
+    key_hasher.update(pickle.dumps(np.random.get_state()))
+    key_hasher.update(pickle.dumps(random.getstate()))
+    # Simulator Source(s)
+    for source_file in get_Dataset_Cache_sources():
+        key_hasher.update(source_file.encode())
+        if os.path.exists(source_file):
+            with open(source_file,"rb") as source_file_reader:
+                key_hasher.update(source_file_reader.read())
+    # User-defined Dynamics
+    for dynamics_name in ['alpha','beta']:
+        if dynamics_name in globals():
+            try:
+                key_hasher.update(inspect.getsource(globals()[dynamics_name]).encode())
+            except (OSError, TypeError):
+                key_hasher.update(globals()[dynamics_name].__code__.co_code)
+    return key_hasher.hexdigest()
+
+
+# #### Save
+
+# In[ ]:
+
+
+def Save_Dataset_Cache(cache_key):
+    if not Use_Dataset_Cache:
+        return None
+    cache_folder = Dataset_Cache_path+cache_key+"/"
+    Path(cache_folder).mkdir(parents=True, exist_ok=True)
+    # Write Arrays (individually; so they can be memory-mapped back in) and everything else (in one pickle)
+    cached_objects = {}
+    for output_name in Dataset_Cache_outputs:
+        if output_name in globals():
+            if isinstance(globals()[output_name],np.ndarray):
+                np.save(cache_folder+output_name+".npy",globals()[output_name])
+            else:
+                cached_objects[output_name] = globals()[output_name]
+    cached_objects['__random_states__'] = (np.random.get_state(),random.getstate())
+    # Write objects last; marks the cache entry as complete
+    with open(cache_folder+"objects.pkl","wb") as cache_writer:
+        pickle.dump(cached_objects,cache_writer)
+
+
+# #### Load
+# Returns True (and populates the dataset) on a cache-hit and False otherwise.
+
+# In[ ]:
+
+
+def Load_Dataset_Cache(cache_key):
+    cache_folder = Dataset_Cache_path+cache_key+"/"
+    if (not Use_Dataset_Cache) or (not os.path.exists(cache_folder+"objects.pkl")):
+        return False
+    # Read Objects
+    with open(cache_folder+"objects.pkl","rb") as cache_reader:
+        cached_objects = pickle.load(cache_reader)
+    numpy_random_state, python_random_state = cached_objects.pop('__random_states__')
+    globals().update(cached_objects)
+    # Read Arrays (lazily)
+    for output_name in Dataset_Cache_outputs:
+        if os.path.exists(cache_folder+output_name+".npy"):
+            globals()[output_name] = np.load(cache_folder+output_name+".npy",mmap_mode="r")
+    # Resume Random Number Generator(s) as if simulated
+    np.random.set_state(numpy_random_state)
+    random.setstate(python_random_state)
+    return True
+
+
+# ---
+# # Fin
+# ---
@@ -54,7 +54,8 @@ from sklearn.ensemble import *
 from sklearn.gaussian_process import *
 
 # Learning
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.neighbors import KDTree, BallTree
 
 # Optimal Transport
 import ot
@@ -248,7 +249,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import GridSearchCV, RepeatedStratifiedKFold
 
 # Linear Algebra
-from scipy.linalg import expm
+from scipy.linalg import expm, solve_triangular, cho_solve
 
 # Model(s)
 ## Basic Model(s)
@@ -17,6 +17,18 @@ exec(open('./Helper_Scripts_and_Loading/Helper_Functions.py').read())
 exec(open('./Helper_Scripts_and_Loading/Benchmarks_Model_Builder.py').read())
 # Auxiliary Helper Function(s)
 exec(open('./Helper_Scripts_and_Loading/MISC_HELPER_FUNCTIONS.py').read())
+# (Memory-mapped) Monte-Carlo Store
+exec(open('./Helper_Scripts_and_Loading/Monte_Carlo_Store.py').read())
+# Per-row Monte-Carlo Statistic(s)
+exec(open('./Helper_Scripts_and_Loading/Monte_Carlo_Statistics.py').read())
+# (Content-addressed) Dataset Cache
+exec(open('./Helper_Scripts_and_Loading/Dataset_Cache.py').read())
+# (Linear-time) Accumulator
+exec(open('./Helper_Scripts_and_Loading/Accumulator.py').read())
+# Batched Transport Kernel(s)
+exec(open('./Helper_Scripts_and_Loading/Transport_Kernels.py').read())
+# (Batched) Metric Evaluator
+exec(open('./Helper_Scripts_and_Loading/Metric_Evaluator.py').read())
 # Import time separately
 import time
 #os.environ['CUDA_VISIBLE_DEVICES'] = '0'
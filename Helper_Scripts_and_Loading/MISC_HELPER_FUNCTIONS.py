@@ -17,3 +17,162 @@ def minimum_height_updater(list_input):
     # Return Minimum Width Network
     return list_input
 
+
+# #### Nearest Training Point(s)
+# Maps every query point (e.g. a K-Means center) to the index of its nearest training point; using one batched query of a spatial index (KD-tree in low dimensions and ball-tree otherwise) instead of a full distance computation per query.
+#
+# If unique is True, no training point is selected twice: queries are served greedily (closest first) and a query whose nearest point is already taken falls back to its next-nearest free point.
+
+# In[ ]:
+
+
+def get_nearest_training_indices(X_reference, X_query, metric="manhattan", unique=False, leaf_size=40):
+    X_reference = np.asarray(X_reference,dtype=float).reshape(X_reference.shape[0],-1)
+    X_query = np.asarray(X_query,dtype=float).reshape(X_query.shape[0],-1)
+    N_reference, N_query = X_reference.shape[0], X_query.shape[0]
+    if unique and (N_query > N_reference):
+        raise ValueError("Cannot select "+str(N_query)+" distinct points out of "+str(N_reference)+".")
+
+    # Build Spatial Index
+    if X_reference.shape[1] <= 20:
+        spatial_index = KDTree(X_reference, leaf_size=leaf_size, metric=metric)
+    else:
+        spatial_index = BallTree(X_reference, leaf_size=leaf_size, metric=metric)
+
+    # Nearest Point(s) (one batched query)
+    if not unique:
+        return spatial_index.query(X_query, k=1, return_distance=False).reshape(-1,)
+
+    # Nearest Distinct Point(s)
+    k_neighbours = int(min(N_reference,8))
+    selected_indices = -np.ones(N_query,dtype=int)
+    taken = np.zeros(N_reference,dtype=bool)
+    unresolved = np.arange(N_query)
+    while unresolved.shape[0] > 0:
+        distances, neighbours = spatial_index.query(X_query[unresolved], k=k_neighbours)
+        # Serve closest queries first
+        for i_query in np.argsort(distances[:,0],kind="stable"):
+            free_neighbours = neighbours[i_query][~taken[neighbours[i_query]]]
+            if free_neighbours.shape[0] > 0:
+                selected_indices[unresolved[i_query]] = free_neighbours[0]
+                taken[free_neighbours[0]] = True
+        # Widen the search for queries whose k nearest points were all taken
+        unresolved = unresolved[selected_indices[unresolved] < 0]
+        k_neighbours = int(min(N_reference,2*k_neighbours))
+    return selected_indices
+
+
+# #### Streaming Quantizer
+# Quantizes the input space with [mini-batch K-Means](https://dl.acm.org/doi/10.1145/1772690.1772862): the data is streamed in chunks of batch_size points (for n_passes shuffled passes) and the labels are then predicted chunk-by-chunk; so memory stays bounded by the batch size and the number of clusters.
+#
+# Returns the labels of each datum and the cluster centers.
+
+# In[ ]:
+
+
+def get_streaming_quantization(X_in, n_clusters, batch_size=1024, n_passes=3, random_state=0):
+    N_data = X_in.shape[0]
+    n_clusters = int(min(n_clusters,N_data))
+    quantizer = MiniBatchKMeans(n_clusters=n_clusters,
+                                batch_size=batch_size,
+                                n_init=1,
+                                random_state=random_state)
+    # The first chunk must contain (at-least) one point per cluster to initialize the centers
+    first_chunk_size = int(max(batch_size,n_clusters))
+    shuffler = np.random.RandomState(random_state)
+    for i_pass in range(n_passes):
+        permutation = shuffler.permutation(N_data)
+        if i_pass == 0:
+            chunk_bounds = [(0,first_chunk_size)]+[(i_start,i_start+batch_size) for i_start in range(first_chunk_size,N_data,batch_size)]
+        else:
+            chunk_bounds = [(i_start,i_start+batch_size) for i_start in range(0,N_data,batch_size)]
+        for i_start, i_end in chunk_bounds:
+            quantizer.partial_fit(X_in[np.sort(permutation[i_start:i_end])])
+    # Label (chunk-by-chunk)
+    labels = np.zeros(N_data,dtype=int)
+    for i_start in range(0,N_data,batch_size):
+        labels[i_start:(i_start+batch_size)] = quantizer.predict(X_in[i_start:(i_start+batch_size)])
+    return labels, quantizer.cluster_centers_
+
+
+# #### Batched (1D) Gaussian Mixtures
+# Fits an n_components Gaussian mixture to every row of Y_in (i.e. to each row's Monte-Carlo samples) with the EM algorithm; all rows at once, as (rows, samples, components) tensors.
+# - Initialization: each row's sorted samples are split into n_components blocks of (nearly) equal counts, refined by a few (batched) 1D K-Means iterations; the blocks' means, variances and proportions (as sklearn's default K-Means initialization).
+# - Each row stops as soon as the change in its mean log-likelihood is below tol (as in sklearn's GaussianMixture); converged rows are retired from the batch.
+#
+# Returns the means, variances and mixture weights; each of shape (rows, n_components) and with the components sorted by their means.
+
+# In[ ]:
+
+
+def get_gaussian_mixture_log_likelihoods(Y_chunk, means, variances, weights):
+    # Log-density of each sample under each (weighted) component: (rows, samples, components)
+    log_densities = (np.log(weights)[:,np.newaxis,:]
+                     - 0.5*np.log(2*np.pi*variances)[:,np.newaxis,:]
+                     - 0.5*((Y_chunk[:,:,np.newaxis]-means[:,np.newaxis,:])**2)/variances[:,np.newaxis,:])
+    log_normalizers = np.max(log_densities,axis=2,keepdims=True)
+    log_normalizers = log_normalizers + np.log(np.sum(np.exp(log_densities-log_normalizers),axis=2,keepdims=True))
+    return log_densities - log_normalizers, np.mean(log_normalizers[:,:,0],axis=1)
+
+def get_gaussian_mixture_initialization(Y_chunk, n_components, reg_covar=1e-6, n_lloyd_iterations=10):
+    # Blocks of (nearly) equal counts of the sorted samples
+    Y_sorted = np.sort(Y_chunk,axis=1)
+    block_labels = (np.arange(Y_sorted.shape[1])*n_components)//Y_sorted.shape[1]
+    block_indicators = np.broadcast_to((block_labels[:,np.newaxis] == np.arange(n_components)[np.newaxis,:]),Y_sorted.shape+(n_components,))
+    # Refined by a few (batched) 1D K-Means (Lloyd) iterations
+    for i_iteration in range(n_lloyd_iterations+1):
+        block_counts = np.sum(block_indicators,axis=1)
+        means_new = np.sum(block_indicators*Y_sorted[:,:,np.newaxis],axis=1)/np.maximum(block_counts,1)
+        means = means_new if (i_iteration == 0) else np.where(block_counts > 0,means_new,means)
+        if i_iteration < n_lloyd_iterations:
+            block_labels = np.argmin(np.abs(Y_sorted[:,:,np.newaxis]-means[:,np.newaxis,:]),axis=2)
+            block_indicators = (block_labels[:,:,np.newaxis] == np.arange(n_components)[np.newaxis,np.newaxis,:])
+    # Block moments and proportions
+    block_counts = np.maximum(block_counts,1)
+    variances = np.sum(block_indicators*((Y_sorted[:,:,np.newaxis]-means[:,np.newaxis,:])**2),axis=1)/block_counts + reg_covar
+    weights = block_counts/np.sum(block_counts,axis=1,keepdims=True)
+    return means, variances, weights
+
+def fit_gaussian_mixtures_EM(Y_chunk, means, variances, weights, max_iter=100, tol=1e-3, reg_covar=1e-6):
+    means, variances, weights = means.copy(), variances.copy(), weights.copy()
+    active = np.arange(Y_chunk.shape[0])
+    log_likelihoods_previous = np.full(Y_chunk.shape[0],-np.inf)
+    for i_iteration in range(max_iter):
+        Y_active = Y_chunk[active]
+        # E-Step
+        log_responsibilities, log_likelihoods = get_gaussian_mixture_log_likelihoods(Y_active,means[active],variances[active],weights[active])
+        responsibilities = np.exp(log_responsibilities)
+        # M-Step
+        component_counts = np.sum(responsibilities,axis=1) + 10*np.finfo(float).eps
+        means[active] = np.sum(responsibilities*Y_active[:,:,np.newaxis],axis=1)/component_counts
+        variances[active] = np.sum(responsibilities*((Y_active[:,:,np.newaxis]-means[active][:,np.newaxis,:])**2),axis=1)/component_counts + reg_covar
+        weights[active] = component_counts/np.sum(component_counts,axis=1,keepdims=True)
+        # Retire converged rows
+        converged = np.abs(log_likelihoods-log_likelihoods_previous[active]) < tol
+        log_likelihoods_previous[active] = log_likelihoods
+        active = active[~converged]
+        if active.shape[0] == 0:
+            break
+    return means, variances, weights
+
+def get_batched_gaussian_mixtures(Y_in, n_components, max_iter=100, tol=1e-3, reg_covar=1e-6, chunk_size=None):
+    N_rows = Y_in.shape[0]
+    N_samples = int(np.prod(Y_in.shape[1:]))
+    n_components = int(n_components)
+    if chunk_size is None:
+        chunk_size = int(max(1,(10**7)//(N_samples*n_components)))
+    means = np.zeros((N_rows,n_components))
+    variances = np.zeros((N_rows,n_components))
+    weights = np.zeros((N_rows,n_components))
+
+    # Fit (chunk-by-chunk)
+    for i_start in range(0,N_rows,chunk_size):
+        rows_chunk = np.arange(i_start,min(i_start+chunk_size,N_rows))
+        Y_chunk = np.asarray(Y_in[rows_chunk],dtype=float).reshape(rows_chunk.shape[0],N_samples)
+        means_init, variances_init, weights_init = get_gaussian_mixture_initialization(Y_chunk,n_components,reg_covar)
+        means[rows_chunk], variances[rows_chunk], weights[rows_chunk] = fit_gaussian_mixtures_EM(Y_chunk,means_init,variances_init,weights_init,
+                                                                                                   max_iter=max_iter,tol=tol,reg_covar=reg_covar)
+
+    # Sort Components (by their means)
+    component_order = np.argsort(means,axis=1)
+    return np.take_along_axis(means,component_order,axis=1), np.take_along_axis(variances,component_order,axis=1), np.take_along_axis(weights,component_order,axis=1)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Metric Evaluator
+# One (batched) evaluator shared by every model: DNM, MDN, Gaussian and point-mass benchmarks.
+#
+# A model's predictions are passed as a *predictive law*; i.e. one of:
+# - get_atomic_law: atoms (shared (A,) / (A,d), or per row (N,A) / (N,A,d)) plus a weights matrix (N,A); if repeats > 1 then each weight is spread uniformly over that many consecutive atoms (e.g. the DNM's class-probabilities over the Monte-Carlo samples of each barycenter),
+# - get_gaussian_law: (mixtures of) Gaussians; means and variances (N,K) in 1D (with mixture weights (N,K)) or means (N,d) and covariances ((N,), (N,d) or (N,d,d)) in multi-D,
+# - get_dirac_law: point predictions (N,d).
+#
+# get_predictive_errors then computes every metric (W1, mean, variance, skewness, excess kurtosis) for every row; against the cached Monte-Carlo statistics of the targets (see Monte_Carlo_Statistics.py) and, if known, the ground-truth moments.
+#
+# **Note:** *Rows are processed in chunks (bounding the memory held at once); the chunks can be spread over n_jobs threads (numpy releases the GIL for the heavy operations).  In 1D, the transport error of a Gaussian (mixture) law is computed analytically from its CDF and quantile function (Gaussian_W1_mode="Analytic"; the default).  Otherwise (multi-D, or Gaussian_W1_mode="Sampled") Gaussian laws are sampled (N_samples per component) with one random stream per chunk; seeded from the global random number generator, so the results do not depend on n_jobs.*
+
+# In[ ]:
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+# In[ ]:
+
+
+# Multi-dimensional transport error: "Sliced" (sliced Wasserstein) or "Sinkhorn" (entropic; with regularization Evaluation_Sinkhorn_regularization) (Override in main script if desired)
+Evaluation_OT_method = globals().get("Evaluation_OT_method","Sliced")
+Evaluation_Sinkhorn_regularization = globals().get("Evaluation_Sinkhorn_regularization",0.01)
+
+
+# #### Predictive Law(s)
+
+# In[ ]:
+
+
+def get_atomic_law(atoms,weights,repeats=1):
+    atoms = np.asarray(atoms,dtype=float)
+    weights = np.asarray(weights,dtype=float)
+    weights = weights.reshape(weights.shape[0],-1)
+    # Atoms: (A,d) if shared or (N,A,d) if given per row
+    if (atoms.ndim == 3) or ((atoms.ndim == 2) and (output_dim == 1) and (atoms.shape[0] == weights.shape[0]) and (atoms.shape[1] == weights.shape[1]*repeats)):
+        atoms = atoms.reshape(atoms.shape[0],atoms.shape[1],-1)
+    else:
+        atoms = atoms.reshape(weights.shape[1]*int(repeats),-1)
+    return {'law':'atoms',
+            'atoms':atoms,
+            'weights':weights,
+            'repeats':int(repeats),
+            'N_rows':weights.shape[0]}
+
+def get_gaussian_law(means,variances,mixture_weights=None):
+    N_rows = np.shape(means)[0]
+    if output_dim == 1:
+        # (Mixtures of) one-dimensional Gaussians
+        means = np.asarray(means,dtype=float).reshape(N_rows,-1)
+        variances = np.broadcast_to(np.asarray(variances,dtype=float).reshape(N_rows,-1),means.shape)
+        if mixture_weights is None:
+            mixture_weights = np.ones(means.shape)
+        mixture_weights = np.asarray(mixture_weights,dtype=float).reshape(means.shape)
+        mixture_weights = mixture_weights/np.sum(mixture_weights,axis=1,keepdims=True)
+    else:
+        # Multivariate Gaussians: isotropic (N,), diagonal (N,d) or full (N,d,d) covariances
+        means = np.asarray(means,dtype=float).reshape(N_rows,-1)
+        variances = np.asarray(variances,dtype=float)
+        if variances.ndim < 3:
+            variances = np.broadcast_to(variances.reshape(N_rows,-1),means.shape)[:,:,np.newaxis]*np.eye(means.shape[1])
+    return {'law':'gaussian',
+            'means':means,
+            'variances':variances,
+            'mixture_weights':mixture_weights,
+            'N_rows':N_rows}
+
+def get_dirac_law(points):
+    points = np.asarray(points,dtype=float)
+    return {'law':'dirac',
+            'points':points.reshape(points.shape[0],-1),
+            'N_rows':points.shape[0]}
+
+
+# #### Ground-Truth Moment(s)
+# The closed-form moments when known (Oracle_Moments_train/Oracle_Moments_test; set by the simulator); otherwise those of the Monte-Carlo oracle.
+
+# In[ ]:
+
+
+def get_oracle_moments(Y_statistics,Oracle_Moments=None):
+    if Oracle_Moments is None:
+        return Y_statistics['Mu'], Y_statistics['Var'], Y_statistics['Skewness'], Y_statistics['Ex_Kurtosis']
+    N_rows = Y_statistics['Mu'].shape[0]
+    Mu = np.asarray(Oracle_Moments['Mu'],dtype=float).reshape(Y_statistics['Mu'].shape)
+    Var, Skewness, Ex_Kurtosis = [np.broadcast_to(np.asarray(Oracle_Moments[moment],dtype=float).reshape(-1,),(N_rows,)) for moment in ['Var','Skewness','Ex_Kurtosis']]
+    return Mu, Var, Skewness, Ex_Kurtosis
+
+
+# #### Moments of a Predictive Law (one chunk of rows)
+# As for the Monte-Carlo statistics; the central moments are averaged over the output dimensions, and the "skewness" and "excess kurtosis" are standardized by the variance.
+
+# In[ ]:
+
+
+def get_chunk_weights(law,i_start,i_end):
+    # Weights on the atoms (normalized per row)
+    weights_chunk = np.repeat(law['weights'][i_start:i_end],law['repeats'],axis=1)
+    return weights_chunk/np.sum(weights_chunk,axis=1,keepdims=True)
+
+def get_chunk_atoms(law,i_start,i_end):
+    return law['atoms'][i_start:i_end] if (law['atoms'].ndim == 3) else law['atoms']
+
+def get_law_moments(law,i_start,i_end):
+    N_chunk = i_end-i_start
+    if law['law'] == 'atoms':
+        weights_chunk = get_chunk_weights(law,i_start,i_end)
+        atoms_chunk = get_chunk_atoms(law,i_start,i_end)
+        if atoms_chunk.ndim == 3:
+            Mu_hat = np.einsum('na,nad->nd',weights_chunk,atoms_chunk)
+        else:
+            Mu_hat = np.matmul(weights_chunk,atoms_chunk)
+        atoms_centered = atoms_chunk - Mu_hat[:,np.newaxis,:]
+        atoms_centered_squared = atoms_centered**2
+        Var_hat = np.sum(np.mean(atoms_centered_squared,axis=2)*weights_chunk,axis=1)
+        Central_Moment_3_hat = np.sum(np.mean(atoms_centered_squared*atoms_centered,axis=2)*weights_chunk,axis=1)
+        Central_Moment_4_hat = np.sum(np.mean(atoms_centered_squared**2,axis=2)*weights_chunk,axis=1)
+    elif law['law'] == 'gaussian':
+        means_chunk, variances_chunk = law['means'][i_start:i_end], law['variances'][i_start:i_end]
+        if output_dim == 1:
+            # Mixture: closed-form central moments of each component about the mixture's mean
+            mixture_weights_chunk = law['mixture_weights'][i_start:i_end]
+            Mu_hat = np.sum(mixture_weights_chunk*means_chunk,axis=1,keepdims=True)
+            shifts = means_chunk - Mu_hat
+            Var_hat = np.sum(mixture_weights_chunk*(shifts**2 + variances_chunk),axis=1)
+            Central_Moment_3_hat = np.sum(mixture_weights_chunk*(shifts**3 + 3*shifts*variances_chunk),axis=1)
+            Central_Moment_4_hat = np.sum(mixture_weights_chunk*(shifts**4 + 6*(shifts**2)*variances_chunk + 3*(variances_chunk**2)),axis=1)
+        else:
+            Mu_hat = means_chunk
+            marginal_variances = np.diagonal(variances_chunk,axis1=1,axis2=2)
+            Var_hat = np.mean(marginal_variances,axis=1)
+            Central_Moment_3_hat = np.zeros(N_chunk)
+            Central_Moment_4_hat = np.mean(3*(marginal_variances**2),axis=1)
+    else:
+        Mu_hat = law['points'][i_start:i_end]
+        Var_hat, Central_Moment_3_hat, Central_Moment_4_hat = np.zeros(N_chunk), np.zeros(N_chunk), np.zeros(N_chunk)
+    # Standardize (by the variance)
+    with np.errstate(divide="ignore",invalid="ignore"):
+        Skewness_hat = Central_Moment_3_hat/(Var_hat**3)
+        Ex_Kurtosis_hat = Central_Moment_4_hat/(Var_hat**4) - 3
+    return Mu_hat, Var_hat, Skewness_hat, Ex_Kurtosis_hat
+
+
+# #### Sampler for Gaussian Law(s) (one chunk of rows)
+# Returns per-row atoms (n,K*N_samples,d) and their weights (n,K*N_samples); all rows are drawn at once.
+
+# In[ ]:
+
+
+def get_law_samples(law,i_start,i_end,N_samples,random_state):
+    N_chunk = i_end-i_start
+    means_chunk, variances_chunk = law['means'][i_start:i_end], law['variances'][i_start:i_end]
+    if output_dim == 1:
+        N_components = means_chunk.shape[1]
+        samples = random_state.normal(means_chunk[:,:,np.newaxis],
+                                      np.sqrt(np.maximum(variances_chunk,0))[:,:,np.newaxis],
+                                      size=(N_chunk,N_components,N_samples))
+        samples = samples.reshape(N_chunk,-1,1)
+        weights = np.repeat(law['mixture_weights'][i_start:i_end],N_samples,axis=1)/N_samples
+    else:
+        # Affine transformation of standard normals by (jittered) Cholesky roots
+        dim = means_chunk.shape[1]
+        jitter = (10**-8)*np.maximum(np.mean(np.diagonal(variances_chunk,axis1=1,axis2=2),axis=1),10**-8)
+        Cholesky_roots = np.linalg.cholesky(variances_chunk + jitter[:,np.newaxis,np.newaxis]*np.eye(dim))
+        samples = means_chunk[:,np.newaxis,:] + np.matmul(random_state.standard_normal((N_chunk,N_samples,dim)),np.swapaxes(Cholesky_roots,1,2))
+        weights = np.full((N_chunk,N_samples),1/N_samples)
+    return samples, weights
+
+
+# #### Transport Error(s) of a Predictive Law (one chunk of rows)
+# - Atoms (and sampled Gaussians): the batched transport kernels; in 1D against the pre-sorted Monte-Carlo rows.
+# - Gaussian (mixtures) in 1D (if Gaussian_W1_mode == "Analytic"): the quantile coupling of the mixture and the pre-sorted Monte-Carlo rows; without sampling (see wasserstein_1d_gaussian_mixture_batched).
+# - Point-masses (closed-form): for $\delta_{\hat{y}}$, the 1D cost is $\operatorname{Var}_{\nu} + (\mu_{\nu}-\hat{y})^2$ (as ot.emd2_1d), the sliced distance is $\big(\frac1{L}\sum_{l=1}^L \theta_l^{\top}(\Sigma_{\nu} + (\mu_{\nu}-\hat{y})(\mu_{\nu}-\hat{y})^{\top})\theta_l\big)^{1/2}$ and the (entropic) transport cost is $\operatorname{tr}(\Sigma_{\nu})+|\mu_{\nu}-\hat{y}|^2$; since there is only one coupling.
+
+# In[ ]:
+
+
+def get_law_transport_dists(law,Y_targets,Y_statistics,i_start,i_end,OT_method,projections,Sinkhorn_regularization,N_samples,random_state,Gaussian_W1_mode="Analytic"):
+    # Point-Mass(es)
+    if law['law'] == 'dirac':
+        Mu_residuals = Y_statistics['Mu'][i_start:i_end] - law['points'][i_start:i_end]
+        if output_dim == 1:
+            return Y_statistics['Var'][i_start:i_end] + Mu_residuals.reshape(-1,)**2
+        Second_Moments = Y_statistics['Covariance'][i_start:i_end] + Mu_residuals[:,:,np.newaxis]*Mu_residuals[:,np.newaxis,:]
+        if OT_method == "Sinkhorn":
+            return np.trace(Second_Moments,axis1=1,axis2=2)
+        return np.sqrt(np.mean(np.einsum('il,nij,jl->nl',projections,Second_Moments,projections),axis=1))
+
+    # Gaussian (Mixture) Law(s) in 1D: analytic
+    if (law['law'] == 'gaussian') and (output_dim == 1) and (Gaussian_W1_mode == "Analytic"):
+        return wasserstein_1d_gaussian_mixture_batched(means = law['means'][i_start:i_end],
+                                                       variances = law['variances'][i_start:i_end],
+                                                       weights = law['mixture_weights'][i_start:i_end],
+                                                       Y_sink = np.array(Y_statistics['Sorted'][i_start:i_end]).reshape(i_end-i_start,-1),
+                                                       sink_sorted = True)
+
+    # Atoms and their Weight(s)
+    if law['law'] == 'atoms':
+        atoms_chunk = get_chunk_atoms(law,i_start,i_end)
+        weights_chunk = get_chunk_weights(law,i_start,i_end)
+    else:
+        atoms_chunk, weights_chunk = get_law_samples(law,i_start,i_end,N_samples,random_state)
+    ## (Atoms are shared: (A,d); or per row: (n,A,d))
+    if output_dim == 1:
+        return wasserstein_1d_batched(x_source = atoms_chunk[...,0],
+                                      w_source = weights_chunk,
+                                      Y_sink = np.array(Y_statistics['Sorted'][i_start:i_end]).reshape(i_end-i_start,-1),
+                                      sink_sorted = True)
+    if OT_method == "Sinkhorn":
+        return sinkhorn_stabilized_batched(x_source = atoms_chunk,
+                                           w_source = weights_chunk,
+                                           Y_sink = np.array(Y_targets[i_start:i_end]),
+                                           reg = Sinkhorn_regularization)
+    return sliced_wasserstein_batched(x_source = atoms_chunk,
+                                      w_source = weights_chunk,
+                                      Y_sink = np.array(Y_targets[i_start:i_end]),
+                                      projections = projections)
+
+
+# #### Evaluator
+# Returns a dictionary with (one entry per row):
+# - the errors: W1, Mean (and, if higher_moments, Var, Skewness and Ex_Kurtosis); against the ground-truth moments (Oracle_Moments, of the same rows as Y_targets; if None, those of the Monte-Carlo oracle),
+# - the Monte-Carlo oracle's errors: Mean_MC (and Var_MC, Skewness_MC and Ex_Kurtosis_MC),
+# - the predicted moments: Mu_hat, Var_hat, Skewness_hat and Ex_Kurtosis_hat.
+
+# In[ ]:
+
+
+# Rows per chunk (bounds the size of the blocks held in memory at once)
+def get_metric_chunk_size(N_columns):
+    return int(max(1,(10**7)//max(1,N_columns)))
+
+def get_predictive_errors(law,
+                          X_inputs,
+                          Y_targets,
+                          higher_moments=True,
+                          OT_method=None,
+                          n_projections=10,
+                          Sinkhorn_regularization=None,
+                          N_samples=None,
+                          Gaussian_W1_mode="Analytic",
+                          chunk_size=None,
+                          n_jobs=1,
+                          Oracle_Moments=None):
+    N_rows = law['N_rows']
+    if N_samples is None:
+        N_samples = N_Monte_Carlo_Samples
+    if OT_method is None:
+        OT_method = Evaluation_OT_method
+    if Sinkhorn_regularization is None:
+        Sinkhorn_regularization = Evaluation_Sinkhorn_regularization
+    Y_statistics = get_cached_Monte_Carlo_Statistics(Y_targets)
+    N_targets = Y_statistics['Sorted'].shape[1]
+
+    # Projection Bank (shared by all rows; same directions as seed=2020 in POT)
+    projections = None
+    if (output_dim > 1) and (OT_method != "Sinkhorn"):
+        projections = ot.sliced.get_random_projections(output_dim,n_projections,np.random.RandomState(2020))
+
+    # Sample Gaussian Law(s)?
+    sample_law = (law['law'] == 'gaussian') and ((output_dim > 1) or (Gaussian_W1_mode != "Analytic"))
+
+    # Chunking
+    if chunk_size is None:
+        if law['law'] == 'atoms':
+            N_atoms = law['atoms'].shape[-2]
+        elif sample_law:
+            N_atoms = law['means'].shape[1]*N_samples if (output_dim == 1) else N_samples
+        elif law['law'] == 'gaussian':
+            # (several (row, sample, component) blocks are held at once)
+            N_atoms = 4*law['means'].shape[1]*N_targets
+        else:
+            N_atoms = 1
+        if (output_dim > 1) and (OT_method == "Sinkhorn"):
+            chunk_size = get_metric_chunk_size(N_atoms*N_targets)
+        else:
+            chunk_size = get_metric_chunk_size((N_atoms+N_targets)*(n_projections+1 if output_dim > 1 else 1))
+    chunk_starts = list(range(0,N_rows,chunk_size))
+    ## One random stream per chunk (seeded from the global generator; only used to sample Gaussian laws)
+    chunk_seeds = np.random.randint(0,2**31-1,size=len(chunk_starts)) if sample_law else np.zeros(len(chunk_starts),dtype=int)
+
+    # Evaluate (in chunks)
+    W1_hat = np.zeros(N_rows)
+    Mu_hat = np.zeros(Y_statistics['Mu'].shape)
+    Var_hat, Skewness_hat, Ex_Kurtosis_hat = np.zeros(N_rows), np.zeros(N_rows), np.zeros(N_rows)
+    def evaluate_chunk(chunk_index):
+        i_start = chunk_starts[chunk_index]
+        i_end = min(N_rows,i_start+chunk_size)
+        W1_hat[i_start:i_end] = get_law_transport_dists(law,Y_targets,Y_statistics,i_start,i_end,
+                                                        OT_method = OT_method,
+                                                        projections = projections,
+                                                        Sinkhorn_regularization = Sinkhorn_regularization,
+                                                        N_samples = N_samples,
+                                                        random_state = np.random.RandomState(chunk_seeds[chunk_index]),
+                                                        Gaussian_W1_mode = Gaussian_W1_mode)
+        Mu_hat[i_start:i_end], Var_hat[i_start:i_end], Skewness_hat[i_start:i_end], Ex_Kurtosis_hat[i_start:i_end] = get_law_moments(law,i_start,i_end)
+    with ThreadPoolExecutor(max_workers=int(max(1,n_jobs))) as evaluator_pool:
+        list(evaluator_pool.map(evaluate_chunk,range(len(chunk_starts))))
+
+    # Tally Error(s)
+    Mu, Var, Skewness, Ex_Kurtosis = get_oracle_moments(Y_statistics,Oracle_Moments)
+    errors = {'W1':W1_hat,
+              'Mean':np.sum(np.abs(Mu_hat-Mu),axis=1),
+              'Mean_MC':np.sum(np.abs(Mu-Y_statistics['Mu']),axis=1),
+              'Mu_hat':Mu_hat}
+    if higher_moments:
+        errors.update({'Var':np.abs(Var_hat-Var),
+                       'Skewness':np.abs(Skewness_hat-Skewness),
+                       'Ex_Kurtosis':np.abs(Ex_Kurtosis-Ex_Kurtosis_hat),
+                       'Var_MC':np.abs(Y_statistics['Var']-Var),
+                       'Skewness_MC':np.abs(Y_statistics['Skewness']-Skewness),
+                       'Ex_Kurtosis_MC':np.abs(Ex_Kurtosis-Y_statistics['Ex_Kurtosis']),
+                       'Var_hat':Var_hat,
+                       'Skewness_hat':Skewness_hat,
+                       'Ex_Kurtosis_hat':Ex_Kurtosis_hat})
+    return errors
+
+
+# #### Bootstrapped Confidence Intervals
+# Of several metrics at once; using the same resamples for all of them.
+
+# In[ ]:
+
+
+def get_error_intervals(errors,metrics,N_Bootstraps=10,confidence=.95):
+    return [np.array(ci(confidence)) for ci in bootstrap_metrics([np.abs(errors[metric]) for metric in metrics],n=N_Bootstraps)]
+
+
+# ---
+# # Fin
+# ---
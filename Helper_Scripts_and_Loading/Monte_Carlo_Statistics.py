@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Monte-Carlo Statistics
+# Per-row sufficient statistics of the Monte-Carlo (oracle) targets; computed once, right after the data is simulated (or loaded), in a single chunked pass over Y_train and Y_test.
+#
+# For each row $i$ (with samples $Y_{i,1},\dots,Y_{i,M}$) the following are stored:
+# - Mu: the empirical mean (one entry per output dimension),
+# - Var, Central_Moment_3, Central_Moment_4: the empirical central moments (averaged over the output dimensions),
+# - Skewness and Ex_Kurtosis: standardized by the variance (as everywhere else in the evaluators),
+# - Covariance: the empirical (maximum-likelihood; i.e. normalized by $M$) covariance matrix,
+# - Sorted: the samples sorted along each output dimension (i.e. the empirical quantile functions),
+# - Quantiles: the empirical quantiles at Monte_Carlo_Statistics_quantile_levels.
+#
+# **Note:** *The evaluators (DNM, deterministic benchmarks, MDN and Gaussian benchmarks) all read from here instead of re-reducing the same rows inside their own loops.  The sorted samples are written to a Monte-Carlo store when Use_Monte_Carlo_Store is True; so they are never all held in RAM either.*
+
+# In[ ]:
+
+
+# Quantile Level(s) to Store (Override in main script if desired)
+Monte_Carlo_Statistics_quantile_levels = np.array([0.01,0.05,0.25,0.5,0.75,0.95,0.99])
+
+
+# #### Compute Statistics
+
+# In[ ]:
+
+
+def get_Monte_Carlo_Statistics(Y_in,store_name=None,quantile_levels=None,chunk_size=10**3):
+    if quantile_levels is None:
+        quantile_levels = Monte_Carlo_Statistics_quantile_levels
+    quantile_levels = np.array(quantile_levels,dtype=float).reshape(-1,)
+    # Shape(s): (row, sample, dim)
+    N_rows, N_samples = Y_in.shape[0], Y_in.shape[1]
+    N_dim = int(np.prod(Y_in.shape[2:])) if len(Y_in.shape) > 2 else 1
+
+    # Initialize Statistic(s)
+    Mu_MC = np.zeros((N_rows,N_dim))
+    Var_MC, Central_Moment_3_MC, Central_Moment_4_MC = np.zeros(N_rows), np.zeros(N_rows), np.zeros(N_rows)
+    Covariance_MC = np.zeros((N_rows,N_dim,N_dim))
+    Quantiles_MC = np.zeros((N_rows,quantile_levels.shape[0],N_dim))
+    if store_name is None:
+        Sorted_MC = np.zeros((N_rows,N_samples,N_dim))
+    else:
+        Sorted_MC = Open_Monte_Carlo_Store(store_name+"_Sorted",[N_rows,N_samples,N_dim])
+
+    for i_start, i_end, Y_chunk in Monte_Carlo_Store_Chunks(Y_in,chunk_size):
+        Y_chunk = Y_chunk.reshape(i_end-i_start,N_samples,N_dim)
+        # Mean
+        Mu_MC[i_start:i_end] = np.mean(Y_chunk,axis=1)
+        # Central Moment(s)
+        Y_centered = Y_chunk - Mu_MC[i_start:i_end].reshape(i_end-i_start,1,N_dim)
+        Y_centered_squared = Y_centered**2
+        Var_MC[i_start:i_end] = np.mean(Y_centered_squared,axis=(1,2))
+        Central_Moment_3_MC[i_start:i_end] = np.mean(Y_centered_squared*Y_centered,axis=(1,2))
+        Central_Moment_4_MC[i_start:i_end] = np.mean(Y_centered_squared**2,axis=(1,2))
+        Covariance_MC[i_start:i_end] = np.matmul(np.swapaxes(Y_centered,1,2),Y_centered)/N_samples
+        # Sorted Sample(s) and Quantile(s)
+        Y_sorted = np.sort(Y_chunk,axis=1)
+        Sorted_MC[i_start:i_end] = Y_sorted
+        Quantiles_MC[i_start:i_end] = np.moveaxis(np.quantile(Y_sorted,quantile_levels,axis=1),0,1)
+
+    if store_name is not None:
+        Sorted_MC = Close_Monte_Carlo_Store(store_name+"_Sorted",Sorted_MC)
+
+    # Standardized Moment(s) (by the variance; as in the evaluators)
+    Skewness_MC = Central_Moment_3_MC/(Var_MC**3)
+    Ex_Kurtosis_MC = Central_Moment_4_MC/(Var_MC**4) - 3
+
+    return {'Mu':Mu_MC,
+            'Var':Var_MC,
+            'Central_Moment_3':Central_Moment_3_MC,
+            'Central_Moment_4':Central_Moment_4_MC,
+            'Skewness':Skewness_MC,
+            'Ex_Kurtosis':Ex_Kurtosis_MC,
+            'Covariance':Covariance_MC,
+            'Sorted':Sorted_MC,
+            'Quantile_Levels':quantile_levels,
+            'Quantiles':Quantiles_MC}
+
+
+# #### Cached Look-up
+# Returns the statistics of Y_in; these are only computed the first time a given array (e.g. Y_train) is looked-up.
+
+# In[ ]:
+
+
+Monte_Carlo_Statistics_Cache = []
+
+def get_cached_Monte_Carlo_Statistics(Y_in,**statistics_parameters):
+    for Y_cached, statistics_cached in Monte_Carlo_Statistics_Cache:
+        if Y_cached is Y_in:
+            return statistics_cached
+    statistics = get_Monte_Carlo_Statistics(Y_in,**statistics_parameters)
+    Monte_Carlo_Statistics_Cache.append((Y_in,statistics))
+    return statistics
+
+
+# ---
+# # Fin
+# ---
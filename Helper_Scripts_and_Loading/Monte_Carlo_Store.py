@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Monte-Carlo Store
+# Memory-mapped, on-disk, storage for the (simulated) Monte-Carlo datasets.
+#
+# Each store consists of:
+# - a standard (memory-mapped) ".npy" file holding the Monte-Carlo samples; e.g.: Y_train,
+# - a small ".json" header recording how they were generated (seed, mode, dimensions, Hurst exponent, etc...).
+#
+# **Note:** *The simulators write their outputs directly into the store (one datum at a time) and the downstream stages (cover building, classifier training, evaluation) only ever read the rows they need from it; so the full Monte-Carlo tensor never needs to be held in RAM.  When Use_Monte_Carlo_Store is False; ordinary (in-memory) arrays are used instead.*
+
+# In[ ]:
+
+
+import json
+
+
+# In[ ]:
+
+
+# Toggle (Override in main script if desired)
+Use_Monte_Carlo_Store = False
+# Path to Store(s)
+Monte_Carlo_Store_path = "./inputs/data/Monte_Carlo_Stores/"
+
+
+# #### Metadata Header
+
+# In[ ]:
+
+
+def get_Monte_Carlo_Store_Metadata(**extra_metadata):
+    # Record how the data was generated (if known)
+    metadata = {}
+    for parameter_name in ['f_unknown_mode','problem_dim','output_dim','N_train_size','N_Monte_Carlo_Samples','N_Monte_Carlo_Samples_Test','N_Euler_Maruyama_Steps','Hurst_Exponent','Rougness','Ratio_fBM_to_typical_vol','delta','Dropout_rate','Depth_Bayesian_DNN','width','dataset_option']:
+        if parameter_name in globals():
+            metadata[parameter_name] = globals()[parameter_name]
+    # Seed used to generate the data
+    metadata['seed'] = 2021
+    metadata.update(extra_metadata)
+    # Coerce numpy scalars to be JSON-friendly
+    for parameter_name in metadata:
+        if isinstance(metadata[parameter_name],np.generic):
+            metadata[parameter_name] = metadata[parameter_name].item()
+    return metadata
+
+
+# #### Open Store (for Writing)
+# Returns a writeable array of the desired shape; stored on disk when Use_Monte_Carlo_Store is True and in RAM otherwise.
+
+# In[ ]:
+
+
+def Open_Monte_Carlo_Store(store_name,shape,metadata=None,dtype=np.float64):
+    shape = tuple(int(n) for n in np.atleast_1d(shape))
+    if not Use_Monte_Carlo_Store:
+        return np.zeros(shape,dtype=dtype)
+
+    # Initialize Path(s)
+    Path(Monte_Carlo_Store_path).mkdir(parents=True, exist_ok=True)
+    store_file = Monte_Carlo_Store_path+store_name+".npy"
+    header_file = Monte_Carlo_Store_path+store_name+".json"
+
+    # Write Header
+    if metadata is None:
+        metadata = get_Monte_Carlo_Store_Metadata()
+    header = {'store_name':store_name,
+              'shape':list(shape),
+              'dtype':np.dtype(dtype).str,
+              'metadata':metadata}
+    with open(header_file,"w") as header_file_writer:
+        json.dump(header,header_file_writer,indent=4,default=str)
+
+    # Allocate (memory-mapped) Store
+    return np.lib.format.open_memmap(store_file,mode="w+",dtype=dtype,shape=shape)
+
+
+# #### Load Store (for Reading)
+# Returns the (lazily loaded) read-only array and its header.
+
+# In[ ]:
+
+
+def Load_Monte_Carlo_Store(store_name):
+    # Read Header
+    with open(Monte_Carlo_Store_path+store_name+".json","r") as header_file_reader:
+        header = json.load(header_file_reader)
+    # Memory-map Store
+    store = np.load(Monte_Carlo_Store_path+store_name+".npy",mmap_mode="r")
+    return store, header
+
+
+def Close_Monte_Carlo_Store(store_name,store):
+    # Flush writes and re-open lazily (read-only); in-memory arrays are passed through
+    if isinstance(store,np.memmap):
+        store.flush()
+        return Load_Monte_Carlo_Store(store_name)[0]
+    return store
+
+
+# #### Chunked Reader
+# Iterates over blocks of rows; so that reductions (e.g. means) over the store never load it all at once.
+
+# In[ ]:
+
+
+def Monte_Carlo_Store_Chunks(store,chunk_size=10**3):
+    for i_start in range(0,store.shape[0],chunk_size):
+        i_end = min(store.shape[0],i_start+chunk_size)
+        yield i_start, i_end, np.asarray(store[i_start:i_end])
+
+
+def Monte_Carlo_Store_Row_Means(store,chunk_size=10**3):
+    # Empirical mean of each row's Monte-Carlo samples
+    row_means = np.zeros((store.shape[0],)+tuple(store.shape[2:]))
+    for i_start, i_end, store_chunk in Monte_Carlo_Store_Chunks(store,chunk_size):
+        row_means[i_start:i_end] = np.mean(store_chunk,axis=1)
+    return row_means
+
+
+# ---
+# # Fin
+# ---
@@ -0,0 +1,334 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Batched Transport Kernels
+# Vectorized optimal-transport distances between one (shared) set of atoms and many empirical measures at once.
+
+# In[ ]:
+
+
+from concurrent.futures import ThreadPoolExecutor
+from scipy.special import ndtr
+
+# #### 1D Wasserstein Distance (Batched)
+# In one dimension the optimal coupling is the monotone (quantile) coupling; so
+# $$
+# \mathcal{W}(\mu,\nu) = \int_0^1 c\big(F_{\mu}^{-1}(u),F_{\nu}^{-1}(u)\big)\,du,
+# $$
+# which is a finite sum over the merged break-points of the two CDFs.
+#
+# - The atoms (x_source) are either shared (M,) and sorted once, or given per row (R,M) and sorted with a single np.argsort(axis=1); every row of Y_sink is sorted with a single np.sort(axis=1) (or argsort; if the sink weights are not uniform).  Pass sink_sorted=True if the rows are already sorted (e.g. Monte_Carlo_Statistics 'Sorted'); then they are used as is.
+# - w_source is either shared (M,) or one weight-vector per row (R,M); w_sink is None (uniform), shared (n,), or per row (R,n).
+# - The cost matches ot.emd2_1d for the same metric and p: "sqeuclidean" (default) is $|x-y|^2$, "minkowski" is $|x-y|^p$, and "cityblock"/"euclidean" are $|x-y|$.
+#
+# Returns the R transport costs (each equal to ot.emd2_1d on the corresponding row; up to round-off).
+
+# In[ ]:
+
+
+def wasserstein_1d_batched(x_source, w_source, Y_sink, w_sink=None, metric="sqeuclidean", p=1, sink_sorted=False):
+    # Coerce Inputs
+    x_source = np.asarray(x_source,dtype=float)
+    Y_sink = np.asarray(Y_sink,dtype=float)
+    Y_sink = Y_sink.reshape(Y_sink.shape[0],-1)
+    N_rows, N_sink = Y_sink.shape
+    ## Atoms: shared (1,M) or per row (R,M)
+    x_source = x_source.reshape(N_rows,-1) if (x_source.ndim == 2) else x_source.reshape(1,-1)
+    N_source = x_source.shape[1]
+    w_source = np.broadcast_to(np.asarray(w_source,dtype=float).reshape(-1,N_source),(N_rows,N_source))
+
+    # Sort Atoms #
+    #------------#
+    ## Atoms (once; if shared)
+    source_order = np.argsort(x_source,axis=1,kind="stable")
+    x_source_sorted = np.broadcast_to(np.take_along_axis(x_source,source_order,axis=1),(N_rows,N_source))
+    w_source_sorted = np.take_along_axis(w_source,np.broadcast_to(source_order,(N_rows,N_source)),axis=1)
+    ## Empirical rows (all at once)
+    if w_sink is None:
+        Y_sink_sorted = Y_sink if sink_sorted else np.sort(Y_sink,axis=1)
+        w_sink_sorted = np.full((N_rows,N_sink),1/N_sink)
+    elif sink_sorted:
+        Y_sink_sorted = Y_sink
+        w_sink_sorted = np.broadcast_to(np.asarray(w_sink,dtype=float).reshape(-1,N_sink),(N_rows,N_sink))
+    else:
+        w_sink = np.broadcast_to(np.asarray(w_sink,dtype=float).reshape(-1,N_sink),(N_rows,N_sink))
+        sink_order = np.argsort(Y_sink,axis=1,kind="stable")
+        Y_sink_sorted = np.take_along_axis(Y_sink,sink_order,axis=1)
+        w_sink_sorted = np.take_along_axis(w_sink,sink_order,axis=1)
+
+    # Quantile Coupling #
+    #-------------------#
+    ## (Normalized) CDFs
+    source_mass = np.sum(w_source_sorted,axis=1)
+    F_source = np.cumsum(w_source_sorted,axis=1)/source_mass.reshape(-1,1)
+    F_sink = np.cumsum(w_sink_sorted,axis=1)/np.sum(w_sink_sorted,axis=1).reshape(-1,1)
+    ## Merge break-points (stable: ties list the source first)
+    F_merged = np.concatenate([F_source,F_sink],axis=1)
+    merge_order = np.argsort(F_merged,axis=1,kind="stable")
+    levels = np.take_along_axis(F_merged,merge_order,axis=1)
+    ## Quantile index of each merged segment = number of (source resp. sink) break-points before it
+    is_source = (merge_order < N_source)
+    source_index = np.minimum(np.cumsum(is_source,axis=1) - is_source,N_source-1)
+    sink_index = np.minimum(np.cumsum(~is_source,axis=1) - (~is_source),N_sink-1)
+    ## Segment lengths
+    segment_lengths = np.maximum(np.diff(levels,axis=1,prepend=0),0)
+
+    # Transport Cost #
+    #----------------#
+    displacements = np.abs(np.take_along_axis(x_source_sorted,source_index,axis=1) - np.take_along_axis(Y_sink_sorted,sink_index,axis=1))
+    if metric == "sqeuclidean":
+        costs = displacements**2
+    elif metric == "minkowski":
+        costs = displacements**p
+    else:
+        costs = displacements
+    # Re-scale by the source's total mass (as in ot.emd2_1d)
+    return np.sum(segment_lengths*costs,axis=1)*source_mass
+
+
+# #### 1D Wasserstein Distance between Gaussian Mixtures and Empirical Measures (Batched; Analytic)
+# Same quantile coupling, but the source is a Gaussian mixture $\sum_{k=1}^K w_k\mathcal{N}(\mu_k,\sigma_k^2)$ (one per row); so no sampling is needed.  The levels $u_j=j/n$ of the (uniform) empirical quantile function form the shared grid; on $(u_{j-1},u_j]$ the empirical quantile is $y_{(j)}$ and the mixture's quantiles $q_j = F^{-1}(u_j)$ are found by (safeguarded, batched) Newton iterations.  The integrals then follow from the mixture's partial expectations
+# $$
+# \int_{u_{j-1}}^{u_j} F^{-1}(u)\,du = \mathbb{E}\big[X;\,q_{j-1}<X\leq q_j\big] = \sum_{k=1}^K w_k\Big(\mu_k\big(\Phi(z_{k,j})-\Phi(z_{k,j-1})\big) - \sigma_k\big(\varphi(z_{k,j})-\varphi(z_{k,j-1})\big)\Big),
+# \qquad z_{k,j} = \frac{q_j-\mu_k}{\sigma_k}.
+# $$
+# - "sqeuclidean" (default; as wasserstein_1d_batched) is $\mathbb{E}[X^2] - 2\sum_j y_{(j)}\int_{u_{j-1}}^{u_j}F^{-1} + \frac1{n}\sum_j y_{(j)}^2$,
+# - "cityblock"/"euclidean" additionally split each level-interval at $F(y_{(j)})$.
+#
+# means, variances and weights are (R,K); Y_sink is (R,n).
+
+# In[ ]:
+
+
+def normal_density(z_scores):
+    return np.exp(-0.5*z_scores**2)/np.sqrt(2*np.pi)
+
+def get_gaussian_mixture_partial_expectations(x, means, sds, weights):
+    # E[X; X <= x] for each entry of x (R,L); mixtures (R,K)
+    z_scores = (x[:,:,np.newaxis] - means[:,np.newaxis,:])/sds[:,np.newaxis,:]
+    return np.sum(weights[:,np.newaxis,:]*(means[:,np.newaxis,:]*ndtr(z_scores) - sds[:,np.newaxis,:]*normal_density(z_scores)),axis=2)
+
+def get_gaussian_mixture_quantiles(levels, means, sds, weights, tol=1e-12, max_iter=50):
+    # Quantile(s) of each mixture (R,K) at the (shared) levels (L,); returns (R,L)
+    levels = np.broadcast_to(np.asarray(levels,dtype=float).reshape(1,-1),(means.shape[0],np.size(levels)))
+    # Bracket(s) and initial guess (moment-matched Gaussian)
+    lower = np.broadcast_to(np.min(means - 40*sds,axis=1,keepdims=True),levels.shape).copy()
+    upper = np.broadcast_to(np.max(means + 40*sds,axis=1,keepdims=True),levels.shape).copy()
+    mixture_mean = np.sum(weights*means,axis=1,keepdims=True)
+    mixture_sd = np.sqrt(np.sum(weights*(sds**2 + means**2),axis=1,keepdims=True) - mixture_mean**2)
+    quantiles = np.clip(mixture_mean + mixture_sd*norm.ppf(levels),lower,upper)
+    for i_iteration in range(max_iter):
+        z_scores = (quantiles[:,:,np.newaxis] - means[:,np.newaxis,:])/sds[:,np.newaxis,:]
+        residuals = np.sum(weights[:,np.newaxis,:]*ndtr(z_scores),axis=2) - levels
+        densities = np.sum((weights/sds)[:,np.newaxis,:]*normal_density(z_scores),axis=2)
+        if np.max(np.abs(residuals)) <= tol:
+            break
+        # Update Bracket(s)
+        lower = np.where(residuals < 0,quantiles,lower)
+        upper = np.where(residuals > 0,quantiles,upper)
+        # Newton Step (bisect if it leaves the bracket)
+        with np.errstate(divide='ignore',over='ignore',invalid='ignore'):
+            quantiles_Newton = quantiles - residuals/densities
+        inside = np.isfinite(quantiles_Newton) & (quantiles_Newton >= lower) & (quantiles_Newton <= upper)
+        quantiles = np.where(inside,quantiles_Newton,(lower+upper)/2)
+    return quantiles
+
+def wasserstein_1d_gaussian_mixture_batched(means, variances, weights, Y_sink, metric="sqeuclidean", sink_sorted=False):
+    # Coerce Inputs
+    means = np.asarray(means,dtype=float)
+    N_rows = means.shape[0]
+    means = means.reshape(N_rows,-1)
+    sds = np.sqrt(np.maximum(np.asarray(variances,dtype=float).reshape(N_rows,-1),10**-24))
+    weights = np.asarray(weights,dtype=float).reshape(N_rows,-1)
+    weights = weights/np.sum(weights,axis=1,keepdims=True)
+    Y_sink = np.asarray(Y_sink,dtype=float).reshape(N_rows,-1)
+    Y_sink_sorted = Y_sink if sink_sorted else np.sort(Y_sink,axis=1)
+    N_sink = Y_sink_sorted.shape[1]
+    # Center (both laws; the distance is translation invariant)
+    shift = np.sum(weights*means,axis=1,keepdims=True)
+    means = means - shift
+    Y_sink_sorted = Y_sink_sorted - shift
+
+    # Mixture Quantile(s) on the shared grid of levels j/n (q_0 = -inf and q_n = +inf)
+    levels = np.arange(1,N_sink)/N_sink
+    quantiles = get_gaussian_mixture_quantiles(levels,means,sds,weights)
+    quantiles = np.concatenate([np.full((N_rows,1),-np.inf),quantiles,np.full((N_rows,1),np.inf)],axis=1)
+    partial_expectations = get_gaussian_mixture_partial_expectations(quantiles,means,sds,weights)
+
+    # Transport Cost #
+    #----------------#
+    if metric == "sqeuclidean":
+        second_moments = np.sum(weights*(sds**2 + means**2),axis=1)
+        return second_moments - 2*np.sum(Y_sink_sorted*np.diff(partial_expectations,axis=1),axis=1) + np.mean(Y_sink_sorted**2,axis=1)
+    ## |x-y|: split each level-interval (u_{j-1},u_j] where the mixture's quantile crosses y_(j)
+    Y_sink_clipped = np.clip(Y_sink_sorted,quantiles[:,:-1],quantiles[:,1:])
+    z_scores = (Y_sink_clipped[:,:,np.newaxis] - means[:,np.newaxis,:])/sds[:,np.newaxis,:]
+    levels_crossing = np.sum(weights[:,np.newaxis,:]*ndtr(z_scores),axis=2)
+    partial_expectations_crossing = get_gaussian_mixture_partial_expectations(Y_sink_clipped,means,sds,weights)
+    levels = np.concatenate([[0],levels,[1]])
+    below = Y_sink_sorted*(levels_crossing - levels[:-1]) - (partial_expectations_crossing - partial_expectations[:,:-1])
+    above = (partial_expectations[:,1:] - partial_expectations_crossing) - Y_sink_sorted*(levels[1:] - levels_crossing)
+    return np.sum(below + above,axis=1)
+
+
+# #### Sliced Wasserstein Distance (Batched)
+# Sliced $\mathcal{W}_p$ distance of: [Bonneel, Nicolas, et al. “Sliced and radon wasserstein barycenters of measures.” Journal of Mathematical Imaging and Vision 51.1 (2015): 22-45](https://dl.acm.org/doi/10.1007/s10851-014-0506-3); between one (shared) set of atoms and every row of Y_sink:
+# $$
+# \mathcal{SW}_p(\mu,\nu) = \Big(\frac1{L}\sum_{l=1}^L \mathcal{W}_p^p(\theta_l{}_{\#}\mu,\theta_l{}_{\#}\nu)\Big)^{1/p}.
+# $$
+#
+# - One bank of $L$ (=n_projections) directions is drawn per call (or passed in via projections; a (dim, L) array) and shared by every row; more projections are more accurate but slower.
+# - The atoms are either shared (M, dim) or given per row (R, M, dim).
+# - Shared atoms are projected once; the rows are projected (and solved) in chunks of chunk_size rows; each projected problem is solved with wasserstein_1d_batched.
+# - The directions are drawn from their own RandomState(seed); so they coincide with those of ot.sliced.sliced_wasserstein_distance(..., seed=seed) without touching the global random number generator.
+#
+# Returns the R sliced distances.
+
+# In[ ]:
+
+
+def sliced_wasserstein_batched(x_source, w_source, Y_sink, w_sink=None, n_projections=50, p=2, seed=2020, projections=None, chunk_size=None):
+    # Coerce Inputs
+    x_source = np.asarray(x_source,dtype=float)
+    N_rows = Y_sink.shape[0]
+    ## Atoms: shared (M,dim) or per row (R,M,dim)
+    per_row_source = (x_source.ndim == 3)
+    if not per_row_source:
+        x_source = x_source.reshape(x_source.shape[0],-1)
+    N_source, dim = x_source.shape[-2], x_source.shape[-1]
+    w_source = np.asarray(w_source,dtype=float).reshape(-1,N_source)
+    if w_sink is not None:
+        w_sink = np.asarray(w_sink,dtype=float)
+
+    # Projection Bank (shared by all rows)
+    if projections is None:
+        projections = ot.sliced.get_random_projections(dim,n_projections,np.random.RandomState(seed))
+    projections = np.asarray(projections,dtype=float).reshape(dim,-1)
+    n_projections = projections.shape[1]
+    ## Project shared atoms (once)
+    if not per_row_source:
+        x_source_projected = np.matmul(x_source,projections)
+
+    # Solve Projected Problems (in chunks of rows)
+    N_sink = int(np.prod(Y_sink.shape[1:]))//dim
+    if chunk_size is None:
+        chunk_size = int(max(1,(10**7)//(N_source+N_sink*(n_projections+1))))
+    SW_out = np.zeros(N_rows)
+    for i_start in range(0,N_rows,chunk_size):
+        i_end = min(N_rows,i_start+chunk_size)
+        # Project Rows
+        Y_sink_projected = np.matmul(np.asarray(Y_sink[i_start:i_end],dtype=float).reshape(i_end-i_start,N_sink,dim),projections)
+        if per_row_source:
+            x_source_projected = np.matmul(x_source[i_start:i_end],projections)
+        # Weights of this chunk (shared or per row)
+        w_source_chunk = w_source if w_source.shape[0] == 1 else w_source[i_start:i_end]
+        w_sink_chunk = w_sink if ((w_sink is None) or (w_sink.ndim == 1)) else w_sink[i_start:i_end]
+        # Average of the p-th power of the projected W_p distances
+        projected_costs = np.zeros(i_end-i_start)
+        for l in range(n_projections):
+            projected_costs += wasserstein_1d_batched(x_source = x_source_projected[...,l],
+                                                      w_source = w_source_chunk,
+                                                      Y_sink = Y_sink_projected[:,:,l],
+                                                      w_sink = w_sink_chunk,
+                                                      metric = "minkowski",
+                                                      p = p)
+        SW_out[i_start:i_end] = (projected_costs/n_projections)**(1/p)
+    return SW_out
+
+
+# #### Entropic (Sinkhorn) Transport Cost (Batched)
+# Entropically regularized transport of: [Cuturi - Sinkhorn Distances: Lightspeed Computation of Optimal Transport (2013)](https://papers.nips.cc/paper/2013/hash/af21d0c97db2e27e13572cbf59eb343d-Abstract.html) between one (shared) set of atoms, or one set per row (R, M, dim), and every row of Y_sink; with squared-Euclidean ground cost (as ot.bregman.empirical_sinkhorn2).
+#
+# - The iterations are stabilized as in POT's sinkhorn_stabilized: the (batched matrix-vector) scaling updates act on the kernel $K=\exp(-C/\text{reg})$, and the scalings are absorbed into dual potentials (and $K$ rebuilt) whenever they grow beyond absorption_threshold; so they remain stable for small regularization (reg).
+# - Many same-size problems are solved simultaneously on a stacked (problem, source, sink) cost tensor; every check_every iterations the problems whose sink-marginal violation is below tol are retired (early stopping per problem).
+# - Chunks of chunk_size problems are spread over n_jobs threads (numpy releases the GIL for the heavy operations).
+#
+# Returns the R transport costs $\langle P^{\star},C\rangle$ of the (regularized) optimal plans; NaN (with a warning) for the problems which have not converged after max_iter iterations.
+
+# In[ ]:
+
+
+def sinkhorn_stabilized_solver(C, log_a, log_b, reg=0.01, max_iter=1000, tol=1e-9, check_every=10, absorption_threshold=1e3):
+    # Solves the stacked problems: C[k] is the cost-matrix and (a[k], b[k]) the marginals of problem k
+    N_problems = C.shape[0]
+    transport_costs = np.full(N_problems,np.nan)
+    active = np.arange(N_problems)
+    C_scaled = C/reg
+    a, b = np.exp(log_a), np.exp(log_b)
+    # (Scaled) dual potentials; i.e.: f/reg and g/reg, and the scalings not yet absorbed into them
+    alpha = np.zeros(log_a.shape)
+    beta = np.zeros(log_b.shape)
+    u = np.ones(log_a.shape)
+    v = np.ones(log_b.shape)
+    K = np.exp(-C_scaled)
+    for i_iteration in range(max_iter):
+        # Scaling updates (batched matrix-vector products)
+        v = b/np.maximum(np.matmul(u[:,None,:],K)[:,0,:],1e-300)
+        u = a/np.maximum(np.matmul(K,v[:,:,None])[:,:,0],1e-300)
+        # Absorb large scalings into the log-domain potentials (stabilization)
+        unstable = (np.max(u,axis=1) > absorption_threshold) | (np.max(v,axis=1) > absorption_threshold)
+        if np.any(unstable):
+            with np.errstate(divide="ignore"):
+                alpha[unstable] += np.log(u[unstable])
+                beta[unstable] += np.log(v[unstable])
+            alpha[unstable] = np.maximum(alpha[unstable],-1e300)
+            beta[unstable] = np.maximum(beta[unstable],-1e300)
+            u[unstable], v[unstable] = 1, 1
+            K[unstable] = np.exp(alpha[unstable][:,:,None] + beta[unstable][:,None,:] - C_scaled[unstable])
+        # Check Convergence (source-marginals are exact after the u-update)
+        if ((i_iteration+1) % check_every == 0) or (i_iteration == max_iter-1):
+            P = u[:,:,None]*K*v[:,None,:]
+            marginal_error = np.sum(np.abs(np.sum(P,axis=1) - b),axis=1)
+            converged = (marginal_error < tol)
+            # Retire converged problems
+            transport_costs[active[converged]] = np.sum(P[converged]*C[converged],axis=(1,2))
+            if np.all(converged):
+                break
+            if i_iteration == max_iter-1:
+                warnings.warn(str(np.sum(~converged))+" Sinkhorn problem(s) did not converge in "+str(max_iter)+" iterations; their transport costs are NaN.")
+                break
+            still_active = ~converged
+            active, C, C_scaled, K = active[still_active], C[still_active], C_scaled[still_active], K[still_active]
+            alpha, beta, u, v = alpha[still_active], beta[still_active], u[still_active], v[still_active]
+            a, b = a[still_active], b[still_active]
+    return transport_costs
+
+def sinkhorn_stabilized_batched(x_source, w_source, Y_sink, w_sink=None, reg=0.01, max_iter=1000, tol=1e-9, chunk_size=None, n_jobs=1):
+    # Coerce Inputs
+    x_source = np.asarray(x_source,dtype=float)
+    ## Atoms: shared (M,dim) or per row (R,M,dim)
+    per_row_source = (x_source.ndim == 3)
+    if not per_row_source:
+        x_source = x_source.reshape(x_source.shape[0],-1)
+    N_source, dim = x_source.shape[-2], x_source.shape[-1]
+    N_rows = Y_sink.shape[0]
+    N_sink = int(np.prod(Y_sink.shape[1:]))//dim
+    w_source = np.asarray(w_source,dtype=float).reshape(-1,N_source)
+    w_sink = np.full((1,N_sink),1/N_sink) if w_sink is None else np.asarray(w_sink,dtype=float).reshape(-1,N_sink)
+    if chunk_size is None:
+        chunk_size = int(max(1,(10**7)//(N_source*N_sink)))
+
+    def solve_chunk(i_start):
+        i_end = min(N_rows,i_start+chunk_size)
+        Y_chunk = np.asarray(Y_sink[i_start:i_end],dtype=float).reshape(i_end-i_start,N_sink,dim)
+        x_chunk = x_source[i_start:i_end] if per_row_source else x_source[np.newaxis]
+        # Stacked (squared-Euclidean) Cost Tensor
+        C = np.sum(x_chunk**2,axis=2)[:,:,np.newaxis] + np.sum(Y_chunk**2,axis=2).reshape(i_end-i_start,1,-1) - 2*np.matmul(x_chunk,Y_chunk.transpose(0,2,1))
+        C = np.maximum(C,0)
+        # Marginals (shared or per row; normalized)
+        a = np.broadcast_to(w_source if w_source.shape[0] == 1 else w_source[i_start:i_end],(i_end-i_start,N_source))
+        b = np.broadcast_to(w_sink if w_sink.shape[0] == 1 else w_sink[i_start:i_end],(i_end-i_start,N_sink))
+        with np.errstate(divide="ignore"):
+            log_a = np.log(a/np.sum(a,axis=1,keepdims=True))
+            log_b = np.log(b/np.sum(b,axis=1,keepdims=True))
+        return sinkhorn_stabilized_solver(C,log_a,log_b,reg=reg,max_iter=max_iter,tol=tol)
+
+    chunk_starts = list(range(0,N_rows,chunk_size))
+    with ThreadPoolExecutor(max_workers=int(max(1,n_jobs))) as solver_pool:
+        transport_costs = list(solver_pool.map(solve_chunk,chunk_starts))
+    return np.concatenate(transport_costs) if len(transport_costs) > 0 else np.zeros(0)
+
+
+# ---
+# # Fin
+# ---
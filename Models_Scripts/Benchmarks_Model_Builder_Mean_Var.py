@@ -14,12 +14,87 @@
 # ---
 
 # ### Gaussian Process Regressor
+# A sparse (inducing-point) Gaussian process; i.e. the "deterministic training conditional" approximation of [Quiñonero-Candela, Joaquin, and Carl Edward Rasmussen. "A unifying view of sparse approximate Gaussian process regression." Journal of Machine Learning Research 6 (2005): 1939-1959](https://www.jmlr.org/papers/v6/quinonero-candela05a.html):
+# - Inducing points: the training inputs nearest to the quantizer's barycenters (at most GPR_N_inducing_points of them; evenly thinned out if there are more),
+# - Hyperparameters: the kernel is cross-validated (as before; over param_grid_GAUSSIAN) by an exact Gaussian process fitted on the inducing points only,
+# - Fit: with Nyström features $\phi(x)=L^{-1}k(Z,x)$ (where $LL^{\top}=K_{ZZ}$), the model is Bayesian linear regression; so only the $m\times m$ matrix $\sum_{i=1}^N \phi(x_i)\phi(x_i)^{\top}$ is accumulated (in chunks of training inputs).  This costs $\mathcal{O}(Nm^2)$ instead of $\mathcal{O}(N^3)$.
+#
+# Predictive means and variances are returned by a single call.  If every training input is an inducing point then the exact Gaussian process is recovered.
 
 # In[5]:
 
 
+# Maximal Number of Inducing Points (Override in main script, before running this script, if desired)
+GPR_N_inducing_points = globals().get("GPR_N_inducing_points",500)
+# Noise variance floor (relative to the kernel's variance); for numerical stability
+GPR_noise_floor = 10**-6
+
+
+# In[ ]:
+
+
+def get_GPR_inducing_indices(N_inducing):
+    # Training inputs nearest to the barycenters
+    inducing_indices = np.unique(np.asarray(Barycenters_index).reshape(-1,))
+    if inducing_indices.shape[0] > N_inducing:
+        inducing_indices = inducing_indices[np.unique(np.linspace(0,inducing_indices.shape[0]-1,N_inducing).astype(int))]
+    return inducing_indices
+
+def fit_sparse_GPR(kernel,X_inducing,X_train_in,y_train_in,noise_variance,chunk_size=None):
+    N_inducing = X_inducing.shape[0]
+    if chunk_size is None:
+        chunk_size = get_metric_chunk_size(N_inducing)
+    y_train_in = np.asarray(y_train_in,dtype=float).reshape(X_train_in.shape[0],-1)
+    # (Jittered) Cholesky root of the inducing points' covariance
+    K_inducing = kernel(X_inducing)
+    K_inducing[np.diag_indices(N_inducing)] += (10**-8)*np.mean(np.diag(K_inducing))
+    L_inducing = np.linalg.cholesky(K_inducing)
+    # Accumulate Nyström features' Gram matrix and their correlation with the targets (in chunks)
+    Features_Gram = np.zeros((N_inducing,N_inducing))
+    Features_targets = np.zeros((N_inducing,y_train_in.shape[1]))
+    for i_start in range(0,X_train_in.shape[0],chunk_size):
+        Features_chunk = solve_triangular(L_inducing,kernel(X_inducing,X_train_in[i_start:(i_start+chunk_size)]),lower=True)
+        Features_Gram += np.matmul(Features_chunk,Features_chunk.T)
+        Features_targets += np.matmul(Features_chunk,y_train_in[i_start:(i_start+chunk_size)])
+    # Posterior of the (Bayesian linear regression) weights
+    Features_Gram[np.diag_indices(N_inducing)] += noise_variance
+    L_posterior = np.linalg.cholesky(Features_Gram)
+    weights = cho_solve((L_posterior,True),Features_targets)
+    return {'kernel':kernel,
+            'X_inducing':X_inducing,
+            'L_inducing':L_inducing,
+            'L_posterior':L_posterior,
+            'weights':weights,
+            'noise_variance':noise_variance}
+
+def predict_sparse_GPR(sparse_GPR,X_in,chunk_size=None):
+    if chunk_size is None:
+        chunk_size = get_metric_chunk_size(sparse_GPR['X_inducing'].shape[0])
+    N_outputs = sparse_GPR['weights'].shape[1]
+    means, variances = np.zeros((X_in.shape[0],N_outputs)), np.zeros(X_in.shape[0])
+    for i_start in range(0,X_in.shape[0],chunk_size):
+        i_end = min(X_in.shape[0],i_start+chunk_size)
+        Features_chunk = solve_triangular(sparse_GPR['L_inducing'],sparse_GPR['kernel'](sparse_GPR['X_inducing'],X_in[i_start:i_end]),lower=True)
+        Posterior_chunk = solve_triangular(sparse_GPR['L_posterior'],Features_chunk,lower=True)
+        means[i_start:i_end] = np.matmul(Features_chunk.T,sparse_GPR['weights'])
+        # Prior variance - Nyström variance + posterior variance of the weights
+        variances[i_start:i_end] = sparse_GPR['kernel'].diag(X_in[i_start:i_end]) - np.sum(Features_chunk**2,axis=0) + sparse_GPR['noise_variance']*np.sum(Posterior_chunk**2,axis=0)
+    variances = np.maximum(variances,0)
+    if N_outputs == 1:
+        return means.reshape(-1,), variances
+    return means, np.repeat(variances.reshape(-1,1),N_outputs,axis=1)
+
+
+# In[ ]:
+
+
 def get_GPR(X_train_in,X_test_in,y_means_in):
-    # Initialize Cross-Vlidator of GPR
+    GPR_train_time = time.time()
+    # Inducing Points
+    inducing_indices = get_GPR_inducing_indices(GPR_N_inducing_points)
+    X_inducing, y_inducing = X_train_in[inducing_indices], np.asarray(y_means_in)[inducing_indices]
+
+    # Initialize Cross-Vlidator of GPR (on the inducing points)
     CV_GPR = RandomizedSearchCV(estimator=GaussianProcessRegressor(),
                                 n_jobs=n_jobs,
                                 cv=KFold(2, random_state=2020, shuffle=True),
@@ -29,23 +104,25 @@ def get_GPR(X_train_in,X_test_in,y_means_in):
                                 random_state=2021,
                                 verbose=10)
 
-    CV_GPR.fit(X_train,Y_train_mean_emp)
+    CV_GPR.fit(X_inducing,y_inducing)
     # Get Best Model
     best_GPR = CV_GPR.best_estimator_
 
+    # Fit Sparse GPR (on the full training set; with the selected kernel)
+    noise_variance = max(best_GPR.alpha,GPR_noise_floor*np.mean(best_GPR.kernel_.diag(X_inducing)))
+    sparse_GPR = fit_sparse_GPR(best_GPR.kernel_,X_inducing,X_train_in,y_means_in,noise_variance)
+    GPR_train_time = time.time() - GPR_train_time
+
     # Get Training-Set Prediction
-    GPR_means = best_GPR.predict(X_train,return_std=True)[0]
-    GPR_vars = (best_GPR.predict(X_train,return_std=True)[1])**2
+    GPR_means, GPR_vars = predict_sparse_GPR(sparse_GPR,X_train_in)
 
     # Get Test-Set Predictions
     GPR_test_time_prediction = time.time()
-    GPR_means_test = best_GPR.predict(X_test,return_std=True)[0]
-    GPR_vars_test = (best_GPR.predict(X_test,return_std=True)[1])**2
+    GPR_means_test, GPR_vars_test = predict_sparse_GPR(sparse_GPR,X_test_in)
     GPR_test_time_prediction = time.time() - GPR_test_time_prediction
-    
+
     # Return Trained Predictions + Model
-    GPR_means_test = best_GPR.predict(X_test,return_std=True)[0]
-    return GPR_means,GPR_vars, GPR_means_test, GPR_vars_test, best_GPR, GPR_test_time_prediction
+    return GPR_means,GPR_vars, GPR_means_test, GPR_vars_test, best_GPR, GPR_test_time_prediction, GPR_train_time
 
 
 # # Universal Gaussian DNN
@@ -310,20 +387,42 @@ if output_dim > 1:
 # In[9]:
 
 
-GRP_time = time.time()
-GPR_means, GPR_vars, GPR_means_test, GPR_vars_test, GPR_trash, GPR_test_time_prediction = get_GPR(X_train,
-                                                                                                  X_test,
-                                                                                                  Y_train_mean_emp) 
-GRP_time = time.time() - GRP_time
+GPR_means, GPR_vars, GPR_means_test, GPR_vars_test, GPR_trash, GPR_test_time_prediction, GPR_train_time = get_GPR(X_train,
+                                                                                                                  X_test,
+                                                                                                                  Y_train_mean_emp)
 
 
 # ### Train Deep Gaussian Network
 
 # #### Infer Parameters to train on *(for training-set)* for deep Gaussian Network
+# The Gaussian maximum-likelihood estimates are in closed-form; so they are read off the cached Monte-Carlo statistics of every row at once:
+# - 1D: the sample mean and the (biased; i.e. maximum-likelihood) standard deviation,
+# - multi-D: the sample mean and the (flattened) Cholesky root of the (maximum-likelihood) sample covariance; all roots are computed with one stacked np.linalg.cholesky call.
+#
+# **Note:** *A jitter is added to the diagonal of the covariances; if some are still not (numerically) positive-definite then their eigenvalues are floored at the jitter before factoring.*
 
 # In[10]:
 
 
+def get_Gaussian_MLE_targets(Y_statistics,jitter=10**-6):
+    Means = np.array(Y_statistics['Mu'],dtype=float)
+    N_rows, dim = Means.shape
+    if dim == 1:
+        return np.concatenate([Means,np.sqrt(np.array(Y_statistics['Var'],dtype=float)).reshape(-1,1)],axis=1)
+    # Regularized Cholesky Square-Root(s) of the Covariance(s)
+    Covariances = np.array(Y_statistics['Covariance'],dtype=float) + jitter*np.eye(dim)
+    try:
+        Cholesky_roots = np.linalg.cholesky(Covariances)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(Covariances)
+        Covariances = np.matmul(eigenvectors*np.maximum(eigenvalues,jitter)[:,np.newaxis,:],np.swapaxes(eigenvectors,1,2))
+        Cholesky_roots = np.linalg.cholesky(Covariances)
+    return np.concatenate([Means,Cholesky_roots.reshape(N_rows,-1)],axis=1)
+
+
+# In[ ]:
+
+
 # Initializations #
 #-----------------#
 print("Infering Parameters for Deep Gaussian Network to train on!")
@@ -332,42 +431,10 @@ timeBuilding_Training_Set_DGN = time.time()
 # Set Gaussian Dimension
 dim_Gaussian_space = output_dim*(1+output_dim)
 
-
-# Get Optimized Parameters to train Deep Gaussian Network On
-for i in tqdm(range(X_train.shape[0])):
-    # Define Function Defining log-likelihood of Gaussian dist.
-    if problem_dim == 1:
-        ## Count Data-set (outputed-samples) size
-        n = Y_train.shape[1]
-        ## Dummy Initialized Parameters
-        initParams = [1, 1]
-        def gaussian_log_like(parameters_in):
-            mean = parameters_in[0]   
-            sigma = parameters_in[1]
-
-            # Calculate negative log likelihood
-            negative_log_likelihood = -np.sum(stats.norm.logpdf(Y_train[i,], loc=mean, scale=sigma))
-            return negative_log_likelihood
-        
-        # Search for MAE Gaussian Parameters
-        results_loop = ((minimize(gaussian_log_like, initParams, method='Nelder-Mead')).x).reshape(1,-1)
-    
-    else:
-        # Get Sample Means
-        mean_loop = np.mean(Y_train[i,],axis=0)
-        # Get (regularized Cholesky) Squareroot of Sample Covariance
-        cov_loop = np.tril(np.linalg.cholesky(np.cov(Y_train[i,].T)+(10**-6)*np.diag(np.ones(output_dim)))).reshape(-1,)
-        
-        # Coercion
-        results_loop = np.append(mean_loop,cov_loop).reshape(-1,dim_Gaussian_space)
-    # Update Targets #
-    #----------------#
-    if i == 0:
-        Y_train_var_emp = results_loop
-    else:
-        Y_train_var_emp = np.append(Y_train_var_emp,results_loop,axis=0)
+# Get (Maximum-Likelihood) Parameters to train Deep Gaussian Network On
+Y_train_var_emp = get_Gaussian_MLE_targets(Monte_Carlo_Statistics_train)
 # Stop timer:
-time.Building_Training_Set_DGN = time.time() - timeBuilding_Training_Set_DGN
+timeBuilding_Training_Set_DGN = time.time() - timeBuilding_Training_Set_DGN
 print("Done Getting Parameters for Deep Gaussian Network!")
 
 
@@ -412,6 +479,21 @@ print("Training Deep Gaussian Network!: END")
 print("====================================")
 
 
+# #### Predicted Law of the Deep Gaussian Network
+# - 1D: the parameters are (mean, standard deviation),
+# - multi-D: the parameters are the mean and the (flattened) Cholesky root of the covariance.
+
+# In[ ]:
+
+
+def get_Deep_Gaussian_law(Deep_Gaussian_parameters):
+    if output_dim == 1:
+        return get_gaussian_law(Deep_Gaussian_parameters[:,0],Deep_Gaussian_parameters[:,1]**2)
+    Cholesky_roots = Deep_Gaussian_parameters[:,output_dim:].reshape(-1,output_dim,output_dim)
+    return get_gaussian_law(Deep_Gaussian_parameters[:,:output_dim],
+                            np.matmul(Cholesky_roots,np.swapaxes(Cholesky_roots,1,2)))
+
+
 # # Get Quality and Prediction Metrics
 # ---
 
@@ -424,109 +506,20 @@ N_Bootstraps = N_Boostraps_BCA
 print("#---------------------------------------#")
 print(" Get Training Errors for: Gaussian Models")
 print("#---------------------------------------#")
-for i in tqdm(range((X_train.shape[0]))):        
-    if output_dim == 1:
-        # Get Samples
-        ## From: Deep Gaussian Network (DGN)
-        hat_mu_DGaussianNet = Deep_Gaussian_train_parameters[i][0]
-        hat_sd_DGaussianNet = np.sqrt(Deep_Gaussian_train_parameters[i][1])
-        sample_DGaussianNet = np.random.normal(hat_mu_DGaussianNet,
-                                               hat_sd_DGaussianNet,
-                                               N_Monte_Carlo_Samples)
-
-        ## From: Gaussian Process Regressor (GPR)
-        hat_mu_GRP = GPR_means[i]
-        hat_sd_GPR = np.sqrt(GPR_vars[i])
-        sample_GRP = np.random.normal(hat_mu_GRP,
-                                      hat_sd_GPR,
-                                      N_Monte_Carlo_Samples)
-
-        # Compute Error(s)
-        ## W1
-        ### DGN
-        W1_loop_DGN = ot.emd2_1d(sample_DGaussianNet,
-                                 np.array(Y_train[i,]).reshape(-1,),
-                                 empirical_weights,
-                                 empirical_weights)
-        ### GPR
-        W1_loop_GPR = ot.emd2_1d(sample_GRP,
-                                 np.array(Y_train[i,]).reshape(-1,),
-                                 empirical_weights,
-                                 empirical_weights)
-        ## M1
-        Mu_MC = np.mean(np.array(Y_train[i,]))
-        if f_unknown_mode == "Heteroskedastic_NonLinear_Regression":
-            Mu = direct_facts[i,]
-        else:
-            Mu = Mu_MC
-        ### Error(s)
-        Mean_loop_DGN = np.sum(np.abs(hat_mu_DGaussianNet-Mu))
-        Mean_loop_GPR = np.sum(np.abs(hat_mu_GRP-Mu_MC))
-    else:
-        ## From: Gaussian Process Regressor (GPR)
-        hat_mu_GRP = GPR_means[i,]
-        hat_sd_GPR = np.sqrt(GPR_vars[i])
-        sample_GRP = np.random.multivariate_normal(hat_mu_GRP,
-                                                   hat_sd_GPR*np.diag(np.ones(output_dim)),
-                                                   N_Monte_Carlo_Samples)
-        ## Get Multivariate Gaussian Process Regressor's Prediction
-        sample_GRP = np.random.multivariate_normal(GPR_means[i,],
-                                                   np.diag(np.repeat(GPR_vars[i],output_dim)),
-                                                   N_Monte_Carlo_Samples)
-        ## Get Multivariate deep Gaussian Network's prediction
-        # Extract Prediction(s)
-        ## Get Mean
-        mean_loop = Deep_Gaussian_train_parameters[0,:output_dim]
-        ## Get Covariance for Predicted Cholesky Root
-        cov_sqrt_chol_loop = Deep_Gaussian_train_parameters[0,output_dim:]
-        cov_sqrt_chol_loop = cov_sqrt_chol_loop.reshape(output_dim,output_dim)
-        cov_sqrt_chol_loop = (np.matmul(cov_sqrt_chol_loop,cov_sqrt_chol_loop.T))
-        ## Get Empirical Samples
-        sample_DGaussianNet = np.random.multivariate_normal(mean_loop,
-                                                            cov_sqrt_chol_loop,
-                                                            N_Monte_Carlo_Samples)
-        
-        ## W1
-        W1_loop_GPR = ot.sliced.sliced_wasserstein_distance(X_s = sample_GRP, 
-                                                            X_t = Y_train[i,],
-                                                            seed = 2020)
-        W1_loop_DGN = ot.sliced.sliced_wasserstein_distance(X_s = sample_DGaussianNet, 
-                                                            X_t = Y_train[i,],
-                                                            seed = 2020)
-        
-        ## M1
-        Mu_MC = np.mean(np.array(Y_train[i,]))
-        Mu = Mu_MC
-        Mean_loop_GPR = np.sum(np.abs(hat_mu_GRP-Mu_MC))
-        Mean_loop_DGN = np.sum(np.abs(cov_sqrt_chol_loop-Mu_MC))
-   
-    
-    # Update
-    if i == 0:
-        W1_Errors_GPR = W1_loop_GPR
-        W1_Errors_DGN = W1_loop_DGN
-        # Moments
-        ## GPR
-        Mean_Errors_GPR =  Mean_loop_GPR
-        ## DGN
-        Mean_Errors_DGN =  Mean_loop_DGN
-        
-        
-    else:
-        W1_Errors_GPR = np.append(W1_Errors_GPR,W1_loop_GPR)
-        W1_Errors_DGN = np.append(W1_Errors_DGN,W1_loop_DGN)
-        # Moments
-        ## GPR
-        Mean_Errors_GPR =  np.append(Mean_Errors_GPR,Mean_loop_GPR)
-        ## DGN
-        Mean_Errors_DGN =  np.append(Mean_Errors_DGN,Mean_loop_DGN)
-        
+# Predicted Gaussian(s)
+GPR_law_train = get_gaussian_law(GPR_means,GPR_vars)
+DGN_law_train = get_Deep_Gaussian_law(Deep_Gaussian_train_parameters)
+# Compute Error(s)
+GPR_errors = get_predictive_errors(GPR_law_train,X_train,Y_train,higher_moments=False,n_projections=50,N_samples=N_Monte_Carlo_Samples,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_train)
+DGN_errors = get_predictive_errors(DGN_law_train,X_train,Y_train,higher_moments=False,n_projections=50,N_samples=N_Monte_Carlo_Samples,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_train)
     
 # Compute Error Metrics with Bootstrapped Confidence Intervals
-W1_Errors_GPR = np.array(bootstrap(np.abs(W1_Errors_GPR),n=N_Bootstraps)(.95))
-W1_Errors_DGN = np.array(bootstrap(np.abs(W1_Errors_DGN),n=N_Bootstraps)(.95))
-M1_Errors_GPR = np.array(bootstrap(np.abs(Mean_Errors_GPR),n=N_Bootstraps)(.95))
-M1_Errors_DGN = np.array(bootstrap(np.abs(Mean_Errors_DGN),n=N_Bootstraps)(.95))
+# (Same resamples for all metrics)
+W1_Errors_GPR, W1_Errors_DGN, M1_Errors_GPR, M1_Errors_DGN = [np.array(ci(.95)) for ci in bootstrap_metrics([np.abs(GPR_errors['W1']),
+                                                                                                            np.abs(DGN_errors['W1']),
+                                                                                                            np.abs(GPR_errors['Mean']),
+                                                                                                            np.abs(DGN_errors['Mean'])],
+                                                                                                           n=N_Bootstraps)]
 
 print("#-------------------------#")
 print(" Get Training Error(s): END")
@@ -542,107 +535,20 @@ N_Bootstraps = N_Boostraps_BCA
 print("#--------------------------------------#")
 print(" Get Testing Errors for: Gaussian Models")
 print("#--------------------------------------#")
-for i in tqdm(range((X_test.shape[0]))):        
-    if output_dim == 1:
-        # Get Samples
-        ## From: Deep Gaussian Network (DGN)
-        hat_mu_DGaussianNet_test = Deep_Gaussian_test_parameters[i,][0]
-        hat_sd_DGaussianNet_test = np.sqrt(Deep_Gaussian_test_parameters[i,][1])
-        sample_DGaussianNet_test = np.random.normal(hat_mu_DGaussianNet_test,
-                                               hat_sd_DGaussianNet_test,
-                                               N_Monte_Carlo_Samples)
-
-        ## From: Gaussian Process Regressor (GPR)
-        hat_mu_GRP_test = GPR_means_test[i]
-        hat_sd_GPR_test = np.sqrt(GPR_vars_test[i])
-        sample_GRP_test = np.random.normal(hat_mu_GRP_test,
-                                      hat_sd_GPR_test,
-                                      N_Monte_Carlo_Samples)
-
-        # Compute Error(s)
-        ## W1
-        ### DGN
-        W1_loop_DGN_test = ot.emd2_1d(sample_DGaussianNet_test,
-                                 np.array(Y_test[i,]).reshape(-1,),
-                                 empirical_weights,
-                                 empirical_weights)
-        ### GPR
-        W1_loop_GPR_test = ot.emd2_1d(sample_GRP_test,
-                                 np.array(Y_test[i,]).reshape(-1,),
-                                 empirical_weights,
-                                 empirical_weights)
-        ## M1
-        Mu_MC_test = np.mean(np.array(Y_test[i,]))
-        if f_unknown_mode == "Heteroskedastic_NonLinear_Regression":
-            Mu_test = direct_facts_test[i,]
-        else:
-            Mu_test = Mu_MC_test
-        ### Error(s)
-        Mean_loop_DGN_test = np.sum(np.abs(hat_mu_DGaussianNet_test-Mu_test))
-        Mean_loop_GPR_test = np.sum(np.abs(hat_mu_GRP_test-Mu_test))
-    else:
-        ## Get Multivariate Gaussian Process Regressor's Prediction
-        hat_mu_GRP_test = GPR_means_test[i,]
-        hat_sd_GPR_test = np.sqrt(GPR_vars_test[i])
-        sample_GRP_test = np.random.multivariate_normal(GPR_means_test[i,],
-                                                   np.diag(np.repeat(GPR_vars_test[i],output_dim)),
-                                                   N_Monte_Carlo_Samples)
-        ## Get Multivariate deep Gaussian Network's prediction
-        # Extract Prediction(s)
-        ## Get Mean
-        mean_loop = Deep_Gaussian_test_parameters[0,:output_dim]
-        ## Get Covariance for Predicted Cholesky Root
-        cov_sqrt_chol_loop = Deep_Gaussian_test_parameters[0,output_dim:]
-        cov_sqrt_chol_loop = cov_sqrt_chol_loop.reshape(output_dim,output_dim)
-        cov_sqrt_chol_loop = (np.matmul(cov_sqrt_chol_loop,cov_sqrt_chol_loop.T))
-        ## Get Empirical Samples
-        sample_DGaussianNet_test = np.random.multivariate_normal(mean_loop,
-                                                                 cov_sqrt_chol_loop,
-                                                                 N_Monte_Carlo_Samples)
-        
-        ## W1
-        W1_loop_GPR_test = ot.sliced.sliced_wasserstein_distance(X_s = sample_GRP_test, 
-                                                                 X_t = Y_test[i,],
-                                                                 seed = 2020)
-        W1_loop_DGN_test = ot.sliced.sliced_wasserstein_distance(X_s = sample_DGaussianNet_test, 
-                                                                 X_t = Y_test[i,],
-                                                                 seed = 2020)
-        
-        ## M1
-        Mu_MC_test = np.mean(np.array(Y_test[i,]))
-        Mu_test = Mu_MC_test
-        Mean_loop_GPR_test = np.sum(np.abs(hat_mu_GRP_test-Mu_MC_test))
-        Mean_loop_DGN_test = np.sum(np.abs(cov_sqrt_chol_loop-Mu_MC_test))
-   
-    
-    # Update
-    if i == 0:
-        W1_Errors_GPR_test = W1_loop_GPR_test
-        W1_Errors_DGN_test = W1_loop_DGN_test
-        # Moments
-        ## GPR
-        Mean_Errors_GPR_test =  Mean_loop_GPR_test
-        ## DGN
-        Mean_Errors_DGN_test =  Mean_loop_DGN_test
-        
-        
-    else:
-        W1_Errors_GPR_test = np.append(W1_Errors_GPR_test,
-                                       W1_loop_GPR_test)
-        W1_Errors_DGN_test = np.append(W1_Errors_DGN_test,
-                                       W1_loop_DGN_test)
-        # Moments
-        ## GPR
-        Mean_Errors_GPR_test =  np.append(Mean_Errors_GPR_test,Mean_loop_GPR_test)
-        ## DGN
-        Mean_Errors_DGN_test =  np.append(Mean_Errors_DGN_test,Mean_loop_DGN_test)
-        
+# Predicted Gaussian(s)
+GPR_law_test = get_gaussian_law(GPR_means_test,GPR_vars_test)
+DGN_law_test = get_Deep_Gaussian_law(Deep_Gaussian_test_parameters)
+# Compute Error(s)
+GPR_errors_test = get_predictive_errors(GPR_law_test,X_test,Y_test,higher_moments=False,n_projections=50,N_samples=N_Monte_Carlo_Samples,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_test)
+DGN_errors_test = get_predictive_errors(DGN_law_test,X_test,Y_test,higher_moments=False,n_projections=50,N_samples=N_Monte_Carlo_Samples,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_test)
     
 # Compute Error Metrics with Bootstrapped Confidence Intervals
-W1_Errors_GPR_test = np.array(bootstrap(np.abs(W1_Errors_GPR_test),n=N_Bootstraps)(.95))
-W1_Errors_DGN_test = np.array(bootstrap(np.abs(W1_Errors_DGN_test),n=N_Bootstraps)(.95))
-M1_Errors_GPR_test = np.array(bootstrap(np.abs(Mean_Errors_GPR_test),n=N_Bootstraps)(.95))
-M1_Errors_DGN_test = np.array(bootstrap(np.abs(Mean_Errors_DGN_test),n=N_Bootstraps)(.95))
+# (Same resamples for all metrics)
+W1_Errors_GPR_test, W1_Errors_DGN_test, M1_Errors_GPR_test, M1_Errors_DGN_test = [np.array(ci(.95)) for ci in bootstrap_metrics([np.abs(GPR_errors_test['W1']),
+                                                                                                                                np.abs(DGN_errors_test['W1']),
+                                                                                                                                np.abs(GPR_errors_test['Mean']),
+                                                                                                                                np.abs(DGN_errors_test['Mean'])],
+                                                                                                                               n=N_Bootstraps)]
 
 print("#-------------------------#")
 print(" Get Testing Error(s): END")
@@ -665,13 +571,13 @@ print("-------------------------------------------------")
 Summary_pred_Qual_models_internal["GPR"] = pd.Series(np.append(np.append(W1_Errors_GPR,
                                                                 M1_Errors_GPR),
                                                          np.array([0,
-                                                                   GRP_time,
+                                                                   GPR_train_time,
                                                                    (GPR_test_time_prediction/Test_Set_PredictionTime_MC)])), index=Summary_pred_Qual_models.index)
 ## Test
 Summary_pred_Qual_models_test["GPR"] = pd.Series(np.append(np.append(W1_Errors_GPR_test,
                                                                 M1_Errors_GPR_test),
                                                          np.array([0,
-                                                                   GRP_time,
+                                                                   GPR_train_time,
                                                                    (GPR_test_time_prediction/Test_Set_PredictionTime_MC)])), index=Summary_pred_Qual_models_test.index)
 # Append Deep Gaussian Network Performance
 Summary_pred_Qual_models_internal["DGN"] = pd.Series(np.append(np.append(W1_Errors_DGN,
@@ -260,6 +260,9 @@ if output_dim == 1:
     ENET_N_Params = X_train.shape[1]*2
     
 else:
+    # Preallocate Prediction(s)
+    ENET_predict = np.zeros([X_train.shape[0],output_dim])
+    ENET_predict_test = np.zeros([X_test.shape[0],output_dim])
     for d in tqdm(range(output_dim)):
         # Fit Elastic Net Model
         ENET_reg.fit(X_train,Y_train_mean_emp[:,d])
@@ -270,14 +273,12 @@ else:
         ENET_predict_loop_test = ENET_reg.predict(X_test)
         ENET_eval_time_loop = time.time() - ENET_eval_time_loop
     
+        ENET_predict[:,d] = ENET_predict_loop.reshape(-1,)
+        ENET_predict_test[:,d] = ENET_predict_loop_test.reshape(-1,)
         if d == 0:
-            ENET_predict = ENET_predict_loop.reshape(-1,1)
-            ENET_predict_test = ENET_predict_loop_test.reshape(-1,1)
             ENET_N_Params = X_train.shape[1]*2
             ENET_eval_time = ENET_eval_time_loop
         else:
-            ENET_predict = np.append(ENET_predict,ENET_predict_loop.reshape(-1,1),axis=1)
-            ENET_predict_test = np.append(ENET_predict_test,ENET_predict_loop_test.reshape(-1,1),axis=1)
             ENET_N_Params = ENET_N_Params + X_train.shape[0]*2
             ENET_eval_time = ENET_eval_time + ENET_eval_time_loop
 
@@ -297,12 +298,16 @@ print("---------------------")
 ENET_errors_W1, ENET_errors_M1 = get_deterministic_errors(X_train,
                                                           ENET_predict,
                                                           Y_train,
-                                                          N_Bootstraps=N_Boostraps_BCA)
+                                                          N_Bootstraps=N_Boostraps_BCA,
+                                                          n_jobs=n_jobs,
+                                                          Oracle_Moments=Oracle_Moments_train)
 ## Test
 ENET_errors_W1_test, ENET_errors_M1_test = get_deterministic_errors(X_test,
                                                                     ENET_predict_test,
                                                                     Y_test,
-                                                                    N_Bootstraps=N_Boostraps_BCA)
+                                                                    N_Bootstraps=N_Boostraps_BCA,
+                                                                    n_jobs=n_jobs,
+                                                                    Oracle_Moments=Oracle_Moments_test)
 # Stop Timer
 Timer_ENET = time.time() - Timer_ENET
 
@@ -369,9 +374,9 @@ Xhat_Kridge, Xhat_Kridge_test , relic, kRidge_N_params, KRidge_eval_time = get_K
 
 
 ## Train
-kRidge_errors_W1, kRidge_errors_M1 = get_deterministic_errors(X_train,Xhat_Kridge,Y_train,N_Bootstraps=N_Boostraps_BCA)
+kRidge_errors_W1, kRidge_errors_M1 = get_deterministic_errors(X_train,Xhat_Kridge,Y_train,N_Bootstraps=N_Boostraps_BCA,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_train)
 ## Test
-kRidge_errors_W1_test, kRidge_errors_M1_test = get_deterministic_errors(X_test,Xhat_Kridge_test,Y_test,N_Bootstraps=N_Boostraps_BCA)
+kRidge_errors_W1_test, kRidge_errors_M1_test = get_deterministic_errors(X_test,Xhat_Kridge_test,Y_test,N_Bootstraps=N_Boostraps_BCA,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_test)
 # Stop Timer
 Timer_kRidge = time.time() - Timer_kRidge
 
@@ -433,18 +438,19 @@ if output_dim == 1:
                                                                                             X_test,
                                                                                             Y_train_mean_emp)
 else:
+    # Preallocate Prediction(s)
+    GBRF_y_hat_train = np.zeros([X_train.shape[0],output_dim])
+    GBRF_y_hat_test = np.zeros([X_test.shape[0],output_dim])
     for d in range(output_dim):
         GBRF_y_hat_train_loop, GBRF_y_hat_test_loop, GBRF_model, GBRF_N_Params_loop, GBRF_eval_time_loop = get_GBRF(X_train,
                                                                                                                 X_test,
                                                                                                                 Y_train_mean_emp[:,d])
+        GBRF_y_hat_train[:,d] = GBRF_y_hat_train_loop.reshape(-1,)
+        GBRF_y_hat_test[:,d] = GBRF_y_hat_test_loop.reshape(-1,)
         if d == 0:
-            GBRF_y_hat_train = GBRF_y_hat_train_loop.reshape(-1,1)
-            GBRF_y_hat_test = GBRF_y_hat_test_loop.reshape(-1,1)
             GBRF_N_Params = GBRF_N_Params_loop
             GBRF_eval_time = GBRF_eval_time_loop
         else:
-            GBRF_y_hat_train = np.append(GBRF_y_hat_train,GBRF_y_hat_train_loop.reshape(-1,1),axis=1)
-            GBRF_y_hat_test = np.append(GBRF_y_hat_test,GBRF_y_hat_test_loop.reshape(-1,1),axis=1)
             GBRF_N_Params = GBRF_N_Params + GBRF_N_Params_loop
             GBRF_eval_time = GBRF_eval_time + GBRF_eval_time_loop
 
@@ -455,9 +461,9 @@ else:
 
 
 ## Train
-GBRF_errors_W1, GBRF_errors_M1 = get_deterministic_errors(X_train,GBRF_y_hat_train,Y_train,N_Bootstraps=N_Boostraps_BCA)
+GBRF_errors_W1, GBRF_errors_M1 = get_deterministic_errors(X_train,GBRF_y_hat_train,Y_train,N_Bootstraps=N_Boostraps_BCA,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_train)
 ## Test
-GBRF_errors_W1_test, GBRF_errors_M1_test = get_deterministic_errors(X_test,GBRF_y_hat_test,Y_test,N_Bootstraps=N_Boostraps_BCA)
+GBRF_errors_W1_test, GBRF_errors_M1_test = get_deterministic_errors(X_test,GBRF_y_hat_test,Y_test,N_Bootstraps=N_Boostraps_BCA,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_test)
 
 
 # Compute Lapsed Time Needed For Training
@@ -534,9 +540,9 @@ YHat_ffNN, YHat_ffNN_test, ffNN_N_Params, ffNN_eval_time = build_ffNN(n_folds =
 
 
 ## Train
-ffNN_errors_W1,ffNN_errors_M1 = get_deterministic_errors(X_train,YHat_ffNN,Y_train,N_Bootstraps=N_Boostraps_BCA)
+ffNN_errors_W1,ffNN_errors_M1 = get_deterministic_errors(X_train,YHat_ffNN,Y_train,N_Bootstraps=N_Boostraps_BCA,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_train)
 ## Test
-ffNN_errors_W1_test,ffNN_errors_M1_test = get_deterministic_errors(X_test,YHat_ffNN_test,Y_test,N_Bootstraps=N_Boostraps_BCA)
+ffNN_errors_W1_test,ffNN_errors_M1_test = get_deterministic_errors(X_test,YHat_ffNN_test,Y_test,N_Bootstraps=N_Boostraps_BCA,n_jobs=n_jobs,Oracle_Moments=Oracle_Moments_test)
 
 # Compute Lapsed Time Needed For Training
 Timer_ffNN =  time.time() - Timer_ffNN
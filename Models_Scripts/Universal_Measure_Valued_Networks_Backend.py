@@ -44,18 +44,29 @@
 
 
 if (f_unknown_mode != 'Rough_SDE') and (f_unknown_mode != 'Rough_SDE_Vanilla'):
-    # Initialize k_means
-    N_Quantizers_to_parameterize = int(np.maximum(2,round(Proportion_per_cluster*X_train.shape[0])))
-    kmeans = KMeans(n_clusters=N_Quantizers_to_parameterize, random_state=0).fit(X_train)
-    # Get Classes
-    Train_classes = np.array(pd.get_dummies(kmeans.labels_))
-    # Get Center Measures
-    Barycenters_Array_x = kmeans.cluster_centers_
+    # Set Number of Quantizers
+    if Quantizer_N_clusters is None:
+        N_Quantizers_to_parameterize = int(np.maximum(2,round(Proportion_per_cluster*X_train.shape[0])))
+    else:
+        N_Quantizers_to_parameterize = int(Quantizer_N_clusters)
+    # Quantize Input Space
+    if Quantizer_mode == "MiniBatchKMeans":
+        quantizer_labels, Barycenters_Array_x = get_streaming_quantization(X_train,
+                                                                           n_clusters=N_Quantizers_to_parameterize,
+                                                                           batch_size=Quantizer_batch_size,
+                                                                           n_passes=Quantizer_N_passes,
+                                                                           random_state=0)
+    else:
+        kmeans = KMeans(n_clusters=N_Quantizers_to_parameterize, random_state=0).fit(X_train)
+        quantizer_labels, Barycenters_Array_x = kmeans.labels_, kmeans.cluster_centers_
+    # Drop Empty Clusters and get Classes (as integer labels; i.e. sparse targets)
+    non_empty_clusters, Train_classes = np.unique(quantizer_labels,return_inverse=True)
+    Barycenters_Array_x = Barycenters_Array_x[non_empty_clusters]
+    N_Quantizers_to_parameterize = Barycenters_Array_x.shape[0]
 else:
     # Mod-2 Partitioning
     Barycenters_index = np.array(range(X_train.shape[0]))[np.array(range(X_train.shape[0]))%2 == 0]
-    Train_classes = np.array([i for i in range(int(X_train.shape[0]/N_Clusters)) for _ in range(N_Clusters)])
-    Train_classes = np.array(pd.get_dummies(Train_classes))
+    Train_classes = np.repeat(np.arange(int(X_train.shape[0]/N_Clusters)),N_Clusters)
 
 
 # ### Get $\{\hat{\mu}_{n=1}^{N}\}$!
@@ -64,19 +75,13 @@ else:
 
 
 if (f_unknown_mode != 'Rough_SDE') and (f_unknown_mode != 'Rough_SDE_Vanilla'):
-    for i in tqdm(range(Barycenters_Array_x.shape[0])):
-        # Identify Nearest Datapoint to a ith Barycenter
-        #------------------------------------------------------------------------------------------------------#
-        ## Get Barycenter "out of sample" in X (NB there is no data-leakage since we know nothing about Y!)
-        Bar_x_loop = Barycenters_Array_x[i,]
-        ## Project Barycenter onto testset
-        distances = np.sum(np.abs(X_train-Bar_x_loop.reshape(-1,)),axis=1)
-
-        # Update Subsetting Index
-        if i == 0:
-            Barycenters_index = np.array(np.argmin(distances))
-        else:
-            Barycenters_index = np.append(Barycenters_index,np.array(np.argmin(distances)))
+    # Identify Nearest Datapoint to each Barycenter
+    #------------------------------------------------------------------------------------------------------#
+    ## Project Barycenters "out of sample" in X onto the training set (NB there is no data-leakage since we know nothing about Y!)
+    Barycenters_index = get_nearest_training_indices(X_train,
+                                                     Barycenters_Array_x,
+                                                     metric="manhattan",
+                                                     unique=Unique_Barycenters)
 
 # Subset Training Set-Outputs
 if (f_unknown_mode != 'Rough_SDE') and (f_unknown_mode != 'Rough_SDE_Vanilla'):
@@ -92,30 +97,11 @@ else:
 # In[35]:
 
 
+# Stack the barycenters' point masses (one block per barycenter)
 if (f_unknown_mode != "Rough_SDE") and (f_unknown_mode != "Rough_SDE_Vanilla"):
-    for i in range(Barycenters_Array.shape[0]):
-        if i == 0:
-            points_of_mass = Barycenters_Array[i,]
-        else:
-
-            points_of_mass = np.append(points_of_mass,Barycenters_Array[i,])
-# Janky way but works
-if (f_unknown_mode == "Rough_SDE") or (f_unknown_mode == "Rough_SDE_Vanilla"):
-    for i in range(Barycenters_Array.shape[0]):
-        if i == 0:
-            points_of_mass = Barycenters_Array[i,:,:]
-        else:
-
-            points_of_mass = np.append(points_of_mass,Barycenters_Array[i,:,:],axis=0)
-
-
-# In[36]:
-
-
-if (f_unknown_mode != "GD_with_randomized_input") and (f_unknown_mode != "Rough_SDE") and (f_unknown_mode != "Extreme_Learning_Machine") and (f_unknown_mode != "Rough_SDE_Vanilla"):
-    # Get Noisless Mean
-    direct_facts = np.apply_along_axis(f_unknown, 1, X_train)
-    direct_facts_test = np.apply_along_axis(f_unknown, 1, X_test)
+    points_of_mass = np.asarray(Barycenters_Array).reshape(-1,)
+else:
+    points_of_mass = np.asarray(Barycenters_Array).reshape((-1,)+Barycenters_Array.shape[2:])
 
 
 # # Train Model
@@ -190,67 +176,6 @@ print("===============================================")
 exec(open('./Helper_Scripts_and_Loading/Evaluation.py').read())
 
 
-# #### Initialize Relevant Solvers
-# Solve using either:
-# - Sinkhorn Regularized Wasserstein Distance of: [Cuturi - Sinkhorn Distances: Lightspeed Computation of Optimal Transport (2016)](https://papers.nips.cc/paper/2013/hash/af21d0c97db2e27e13572cbf59eb343d-Abstract.html)
-# - Slices Wasserstein Distance of: [Bonneel, Nicolas, et al. “Sliced and radon wasserstein barycenters of measures.” Journal of Mathematical Imaging and Vision 51.1 (2015): 22-45](https://dl.acm.org/doi/10.1007/s10851-014-0506-3)
-
-# In[38]:
-
-
-# Transport-problem initializations #
-#-----------------------------------#
-if output_dim != 1:
-    ## Multi-dimensional
-    # Externally Update Empirical Weights for multi-dimensional case
-    empirical_weights = np.full((N_Monte_Carlo_Samples,),1/N_Monte_Carlo_Samples)
-    # Also Initialize
-    Sinkhorn_regularization = 0.1
-else:
-    ## Single-Dimensional
-    # Initialize Empirical Weights
-    empirical_weights = (np.ones(N_Monte_Carlo_Samples)/N_Monte_Carlo_Samples).reshape(-1,)
-
-#-------------------------#
-# Define Transport Solver #
-#-------------------------#
-def transport_dist(x_source,w_source,x_sink,w_sink,output_dim,OT_method="Sliced",n_projections = 10):
-    # Decide which problem to solve (1D or multi-D)?
-    if output_dim == 1:
-        OT_out = ot.emd2_1d(x_source,
-                            x_sink,
-                            w_source,
-                            w_sink)
-    else:
-        # COERCSION
-        ## Update Source Distribution
-        x_source = points_of_mass.reshape(-1,output_dim)
-        ## Update Sink Distribution
-        x_sink = np.array(Y_train[i,]).reshape(-1,output_dim)
-        
-        if OT_method == "Sinkhorn":
-            OT_out = ot.bregman.empirical_sinkhorn2(X_s = x_source, 
-                                                    X_t = x_sink,
-                                                    a = w_source, 
-                                                    b = w_sink, 
-                                                    reg=0.01, 
-                                                    verbose=False,
-                                                    method = "sinkhorn_stabilized")
-            # COERSION
-            OT_out = float(OT_out[0])
-        else:
-            OT_out = ot.sliced.sliced_wasserstein_distance(X_s = x_source, 
-                                                           X_t = x_sink,
-                                                           a = w_source, 
-                                                           b = w_sink, 
-                                                           seed = 2020,
-                                                           n_projections = n_projections)
-            # COERSION
-            OT_out = float(OT_out)
-    # Return (regularized?) Transport Distance
-    return OT_out
-
-
 # #### Compute *Training* Error(s)
 
 # In[39]:
@@ -0,0 +1,44 @@
+# The repository's scripts are exec'd into one shared namespace (see Helper_Scripts_and_Loading/Loader.py);
+# the tests do the same, with only the libraries each script needs.
+import os
+import random
+import sys
+import time
+import types
+import warnings
+
+import numpy as np
+import pytest
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def exec_scripts(namespace, *script_paths):
+    for script_path in script_paths:
+        with open(os.path.join(REPOSITORY_ROOT, script_path)) as script:
+            exec(compile(script.read(), script_path, "exec"), namespace)
+    return namespace
+
+
+@pytest.fixture
+def script_namespace(monkeypatch):
+    # Scripts open each other through paths relative to the repository root
+    monkeypatch.chdir(REPOSITORY_ROOT)
+    created_modules = []
+
+    def new_namespace(**script_globals):
+        # A registered module, so functions defined by the scripts can be pickled (e.g. by process pools)
+        module = types.ModuleType("repository_scripts_"+str(len(created_modules)))
+        sys.modules[module.__name__] = module
+        created_modules.append(module.__name__)
+        module.__dict__.update({"np": np,
+                                "random": random,
+                                "time": time,
+                                "warnings": warnings,
+                                "tqdm": lambda iterable, **kwargs: iterable})
+        module.__dict__.update(script_globals)
+        return module.__dict__
+
+    yield new_namespace
+    for module_name in created_modules:
+        sys.modules.pop(module_name, None)
@@ -0,0 +1,25 @@
+import numpy as np
+
+from conftest import exec_scripts
+
+
+def test_flat_accumulation_matches_np_append(script_namespace):
+    Accumulator = exec_scripts(script_namespace(), "Helper_Scripts_and_Loading/Accumulator.py")["Accumulator"]
+    errors = Accumulator(2)
+    expected = np.zeros(0)
+    for i in range(7):
+        errors.append(np.arange(i))
+        expected = np.append(expected, np.arange(i))
+    np.testing.assert_array_equal(errors.to_array(), expected)
+
+
+def test_row_accumulation_stacks_1D_rows_and_2D_blocks(script_namespace):
+    Accumulator = exec_scripts(script_namespace(), "Helper_Scripts_and_Loading/Accumulator.py")["Accumulator"]
+    rows = Accumulator(3, axis=0)
+    for i in range(5):
+        rows.append(np.full(2, i))
+    np.testing.assert_array_equal(rows.to_array(), np.repeat(np.arange(5), 2).reshape(5, 2))
+    blocks = Accumulator(3, axis=0)
+    for i in range(5):
+        blocks.append(np.full((2, 4), i))
+    assert blocks.to_array().shape == (10, 4)
@@ -0,0 +1,75 @@
+import json
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from conftest import exec_scripts
+
+# Every f_unknown based mode; their noiseless means (direct_facts) are only defined by the simulator
+F_UNKNOWN_MODES = ["Heteroskedastic_NonLinear_Regression", "DNN_with_Random_Weights", "DNN_with_Bayesian_Dropout"]
+BACKEND_GLOBALS = ["X_train", "X_test", "Y_train", "Y_test", "Y_train_mean_emp",
+                   "direct_facts", "direct_facts_test", "output_dim", "N_test_size"]
+
+
+def simulate_or_load(namespace, f_unknown_mode, cache_path, N_Monte_Carlo_Samples=15):
+    namespace.update({"json": json,
+                      "os": os,
+                      "pickle": pickle,
+                      "Path": Path})
+    exec_scripts(namespace,
+                 "Helper_Scripts_and_Loading/Monte_Carlo_Store.py",
+                 "Helper_Scripts_and_Loading/Dataset_Cache.py")
+    namespace.update({"Dataset_Cache_path": str(cache_path)+"/",
+                      "f_unknown_mode": f_unknown_mode,
+                      "problem_dim": 2,
+                      "N_train_size": 12,
+                      "train_test_ratio": 0.25,
+                      "N_Monte_Carlo_Samples": N_Monte_Carlo_Samples,
+                      "delta": 0.01,
+                      "width": 5,
+                      "Depth_Bayesian_DNN": 2,
+                      "Dropout_rate": 0.2})
+    np.random.seed(2021)
+    # Same look-up as the main script
+    exec("Dataset_Cache_Key = get_Dataset_Cache_Key()\n"
+         "Dataset_Cache_Hit = Load_Dataset_Cache(Dataset_Cache_Key)\n"
+         "if not Dataset_Cache_Hit:\n"
+         "    exec(open('./Helper_Scripts_and_Loading/Data_Simulator_and_Parser.py').read())\n"
+         "    Save_Dataset_Cache(Dataset_Cache_Key)\n", namespace)
+    namespace["numpy_random_state_after"] = np.random.get_state()
+    return namespace
+
+
+@pytest.mark.parametrize("f_unknown_mode", F_UNKNOWN_MODES)
+def test_cache_hit_defines_the_same_globals_as_a_cache_miss(script_namespace, tmp_path, f_unknown_mode):
+    miss = simulate_or_load(script_namespace(), f_unknown_mode, tmp_path)
+    hit = simulate_or_load(script_namespace(), f_unknown_mode, tmp_path)
+    assert (not miss["Dataset_Cache_Hit"]) and hit["Dataset_Cache_Hit"]
+    for name in BACKEND_GLOBALS:
+        np.testing.assert_array_equal(np.asarray(miss[name]), np.asarray(hit[name]), err_msg=name)
+    for name in ["Oracle_Moments_train", "Oracle_Moments_test"]:
+        assert (miss[name] is None) == (hit[name] is None) == (f_unknown_mode != "Heteroskedastic_NonLinear_Regression")
+        for moment in ([] if miss[name] is None else miss[name]):
+            np.testing.assert_array_equal(miss[name][moment], hit[name][moment], err_msg=name+" "+moment)
+    np.testing.assert_array_equal(miss["numpy_random_state_after"][1], hit["numpy_random_state_after"][1])
+
+
+def test_heteroskedastic_oracle_moments_match_the_simulated_samples(script_namespace, tmp_path):
+    namespace = simulate_or_load(script_namespace(), "Heteroskedastic_NonLinear_Regression", tmp_path, N_Monte_Carlo_Samples=20000)
+    for split in ["train", "test"]:
+        Y_samples = np.asarray(namespace["Y_"+split])
+        oracle_moments = namespace["Oracle_Moments_"+split]
+        standard_errors = np.sqrt(oracle_moments["Var"]/Y_samples.shape[1])
+        np.testing.assert_array_less(np.abs(Y_samples.mean(axis=1)-oracle_moments["Mu"].reshape(-1,)), 5*standard_errors)
+        np.testing.assert_allclose(Y_samples.var(axis=1), oracle_moments["Var"], rtol=0.15)
+
+
+def test_cache_key_covers_the_scripts_the_simulators_exec(script_namespace):
+    namespace = exec_scripts(script_namespace(os=os, pickle=pickle, Path=Path),
+                             "Helper_Scripts_and_Loading/Dataset_Cache.py")
+    sources = namespace["get_Dataset_Cache_sources"]()
+    assert os.path.normpath("./Fractional_SDE/fBM_Generator.py") in sources
+    assert os.path.normpath("./Fractional_SDE/Parallel_Simulator.py") in sources
@@ -0,0 +1,20 @@
+import numpy as np
+import tensorflow as tf
+from scipy.stats import norm
+
+from conftest import exec_scripts
+
+
+def test_bootstrap_method_survives_a_rerun_of_the_helpers(script_namespace):
+    # As in the main script: the helpers are loaded, the method is overridden, then the backend re-runs the helpers
+    namespace = exec_scripts(script_namespace(tf=tf, norm=norm), "Helper_Scripts_and_Loading/Helper_Functions.py")
+    namespace["Bootstrap_CI_method"] = "BCa"
+    exec_scripts(namespace, "Helper_Scripts_and_Loading/Helper_Functions.py")
+    assert namespace["Bootstrap_CI_method"] == "BCa"
+
+    errors = np.random.RandomState(0).exponential(size=50)
+    np.random.seed(2021)
+    default_interval = namespace["bootstrap_metrics"]([errors], n=200)[0](.95)
+    np.random.seed(2021)
+    BCa_interval = namespace["bootstrap_metrics"]([errors], n=200, method="BCa")[0](.95)
+    np.testing.assert_array_equal(default_interval, BCa_interval)
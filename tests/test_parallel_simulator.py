@@ -0,0 +1,47 @@
+import numpy as np
+import tensorflow as tf
+
+from conftest import exec_scripts
+
+
+def simulate_rough_SDE(namespace, n_jobs):
+    namespace.update({"tf": tf,
+                      "f_unknown_mode": "Rough_SDE",
+                      "problem_dim": 2,
+                      "Hurst_Exponent": 0.3,
+                      "Max_Grid": 1.0,
+                      "delta": 0.1,
+                      "N_Quantizers_to_parameterize": 3,
+                      "Proportion_per_cluster": 0.5,
+                      "N_Monte_Carlo_Samples": 20,
+                      "N_Monte_Carlo_Samples_Test": 20,
+                      "N_Euler_Maruyama_Steps": 12,
+                      "test_size_ratio": 0.2,
+                      "Ratio_fBM_to_typical_vol": 1,
+                      "T_begin": 0,
+                      "T_end": 1,
+                      "n_jobs": n_jobs,
+                      "alpha": lambda t, x: -x,
+                      "beta": lambda t, x: 0.5*np.ones_like(x)})
+    exec_scripts(namespace,
+                 "Helper_Scripts_and_Loading/Monte_Carlo_Store.py",
+                 "Fractional_SDE/fractional_SDE_Simulator.py",
+                 "Fractional_SDE/Data_Simulator_and_Parser___fractional_SDE.py")
+    return namespace
+
+
+def test_rough_SDE_data_does_not_depend_on_n_jobs(script_namespace):
+    serial = simulate_rough_SDE(script_namespace(), n_jobs=1)
+    parallel = simulate_rough_SDE(script_namespace(), n_jobs=2)
+    for name in ["X_train", "X_test", "Y_train", "Y_test", "Barycenters_Array", "Train_classes"]:
+        np.testing.assert_array_equal(np.asarray(serial[name]), np.asarray(parallel[name]), err_msg=name)
+    np.testing.assert_array_equal(serial["t_indices_barycenters_loop"], parallel["t_indices_barycenters_loop"])
+
+
+def test_simulator_leaves_the_global_generator_untouched(script_namespace):
+    namespace = simulate_rough_SDE(script_namespace(), n_jobs=1)
+    state_before = np.random.get_state()
+    namespace["Parallel_Euler_Maruyama_Simulator"](x_0s=np.zeros((2, 2)), N_Euler_Maruyama_Steps=4, N_Monte_Carlo_Samples=5, Hurst=0.3, n_jobs=1)
+    state_after = np.random.get_state()
+    np.testing.assert_array_equal(state_before[1], state_after[1])
+    assert state_before[2] == state_after[2]
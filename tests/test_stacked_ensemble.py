@@ -0,0 +1,22 @@
+import numpy as np
+import tensorflow as tf
+
+from conftest import exec_scripts
+
+
+def build_stacked_layer(namespace, seeds=None):
+    layer = namespace["fullyConnected_Dense_Stacked"](4, N_replicas=3, seeds=seeds)
+    layer(tf.zeros((2, 4)))
+    return layer.w.numpy(), layer.b.numpy()
+
+
+def test_stacked_layer_draws_kernel_and_bias_from_different_seeds(script_namespace):
+    namespace = exec_scripts(script_namespace(tf=tf), "Helper_Scripts_and_Loading/Benchmarks_Model_Builder.py")
+    w, b = build_stacked_layer(namespace)
+    for replica in range(3):
+        assert not np.allclose(b[replica], w[replica, 0, :])
+        assert not np.allclose(w[replica], w[(replica+1) % 3])
+    # Seeded: the same seeds give the same replicas
+    w_again, b_again = build_stacked_layer(namespace)
+    np.testing.assert_array_equal(w, w_again)
+    np.testing.assert_array_equal(b, b_again)
@@ -0,0 +1,29 @@
+import ot
+import numpy as np
+import pytest
+
+from conftest import exec_scripts
+
+
+def get_problems(N_rows=4, N_source=6, N_sink=8, dim=2):
+    random_state = np.random.RandomState(2021)
+    return random_state.normal(size=(N_rows, N_source, dim)), random_state.normal(size=(N_rows, N_sink, dim))
+
+
+def test_stabilized_sinkhorn_matches_POT(script_namespace):
+    namespace = exec_scripts(script_namespace(), "Helper_Scripts_and_Loading/Transport_Kernels.py")
+    x_source, Y_sink = get_problems()
+    w_source = np.full((x_source.shape[0], x_source.shape[1]), 1/x_source.shape[1])
+    transport_costs = namespace["sinkhorn_stabilized_batched"](x_source, w_source, Y_sink, reg=0.1, max_iter=5000)
+    for i in range(x_source.shape[0]):
+        expected = ot.bregman.empirical_sinkhorn2(x_source[i], Y_sink[i], reg=0.1, method="sinkhorn_stabilized", numIterMax=5000, stopThr=1e-12)
+        np.testing.assert_allclose(transport_costs[i], float(np.asarray(expected).reshape(-1)[0]), rtol=1e-5)
+
+
+def test_unconverged_sinkhorn_problems_are_NaN(script_namespace):
+    namespace = exec_scripts(script_namespace(), "Helper_Scripts_and_Loading/Transport_Kernels.py")
+    x_source, Y_sink = get_problems()
+    w_source = np.full((x_source.shape[0], x_source.shape[1]), 1/x_source.shape[1])
+    with pytest.warns(UserWarning, match="did not converge"):
+        transport_costs = namespace["sinkhorn_stabilized_batched"](100*x_source, w_source, 100*Y_sink, reg=0.01, max_iter=20)
+    assert np.all(np.isnan(transport_costs))